@@ -21,7 +21,7 @@ __all__ = [
     "setup_logging", "log_info", "log_error",
     # Ops module
     "require_cmd", "resolve_cmd", "root_or_sudo_available", "get_tool_version",
-    "run_command_with_progress", "ExecutionMetadata", "ProxyConfig",
+    "run_command_with_progress", "ExecutionMetadata", "ProxyConfig", "MsfConsoleSession",
     "write_proxychains_config", "log_tool_execution",
     "log_artifact", "log_artifacts_for_nmap",
     # Parsing module
@@ -44,8 +44,9 @@ __all__ = [
     "page_text", "bulk_extract_cves_for_plugins", "bulk_extract_cves_for_findings",
     "display_bulk_cve_results", "color_unreviewed",
     # FS module
-    "build_results_paths", "mark_review_complete", "undo_review_complete",
-    "default_page_size", "pretty_severity_label", "write_work_files",
+    "build_results_paths", "run_output_base", "mark_review_complete",
+    "undo_review_complete", "default_page_size", "pretty_severity_label", "write_work_files",
+    "work_files_match",
     "display_workflow", "handle_finding_view", "process_single_finding",
     # Tools module
     "build_nmap_cmd", "build_netexec_cmd", "choose_tool", "choose_netexec_protocol",
@@ -66,6 +67,7 @@ __all__ = [
     "Workflow", "WorkflowStep", "WorkflowMapper",
     # Config module
     "CernoConfig", "load_config", "save_config", "get_config_path", "create_example_config",
+    "clear_config_cache",
     # Nessus import module
     "import_nessus_file", "ExportResult",
     # Enums module
@@ -93,7 +95,7 @@ from .constants import (
 from .logging_setup import setup_logging, log_info, log_error
 from .ops import (
     require_cmd, resolve_cmd, root_or_sudo_available, get_tool_version,
-    run_command_with_progress, ExecutionMetadata, ProxyConfig,
+    run_command_with_progress, ExecutionMetadata, ProxyConfig, MsfConsoleSession,
     write_proxychains_config, log_tool_execution, log_artifact, log_artifacts_for_nmap
 )
 from .parsing import (
@@ -123,9 +125,9 @@ from .render import (
     display_bulk_cve_results, color_unreviewed,
 )
 from .fs import (
-    build_results_paths, mark_review_complete, undo_review_complete,
-    default_page_size, pretty_severity_label, write_work_files,
-    display_workflow, handle_finding_view, process_single_finding
+    build_results_paths, run_output_base, mark_review_complete,
+    undo_review_complete, default_page_size, pretty_severity_label, write_work_files,
+    work_files_match, display_workflow, handle_finding_view, process_single_finding
 )
 from .tools import (
     build_nmap_cmd, build_netexec_cmd,
@@ -175,6 +177,7 @@ from .config import (
     save_config,
     get_config_path,
     create_example_config,
+    clear_config_cache,
 )
 from .nessus_import import (
     import_nessus_file,
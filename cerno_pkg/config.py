@@ -6,7 +6,7 @@ Configuration is optional - the application works with defaults if no config fil
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
@@ -100,14 +100,28 @@ def get_config_path() -> Path:
     return config_dir / "config.yaml"
 
 
+# Parsed config keyed by (path, st_mtime_ns, st_size); revalidated with one stat
+_config_cache: Optional[tuple[tuple[str, int, int], CernoConfig]] = None
+
+
+def clear_config_cache() -> None:
+    """Drop the cached parsed config so the next load re-reads the file."""
+    global _config_cache
+    _config_cache = None
+
+
 def load_config() -> CernoConfig:
     """Load user configuration from ~/.cerno/config.yaml.
 
-    Auto-creates config file with defaults if it doesn't exist.
+    Auto-creates config file with defaults if it doesn't exist. The parsed
+    result is cached and reused while the file's mtime and size are
+    unchanged; each call returns a fresh copy so callers may mutate it.
 
     Returns:
         CernoConfig object with user preferences, or default config if file doesn't exist.
     """
+    global _config_cache
+
     config_path = get_config_path()
 
     # Auto-create if doesn't exist
@@ -116,6 +130,30 @@ def load_config() -> CernoConfig:
         create_example_config()
         # Continue to load the newly created file
 
+    try:
+        st = config_path.stat()
+        cache_key: Optional[tuple[str, int, int]] = (str(config_path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        cache_key = None
+
+    if cache_key is not None and _config_cache is not None and _config_cache[0] == cache_key:
+        return replace(_config_cache[1])
+
+    config = _parse_config_file(config_path)
+    if cache_key is not None:
+        _config_cache = (cache_key, config)
+    return replace(config)
+
+
+def _parse_config_file(config_path: Path) -> CernoConfig:
+    """Parse a config YAML file into a CernoConfig.
+
+    Args:
+        config_path: Path to the YAML config file
+
+    Returns:
+        CernoConfig built from the file, or defaults if it is empty or unreadable.
+    """
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f)
@@ -199,6 +237,7 @@ def save_config(config: CernoConfig) -> bool:
 
         with open(config_path, "w", encoding="utf-8") as f:
             yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        clear_config_cache()
 
         # Config saved successfully
         return True
@@ -110,6 +110,12 @@ DEFAULT_TOP_PORTS: int = 5
 SAMPLE_THRESHOLD: int = 5
 """Threshold for triggering host sampling in tool workflows."""
 
+MAX_SUMMARY_FILES: int = 5000
+"""Maximum result files walked for the post-execution summary (shown as "N+")."""
+
+WORKSPACE_SPINNER_MIN_HOSTS: int = 1000
+"""Host count above which workspace preparation shows a progress spinner."""
+
 VISIBLE_GROUPS: int = 5
 """Number of comparison groups to display before pagination."""
 
@@ -118,6 +124,9 @@ VISIBLE_GROUPS: int = 5
 PROCESS_TERMINATE_TIMEOUT: int = 3
 """Timeout in seconds when waiting for subprocess termination."""
 
+MSF_COMMAND_TIMEOUT: int = 300
+"""Timeout in seconds for one msfconsole session command (including startup)."""
+
 
 # ========== Search and parsing configuration ==========
 SEARCH_WINDOW_SIZE: int = 800
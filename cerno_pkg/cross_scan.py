@@ -97,6 +97,26 @@ class HostVulnerabilityHistory:
         return len(self.scans)
 
 
+def _rows_for_scan(rows: list[sqlite3.Row], scan_id: int) -> list[dict]:
+    """Select one scan's rows from a two-scan query, dropping the scan_id column.
+
+    Args:
+        rows: Rows whose first column is ``scan_id``
+        scan_id: Scan to keep
+
+    Returns:
+        Row dicts for that scan, in query order, without ``scan_id``
+    """
+    result = []
+    for row in rows:
+        # Positional access skips sqlite3.Row's per-call column-name lookup
+        if row[0] == scan_id:
+            data = dict(row)
+            del data["scan_id"]
+            result.append(data)
+    return result
+
+
 @log_timing
 def compare_scans(
     scan_id_1: int,
@@ -123,45 +143,35 @@ def compare_scans(
         conn = get_connection()
 
     try:
-        # Get scan metadata
-        scan1 = query_one(
-            conn,
-            "SELECT scan_id, scan_name, created_at FROM scans WHERE scan_id = ?",
-            (scan_id_1,)
-        )
-        scan2 = query_one(
-            conn,
-            "SELECT scan_id, scan_name, created_at FROM scans WHERE scan_id = ?",
-            (scan_id_2,)
-        )
+        # Get scan metadata for both scans in one query
+        scans_by_id = {
+            row["scan_id"]: row
+            for row in query_all(
+                conn,
+                "SELECT scan_id, scan_name, created_at FROM scans WHERE scan_id IN (?, ?)",
+                (scan_id_1, scan_id_2)
+            )
+        }
+        scan1 = scans_by_id.get(scan_id_1)
+        scan2 = scans_by_id.get(scan_id_2)
 
         if not scan1 or not scan2:
             return None
 
-        # Get plugins from each scan using the view
-        scan1_plugins = query_all(
+        # Get plugins from both scans using the view, then split by scan
+        plugin_rows = query_all(
             conn,
             """
-            SELECT plugin_id, plugin_name, severity_int, severity_label,
+            SELECT scan_id, plugin_id, plugin_name, severity_int, severity_label,
                    has_metasploit, cvss3_score, affected_hosts
             FROM v_scan_plugin_summary
-            WHERE scan_id = ? AND severity_int >= ?
+            WHERE scan_id IN (?, ?) AND severity_int >= ?
             ORDER BY severity_int DESC, plugin_name
             """,
-            (scan_id_1, min_severity)
-        )
-
-        scan2_plugins = query_all(
-            conn,
-            """
-            SELECT plugin_id, plugin_name, severity_int, severity_label,
-                   has_metasploit, cvss3_score, affected_hosts
-            FROM v_scan_plugin_summary
-            WHERE scan_id = ? AND severity_int >= ?
-            ORDER BY severity_int DESC, plugin_name
-            """,
-            (scan_id_2, min_severity)
+            (scan_id_1, scan_id_2, min_severity)
         )
+        scan1_plugins = _rows_for_scan(plugin_rows, scan_id_1)
+        scan2_plugins = _rows_for_scan(plugin_rows, scan_id_2)
 
         # Build plugin ID sets for comparison
         scan1_plugin_ids = {row["plugin_id"] for row in scan1_plugins}
@@ -177,7 +187,7 @@ def compare_scans(
         new_by_severity: dict[int, int] = {}
         for row in scan2_plugins:
             if row["plugin_id"] in new_plugin_ids:
-                new_findings.append(dict(row))
+                new_findings.append(row)
                 sev = row["severity_int"]
                 new_by_severity[sev] = new_by_severity.get(sev, 0) + 1
 
@@ -185,7 +195,7 @@ def compare_scans(
         resolved_by_severity: dict[int, int] = {}
         for row in scan1_plugins:
             if row["plugin_id"] in resolved_plugin_ids:
-                resolved_findings.append(dict(row))
+                resolved_findings.append(row)
                 sev = row["severity_int"]
                 resolved_by_severity[sev] = resolved_by_severity.get(sev, 0) + 1
 
@@ -193,36 +203,25 @@ def compare_scans(
         persistent_by_severity: dict[int, int] = {}
         for row in scan2_plugins:
             if row["plugin_id"] in persistent_plugin_ids:
-                persistent_findings.append(dict(row))
+                persistent_findings.append(row)
                 sev = row["severity_int"]
                 persistent_by_severity[sev] = persistent_by_severity.get(sev, 0) + 1
 
-        # Get hosts from each scan
-        scan1_hosts = query_all(
-            conn,
-            """
-            SELECT DISTINCT h.host_id, h.ip_address, h.scan_target
-            FROM hosts h
-            JOIN finding_affected_hosts fah ON h.host_id = fah.host_id
-            JOIN findings f ON fah.finding_id = f.finding_id
-            WHERE f.scan_id = ?
-            ORDER BY h.ip_address
-            """,
-            (scan_id_1,)
-        )
-
-        scan2_hosts = query_all(
+        # Get hosts from both scans in one query, then split by scan
+        host_rows = query_all(
             conn,
             """
-            SELECT DISTINCT h.host_id, h.ip_address, h.scan_target
+            SELECT DISTINCT f.scan_id, h.host_id, h.ip_address, h.scan_target
             FROM hosts h
             JOIN finding_affected_hosts fah ON h.host_id = fah.host_id
             JOIN findings f ON fah.finding_id = f.finding_id
-            WHERE f.scan_id = ?
+            WHERE f.scan_id IN (?, ?)
             ORDER BY h.ip_address
             """,
-            (scan_id_2,)
+            (scan_id_1, scan_id_2)
         )
+        scan1_hosts = _rows_for_scan(host_rows, scan_id_1)
+        scan2_hosts = _rows_for_scan(host_rows, scan_id_2)
 
         # Build host ID sets for comparison
         scan1_host_ids = {row["host_id"] for row in scan1_hosts}
@@ -234,9 +233,9 @@ def compare_scans(
         persistent_host_ids = scan1_host_ids & scan2_host_ids
 
         # Build host lists
-        new_hosts = [dict(row) for row in scan2_hosts if row["host_id"] in new_host_ids]
-        removed_hosts = [dict(row) for row in scan1_hosts if row["host_id"] in removed_host_ids]
-        persistent_hosts = [dict(row) for row in scan2_hosts if row["host_id"] in persistent_host_ids]
+        new_hosts = [row for row in scan2_hosts if row["host_id"] in new_host_ids]
+        removed_hosts = [row for row in scan1_hosts if row["host_id"] in removed_host_ids]
+        persistent_hosts = [row for row in scan2_hosts if row["host_id"] in persistent_host_ids]
 
         return ScanComparisonResult(
             scan1_id=scan_id_1,
@@ -312,23 +311,27 @@ def get_host_vulnerability_history(
             (ip_address,)
         )
 
+        # Get plugin IDs for this host across all scans in one query,
+        # instead of one query per scan in the history
+        plugin_ids_by_scan: dict[int, list[int]] = {}
+        for r in query_all(
+            conn,
+            """
+            SELECT DISTINCT f.scan_id, f.plugin_id
+            FROM findings f
+            JOIN finding_affected_hosts fah ON f.finding_id = fah.finding_id
+            JOIN hosts h ON fah.host_id = h.host_id
+            WHERE h.ip_address = ?
+            ORDER BY f.scan_id, f.plugin_id
+            """,
+            (ip_address,)
+        ):
+            plugin_ids_by_scan.setdefault(r["scan_id"], []).append(r["plugin_id"])
+
         # Build scan snapshots with plugin IDs
         scans = []
         for row in scan_history:
-            # Get plugin IDs for this host in this scan
-            plugin_rows = query_all(
-                conn,
-                """
-                SELECT DISTINCT f.plugin_id
-                FROM findings f
-                JOIN finding_affected_hosts fah ON f.finding_id = fah.finding_id
-                JOIN hosts h ON fah.host_id = h.host_id
-                WHERE f.scan_id = ? AND h.ip_address = ?
-                ORDER BY f.plugin_id
-                """,
-                (row["scan_id"], ip_address)
-            )
-            plugin_ids = [r["plugin_id"] for r in plugin_rows]
+            plugin_ids = plugin_ids_by_scan.get(row["scan_id"], [])
 
             scans.append(ScanSnapshot(
                 scan_id=row["scan_id"],
@@ -120,7 +120,10 @@ CREATE TABLE IF NOT EXISTS finding_affected_hosts (
 );
 
 CREATE INDEX IF NOT EXISTS idx_fah_finding ON finding_affected_hosts(finding_id);
-CREATE INDEX IF NOT EXISTS idx_fah_host ON finding_affected_hosts(host_id);
+-- Covering index for host -> findings lookups (cross-scan host history);
+-- its host_id prefix also serves host_id-only lookups, replacing idx_fah_host
+CREATE INDEX IF NOT EXISTS idx_fah_host_finding ON finding_affected_hosts(host_id, finding_id);
+DROP INDEX IF EXISTS idx_fah_host;
 CREATE INDEX IF NOT EXISTS idx_fah_port ON finding_affected_hosts(port_number);
 
 CREATE TABLE IF NOT EXISTS sessions (
@@ -616,13 +619,9 @@ def compute_file_hash(file_path: Path) -> str:
     Returns:
         Hexadecimal SHA256 hash string
     """
-    sha256 = hashlib.sha256()
-
+    # file_digest reads into a reusable buffer and hashes with the GIL released
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            sha256.update(chunk)
-
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def query_one(
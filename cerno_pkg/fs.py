@@ -117,9 +117,20 @@ def build_results_paths(
     severity_label = pretty_severity_label(sev_dir.name)
     output_dir = get_results_root() / scan_dir.name / severity_label / stem
     output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir, run_output_base(output_dir)
+
+
+def run_output_base(output_dir: Path) -> Path:
+    """Build the timestamped base path for one tool run.
+
+    Args:
+        output_dir: Results directory for the finding
+
+    Returns:
+        Path of the form ``output_dir/run-YYYYmmdd-HHMMSS``
+    """
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    output_base = output_dir / f"run-{timestamp}"
-    return output_dir, output_base
+    return output_dir / f"run-{timestamp}"
 
 
 def pretty_severity_label(name: str) -> str:
@@ -199,16 +210,51 @@ def write_work_files(
     udp_ips = workdir / "udp_ips.list"
     tcp_sockets = workdir / "tcp_host_ports.list"
 
-    tcp_ips.write_text("\n".join(hosts) + "\n", encoding="utf-8")
+    # Encode each list once and hand it to a single write() per file
+    ips_data, sockets_data = _work_file_data(hosts, ports_str)
+    tcp_ips.write_bytes(ips_data)
     if udp:
-        udp_ips.write_text("\n".join(hosts) + "\n", encoding="utf-8")
-    if ports_str:
-        with tcp_sockets.open("w", encoding="utf-8") as f:
-            for host in hosts:
-                f.write(f"{host}:{ports_str}\n")
+        udp_ips.write_bytes(ips_data)
+    if sockets_data is not None:
+        tcp_sockets.write_bytes(sockets_data)
     return tcp_ips, udp_ips, tcp_sockets
 
 
+def work_files_match(
+    workdir: Path, hosts: list[str], ports_str: str, udp: bool
+) -> bool:
+    """Check that work files on disk hold exactly what write_work_files() writes.
+
+    Args:
+        workdir: Working directory holding the files
+        hosts: List of host IPs or hostnames
+        ports_str: Comma-separated port list string
+        udp: Whether the UDP IP list is expected
+
+    Returns:
+        True if every expected file exists with the expected contents
+    """
+    ips_data, sockets_data = _work_file_data(hosts, ports_str)
+    expected = [(workdir / "tcp_ips.list", ips_data)]
+    if udp:
+        expected.append((workdir / "udp_ips.list", ips_data))
+    if sockets_data is not None:
+        expected.append((workdir / "tcp_host_ports.list", sockets_data))
+    try:
+        return all(path.read_bytes() == data for path, data in expected)
+    except OSError:
+        return False
+
+
+def _work_file_data(hosts: list[str], ports_str: str) -> tuple[bytes, Optional[bytes]]:
+    """Encode the IP list and, when ports are given, the host:port list."""
+    ips_data = ("\n".join(hosts) + "\n").encode("utf-8")
+    if not ports_str:
+        return ips_data, None
+    suffix = f":{ports_str}\n"
+    return ips_data, "".join(host + suffix for host in hosts).encode("utf-8")
+
+
 # ===================================================================
 # File/Finding Processing and Viewing (moved from cerno.py)
 # ===================================================================
@@ -16,6 +16,10 @@ from .database import db_transaction, query_all, query_one
 from .logging_setup import log_error, log_info
 
 
+# UPSERT ... RETURNING needs SQLite 3.35+; older libraries use SELECT then INSERT/UPDATE
+_HAS_UPSERT_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
 # ========== Helper Functions ==========
 
 def now_iso() -> str:
@@ -1567,6 +1571,23 @@ class Host:
             host_id of existing or newly created host
         """
         with db_transaction(conn) as c:
+            if _HAS_UPSERT_RETURNING:
+                # Insert, or refresh the existing row, in one statement
+                row = query_one(
+                    c,
+                    """INSERT INTO hosts
+                        (ip_address, scan_target, scan_target_type, netbios_name, fqdn, reverse_dns)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (ip_address, scan_target) DO UPDATE SET
+                        last_seen = CURRENT_TIMESTAMP,
+                        netbios_name = COALESCE(excluded.netbios_name, netbios_name),
+                        fqdn = COALESCE(excluded.fqdn, fqdn),
+                        reverse_dns = COALESCE(excluded.reverse_dns, reverse_dns)
+                    RETURNING host_id""",
+                    (ip_address, scan_target, scan_target_type, netbios_name, fqdn, reverse_dns)
+                )
+                return cast(int, row["host_id"]) if row else 0
+
             # Try to get existing by composite key
             row = query_one(
                 c,
@@ -11,6 +11,7 @@ Each protocol has its own SQLite database (smb.db, ssh.db, ldap.db, etc.).
 from __future__ import annotations
 
 import sqlite3
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional
@@ -21,8 +22,28 @@ if TYPE_CHECKING:
 # Supported protocol databases
 SUPPORTED_PROTOCOLS = ["smb", "ssh", "ldap", "mssql", "rdp", "winrm", "ftp", "nfs", "vnc", "wmi"]
 
+# Host IPs per IN (...) query; stays under SQLite's default 999 bound-variable limit
+IN_CLAUSE_CHUNK_SIZE = 900
 
-@dataclass
+
+def _chunked(items: List[str]) -> List[List[str]]:
+    """Split a list into consecutive chunks of at most IN_CLAUSE_CHUNK_SIZE items."""
+    size = IN_CLAUSE_CHUNK_SIZE
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _pad_in_list(items: List[str], limit: int) -> List[str]:
+    """Pad a non-empty IN (...) list to the next power of two, capped at limit.
+
+    Repeats the last item, which leaves the IN result unchanged, so varying
+    batch sizes map onto a handful of SQL strings that hit sqlite3's
+    statement cache instead of being re-prepared.
+    """
+    target = min(1 << (len(items) - 1).bit_length(), max(limit, len(items)))
+    return items + [items[-1]] * (target - len(items))
+
+
+@dataclass(slots=True)
 class NxcCredential:
     """Credential discovered via NetExec.
 
@@ -41,7 +62,7 @@ class NxcCredential:
     has_admin: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NxcShare:
     """SMB share information.
 
@@ -56,7 +77,7 @@ class NxcShare:
     write_access: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NxcSecurityFlags:
     """SMB security configuration flags.
 
@@ -73,7 +94,7 @@ class NxcSecurityFlags:
     petitpotam_vulnerable: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NxcHostData:
     """Aggregated NetExec data for a single host.
 
@@ -94,7 +115,7 @@ class NxcHostData:
     security_flags: Optional[NxcSecurityFlags] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NxcEnrichmentSummary:
     """Summary of NetExec enrichment data across multiple hosts.
 
@@ -163,6 +184,10 @@ class NxcDatabaseManager:
         """
         available = []
         for protocol in SUPPORTED_PROTOCOLS:
+            # An open cached connection already proves the database exists
+            if protocol in self._connection_cache:
+                available.append(protocol)
+                continue
             db_path = self.workspace_path / f"{protocol}.db"
             if db_path.exists():
                 available.append(protocol)
@@ -189,6 +214,9 @@ class NxcDatabaseManager:
             uri = f"file:{db_path}?mode=ro"
             conn = sqlite3.connect(uri, uri=True, timeout=1.0)
             conn.row_factory = sqlite3.Row
+            # Held for the manager's lifetime; keep a larger page cache warm (~20 MB)
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA cache_size = -20000")
             self._connection_cache[protocol] = conn
             return conn
         except sqlite3.Error:
@@ -203,195 +231,243 @@ class NxcDatabaseManager:
                 pass
         self._connection_cache.clear()
 
-    def _query_smb_host(self, conn: sqlite3.Connection, host_ip: str) -> Optional[NxcHostData]:
-        """Query SMB database for host data.
+    def __enter__(self) -> "NxcDatabaseManager":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _query_smb_hosts(
+        self, conn: sqlite3.Connection, host_ips: List[str]
+    ) -> Dict[str, NxcHostData]:
+        """Query SMB database for several hosts at once.
 
         Args:
             conn: Database connection
-            host_ip: IP address to query
+            host_ips: IP addresses to query
 
         Returns:
-            NxcHostData or None if host not found
+            Dict of IP address -> NxcHostData for hosts found
         """
-        try:
-            # Get host record with security flags
-            cursor = conn.execute(
-                """
-                SELECT id, ip, hostname, domain, os, smbv1, signing, zerologon, petitpotam
-                FROM hosts
-                WHERE ip = ?
-                """,
-                (host_ip,),
-            )
-            host_row = cursor.fetchone()
-            if not host_row:
-                return None
-
-            host_id = host_row["id"]
-            hostname = host_row["hostname"]
-
-            # Build security flags
-            security_flags = NxcSecurityFlags(
-                signing_required=bool(host_row["signing"]) if host_row["signing"] is not None else True,
-                smbv1_enabled=bool(host_row["smbv1"]) if host_row["smbv1"] is not None else False,
-                zerologon_vulnerable=bool(host_row["zerologon"]) if host_row["zerologon"] is not None else False,
-                petitpotam_vulnerable=bool(host_row["petitpotam"]) if host_row["petitpotam"] is not None else False,
-            )
-
-            # Get credentials with admin access
-            credentials = []
-            cursor = conn.execute(
-                """
-                SELECT u.username, u.domain, u.credtype,
-                       CASE WHEN ar.id IS NOT NULL THEN 1 ELSE 0 END as has_admin
-                FROM users u
-                LEFT JOIN admin_relations ar ON ar.userid = u.id AND ar.hostid = ?
-                LEFT JOIN loggedin_relations lr ON lr.userid = u.id AND lr.hostid = ?
-                WHERE ar.id IS NOT NULL OR lr.id IS NOT NULL
-                """,
-                (host_id, host_id),
-            )
-            for row in cursor:
-                credentials.append(
-                    NxcCredential(
-                        protocol="smb",
-                        username=row["username"],
-                        domain=row["domain"],
-                        credential_type=row["credtype"] or "plaintext",
-                        has_admin=bool(row["has_admin"]),
+        results: Dict[str, NxcHostData] = {}
+        for chunk in _chunked(host_ips):
+            chunk = _pad_in_list(chunk, IN_CLAUSE_CHUNK_SIZE)
+            placeholders = ", ".join("?" * len(chunk))
+            try:
+                # Hosts, credentials and shares in one query. Each host row repeats
+                # once per (credential, share) pair, so both are de-duplicated by id.
+                cursor = conn.execute(
+                    f"""
+                    SELECT h.id, h.ip, h.hostname, h.smbv1, h.signing, h.zerologon, h.petitpotam,
+                           u.id AS user_id, u.username, u.domain, u.credtype,
+                           EXISTS (
+                               SELECT 1 FROM admin_relations ar
+                               WHERE ar.userid = u.id AND ar.hostid = h.id
+                           ) AS has_admin,
+                           s.id AS share_id, s.name AS share_name,
+                           s.read AS share_read, s.write AS share_write
+                    FROM hosts h
+                    LEFT JOIN users u ON u.id IN (
+                        SELECT userid FROM admin_relations WHERE hostid = h.id
+                        UNION
+                        SELECT userid FROM loggedin_relations WHERE hostid = h.id
                     )
+                    LEFT JOIN shares s ON s.hostid = h.id
+                    WHERE h.ip IN ({placeholders})
+                    ORDER BY h.id, u.id, s.id
+                    """,
+                    chunk,
                 )
 
-            # Get shares
-            shares = []
-            cursor = conn.execute(
-                """
-                SELECT name, read, write
-                FROM shares
-                WHERE hostid = ?
-                """,
-                (host_id,),
-            )
-            for row in cursor:
-                shares.append(
-                    NxcShare(
-                        name=row["name"],
-                        read_access=bool(row["read"]),
-                        write_access=bool(row["write"]),
-                    )
-                )
+                host_ids: Dict[str, int] = {}
+                credentials: Dict[str, Dict[int, NxcCredential]] = {}
+                shares: Dict[str, Dict[int, NxcShare]] = {}
+                for row in cursor:
+                    host_ip = row["ip"]
+                    if host_ip not in host_ids:
+                        host_ids[host_ip] = row["id"]
+                        credentials[host_ip] = {}
+                        shares[host_ip] = {}
+                        results[host_ip] = NxcHostData(
+                            host_address=host_ip,
+                            hostname=row["hostname"],
+                            protocols_seen=["smb"],
+                            security_flags=NxcSecurityFlags(
+                                signing_required=bool(row["signing"]) if row["signing"] is not None else True,
+                                smbv1_enabled=bool(row["smbv1"]) if row["smbv1"] is not None else False,
+                                zerologon_vulnerable=bool(row["zerologon"]) if row["zerologon"] is not None else False,
+                                petitpotam_vulnerable=bool(row["petitpotam"]) if row["petitpotam"] is not None else False,
+                            ),
+                        )
+                    elif row["id"] != host_ids[host_ip]:
+                        # Duplicate host records for one IP: keep the first
+                        continue
+
+                    host_creds = credentials[host_ip]
+                    if row["user_id"] is not None and row["user_id"] not in host_creds:
+                        host_creds[row["user_id"]] = NxcCredential(
+                            protocol="smb",
+                            username=row["username"],
+                            domain=row["domain"],
+                            credential_type=row["credtype"] or "plaintext",
+                            has_admin=bool(row["has_admin"]),
+                        )
+                    host_shares = shares[host_ip]
+                    if row["share_id"] is not None and row["share_id"] not in host_shares:
+                        host_shares[row["share_id"]] = NxcShare(
+                            name=row["share_name"],
+                            read_access=bool(row["share_read"]),
+                            write_access=bool(row["share_write"]),
+                        )
 
-            return NxcHostData(
-                host_address=host_ip,
-                hostname=hostname,
-                protocols_seen=["smb"],
-                credentials=credentials,
-                shares=shares,
-                security_flags=security_flags,
-            )
+                for host_ip in host_ids:
+                    results[host_ip].credentials = list(credentials[host_ip].values())
+                    results[host_ip].shares = list(shares[host_ip].values())
 
-        except sqlite3.Error:
-            return None
+            except sqlite3.Error:
+                continue
+
+        return results
 
-    def _query_ssh_host(self, conn: sqlite3.Connection, host_ip: str) -> Optional[NxcHostData]:
-        """Query SSH database for host data.
+    def _query_ssh_hosts(
+        self, conn: sqlite3.Connection, host_ips: List[str]
+    ) -> Dict[str, NxcHostData]:
+        """Query SSH database for several hosts at once.
 
         Args:
             conn: Database connection
-            host_ip: IP address to query
+            host_ips: IP addresses to query
 
         Returns:
-            NxcHostData or None if host not found
+            Dict of IP address -> NxcHostData for hosts with credentials
         """
-        try:
-            # SSH uses 'host' column instead of 'ip'
-            cursor = conn.execute(
-                """
-                SELECT id, host, hostname
-                FROM hosts
-                WHERE host = ?
-                """,
-                (host_ip,),
-            )
-            host_row = cursor.fetchone()
-            if not host_row:
-                return None
+        results: Dict[str, NxcHostData] = {}
+        for chunk in _chunked(host_ips):
+            chunk = _pad_in_list(chunk, IN_CLAUSE_CHUNK_SIZE)
+            placeholders = ", ".join("?" * len(chunk))
+            try:
+                # SSH uses 'host' column instead of 'ip'
+                cursor = conn.execute(
+                    f"""
+                    SELECT h.id, h.host, h.hostname,
+                           c.id AS cred_id, c.username, c.credtype,
+                           EXISTS (
+                               SELECT 1 FROM admin_relations ar
+                               WHERE ar.credid = c.id AND ar.hostid = h.id
+                           ) AS has_admin
+                    FROM hosts h
+                    LEFT JOIN credentials c ON c.id IN (
+                        SELECT credid FROM admin_relations WHERE hostid = h.id
+                        UNION
+                        SELECT credid FROM loggedin_relations WHERE hostid = h.id
+                    )
+                    WHERE h.host IN ({placeholders})
+                    ORDER BY h.id, c.id
+                    """,
+                    chunk,
+                )
 
-            host_id = host_row["id"]
-            # SSH may not have hostname column in all versions
-            hostname = host_row["hostname"] if "hostname" in host_row.keys() else None
+                host_ids: Dict[str, int] = {}
+                hostnames: Dict[str, Optional[str]] = {}
+                credentials: Dict[str, Dict[int, NxcCredential]] = {}
+                for row in cursor:
+                    host_ip = row["host"]
+                    if host_ip not in host_ids:
+                        host_ids[host_ip] = row["id"]
+                        hostnames[host_ip] = row["hostname"]
+                        credentials[host_ip] = {}
+                    elif row["id"] != host_ids[host_ip]:
+                        # Duplicate host records for one IP: keep the first
+                        continue
+
+                    host_creds = credentials[host_ip]
+                    if row["cred_id"] is not None and row["cred_id"] not in host_creds:
+                        host_creds[row["cred_id"]] = NxcCredential(
+                            protocol="ssh",
+                            username=row["username"],
+                            domain=None,
+                            credential_type=row["credtype"] or "plaintext",
+                            has_admin=bool(row["has_admin"]),
+                        )
 
-            # Get credentials
-            credentials = []
-            cursor = conn.execute(
-                """
-                SELECT c.username, c.credtype,
-                       CASE WHEN ar.id IS NOT NULL THEN 1 ELSE 0 END as has_admin
-                FROM credentials c
-                LEFT JOIN admin_relations ar ON ar.credid = c.id AND ar.hostid = ?
-                LEFT JOIN loggedin_relations lr ON lr.credid = c.id AND lr.hostid = ?
-                WHERE ar.id IS NOT NULL OR lr.id IS NOT NULL
-                """,
-                (host_id, host_id),
-            )
-            for row in cursor:
-                credentials.append(
-                    NxcCredential(
-                        protocol="ssh",
-                        username=row["username"],
-                        domain=None,
-                        credential_type=row["credtype"] or "plaintext",
-                        has_admin=bool(row["has_admin"]),
+                for host_ip, host_creds in credentials.items():
+                    if not host_creds:
+                        continue
+                    results[host_ip] = NxcHostData(
+                        host_address=host_ip,
+                        hostname=hostnames[host_ip],
+                        protocols_seen=["ssh"],
+                        credentials=list(host_creds.values()),
+                        shares=[],
+                        security_flags=None,
                     )
-                )
 
-            if not credentials:
-                return None
+            except sqlite3.Error:
+                continue
 
-            return NxcHostData(
-                host_address=host_ip,
-                hostname=hostname,
-                protocols_seen=["ssh"],
-                credentials=credentials,
-                shares=[],
-                security_flags=None,
-            )
+        return results
 
-        except sqlite3.Error:
-            return None
+    def _find_generic_hosts(
+        self, conn: sqlite3.Connection, host_ips: List[str]
+    ) -> Dict[str, tuple[int, Optional[str]]]:
+        """Look up host records in a generic protocol database in batches.
+
+        Args:
+            conn: Database connection
+            host_ips: IP addresses to look up
+
+        Returns:
+            Dict of IP address -> (host id, hostname) for hosts found
+        """
+        found: Dict[str, tuple[int, Optional[str]]] = {}
+        wanted = set(host_ips)
+        # Each IP is bound twice (ip and host columns)
+        chunk_size = max(1, IN_CLAUSE_CHUNK_SIZE // 2)
+        for start in range(0, len(host_ips), chunk_size):
+            chunk = _pad_in_list(host_ips[start:start + chunk_size], chunk_size)
+            placeholders = ", ".join("?" * len(chunk))
+            try:
+                # Try 'ip' column first, then 'host'
+                cursor = conn.execute(
+                    f"""
+                    SELECT id, ip, host, hostname
+                    FROM hosts
+                    WHERE ip IN ({placeholders}) OR host IN ({placeholders})
+                    ORDER BY id
+                    """,
+                    chunk + chunk,
+                )
+                for row in cursor:
+                    host_ip = row["ip"] if row["ip"] in wanted else row["host"]
+                    if host_ip not in found:
+                        found[host_ip] = (row["id"], row["hostname"])
+            except sqlite3.Error:
+                continue
+        return found
 
     def _query_generic_host(
-        self, conn: sqlite3.Connection, host_ip: str, protocol: str
+        self,
+        conn: sqlite3.Connection,
+        host_ip: str,
+        protocol: str,
+        host_id: int,
+        hostname: Optional[str],
     ) -> Optional[NxcHostData]:
-        """Query a generic protocol database for host data.
+        """Query a generic protocol database for a known host's credentials.
 
         Works for protocols with standard schema (ldap, mssql, winrm, rdp, etc.)
 
         Args:
             conn: Database connection
-            host_ip: IP address to query
+            host_ip: IP address of the host
             protocol: Protocol name
+            host_id: Host record id from _find_generic_hosts()
+            hostname: Hostname from the host record
 
         Returns:
-            NxcHostData or None if host not found
+            NxcHostData or None if no credentials are linked to the host
         """
         try:
-            # Try 'ip' column first, then 'host'
-            cursor = conn.execute(
-                """
-                SELECT id, COALESCE(ip, host) as ip, hostname
-                FROM hosts
-                WHERE ip = ? OR host = ?
-                """,
-                (host_ip, host_ip),
-            )
-            host_row = cursor.fetchone()
-            if not host_row:
-                return None
-
-            host_id = host_row["id"]
-            hostname = host_row["hostname"] if "hostname" in host_row.keys() else None
-
             # Try to get credentials - different protocols use different schemas
             credentials = []
 
@@ -399,23 +475,30 @@ class NxcDatabaseManager:
             try:
                 cursor = conn.execute(
                     """
-                    SELECT u.username, u.domain, u.credtype,
-                           CASE WHEN ar.id IS NOT NULL THEN 1 ELSE 0 END as has_admin
+                    SELECT u.username, u.domain,
+                           COALESCE(NULLIF(u.credtype, ''), 'plaintext'),
+                           EXISTS (
+                               SELECT 1 FROM admin_relations ar
+                               WHERE ar.userid = u.id AND ar.hostid = ?
+                           ) AS has_admin
                     FROM users u
-                    LEFT JOIN admin_relations ar ON ar.userid = u.id AND ar.hostid = ?
-                    LEFT JOIN loggedin_relations lr ON lr.userid = u.id AND lr.hostid = ?
-                    WHERE ar.id IS NOT NULL OR lr.id IS NOT NULL
+                    WHERE u.id IN (
+                        SELECT userid FROM admin_relations WHERE hostid = ?
+                        UNION
+                        SELECT userid FROM loggedin_relations WHERE hostid = ?
+                    )
+                    ORDER BY u.id
                     """,
-                    (host_id, host_id),
+                    (host_id, host_id, host_id),
                 )
-                for row in cursor:
+                for username, domain, credtype, has_admin in cursor:
                     credentials.append(
                         NxcCredential(
                             protocol=protocol,
-                            username=row["username"],
-                            domain=row["domain"] if "domain" in row.keys() else None,
-                            credential_type=row["credtype"] or "plaintext" if "credtype" in row.keys() else "plaintext",
-                            has_admin=bool(row["has_admin"]),
+                            username=username,
+                            domain=domain,
+                            credential_type=credtype,
+                            has_admin=bool(has_admin),
                         )
                     )
             except sqlite3.Error:
@@ -461,19 +544,29 @@ class NxcDatabaseManager:
         except sqlite3.Error:
             return None
 
-    def get_host_enrichment(self, host_ip: str) -> Optional[NxcHostData]:
-        """Get aggregated NetExec data for a single host.
+    def get_hosts_data(self, host_ips: List[str]) -> Dict[str, NxcHostData]:
+        """Get aggregated NetExec data for several hosts.
 
-        Queries all available protocol databases and merges results.
+        Host records are looked up once per chunk of hosts with an
+        ``IN (...)`` clause. SMB and SSH fetch credentials and shares in the
+        same query; other protocols then query credentials per found host.
 
         Args:
-            host_ip: IP address to query
+            host_ips: IP addresses to query
 
         Returns:
-            NxcHostData with merged data from all protocols, or None if no data
+            Dict of IP address -> NxcHostData merged across protocols,
+            containing only hosts with data
         """
-        merged_data: Optional[NxcHostData] = None
-
+        unique_ips = list(dict.fromkeys(host_ips))
+        merged: Dict[str, NxcHostData] = {}
+        if not unique_ips:
+            return merged
+
+        # Protocol databases are queried on their own connections rather than
+        # ATTACHed and UNIONed: their host/credential schemas differ, SQLite
+        # allows only 10 attached databases by default, and each database is
+        # already a single batched query per chunk.
         for protocol in self.get_available_protocols():
             conn = self._get_connection(protocol)
             if not conn:
@@ -481,15 +574,21 @@ class NxcDatabaseManager:
 
             # Query based on protocol
             if protocol == "smb":
-                data = self._query_smb_host(conn, host_ip)
+                found = self._query_smb_hosts(conn, unique_ips)
             elif protocol == "ssh":
-                data = self._query_ssh_host(conn, host_ip)
+                found = self._query_ssh_hosts(conn, unique_ips)
             else:
-                data = self._query_generic_host(conn, host_ip, protocol)
-
-            if data:
+                found = {}
+                hosts = self._find_generic_hosts(conn, unique_ips)
+                for host_ip, (host_id, hostname) in hosts.items():
+                    data = self._query_generic_host(conn, host_ip, protocol, host_id, hostname)
+                    if data:
+                        found[host_ip] = data
+
+            for host_ip, data in found.items():
+                merged_data = merged.get(host_ip)
                 if merged_data is None:
-                    merged_data = data
+                    merged[host_ip] = data
                 else:
                     # Merge protocols, credentials, shares
                     merged_data.protocols_seen.extend(data.protocols_seen)
@@ -500,7 +599,20 @@ class NxcDatabaseManager:
                     if data.hostname and not merged_data.hostname:
                         merged_data.hostname = data.hostname
 
-        return merged_data
+        return merged
+
+    def get_host_enrichment(self, host_ip: str) -> Optional[NxcHostData]:
+        """Get aggregated NetExec data for a single host.
+
+        Queries all available protocol databases and merges results.
+
+        Args:
+            host_ip: IP address to query
+
+        Returns:
+            NxcHostData with merged data from all protocols, or None if no data
+        """
+        return self.get_hosts_data([host_ip]).get(host_ip)
 
     def get_hosts_enrichment(self, host_ips: List[str]) -> NxcEnrichmentSummary:
         """Get enrichment summary for multiple hosts.
@@ -514,7 +626,9 @@ class NxcDatabaseManager:
         per_host_data: Dict[str, NxcHostData] = {}
         all_protocols: set[str] = set()
         credential_counts: Dict[tuple[str, str, Optional[str], str], int] = {}  # (proto, user, domain, type) -> count
-        shares_summary: Dict[str, tuple[int, int]] = {}  # name -> (read_count, write_count)
+        admin_identities: set[tuple[str, str, Optional[str]]] = set()  # (proto, user, domain) with admin anywhere
+        share_reads: Counter[str] = Counter()  # name -> hosts with read access
+        share_writes: Counter[str] = Counter()  # name -> hosts with write access
         security_flag_counts: Dict[str, int] = {
             "signing_disabled": 0,
             "smbv1_enabled": 0,
@@ -522,8 +636,13 @@ class NxcDatabaseManager:
             "petitpotam": 0,
         }
 
+        # Tallies stay in Python: per_host_data is materialized for the detail
+        # view anyway, and counts must follow the merged cross-protocol records
+        # (duplicate IPs, first-host-id wins), which a separate GROUP BY per
+        # database would have to re-derive with extra queries.
+        hosts_data = self.get_hosts_data(host_ips)
         for host_ip in host_ips:
-            data = self.get_host_enrichment(host_ip)
+            data = hosts_data.get(host_ip)
             if data:
                 per_host_data[host_ip] = data
                 all_protocols.update(data.protocols_seen)
@@ -532,15 +651,13 @@ class NxcDatabaseManager:
                 for cred in data.credentials:
                     key = (cred.protocol, cred.username, cred.domain, cred.credential_type)
                     credential_counts[key] = credential_counts.get(key, 0) + 1
+                    if cred.has_admin:
+                        admin_identities.add((cred.protocol, cred.username, cred.domain))
 
                 # Aggregate shares
                 for share in data.shares:
-                    read_count, write_count = shares_summary.get(share.name, (0, 0))
-                    if share.read_access:
-                        read_count += 1
-                    if share.write_access:
-                        write_count += 1
-                    shares_summary[share.name] = (read_count, write_count)
+                    share_reads[share.name] += share.read_access
+                    share_writes[share.name] += share.write_access
 
                 # Count security flags
                 if data.security_flags:
@@ -556,13 +673,8 @@ class NxcDatabaseManager:
         # Build unique credentials with counts
         unique_credentials: List[tuple[NxcCredential, int]] = []
         for (proto, user, domain, cred_type), count in credential_counts.items():
-            # Determine if any instance has admin
-            has_admin = any(
-                cred.has_admin
-                for data in per_host_data.values()
-                for cred in data.credentials
-                if cred.protocol == proto and cred.username == user and cred.domain == domain
-            )
+            # Admin on any host for this identity, regardless of credential type
+            has_admin = (proto, user, domain) in admin_identities
             unique_credentials.append(
                 (
                     NxcCredential(
@@ -579,6 +691,9 @@ class NxcDatabaseManager:
         # Sort by host count descending
         unique_credentials.sort(key=lambda x: x[1], reverse=True)
 
+        # name -> (read_count, write_count), in first-seen order
+        shares_summary = {name: (reads, share_writes[name]) for name, reads in share_reads.items()}
+
         # Remove zero counts from security flags
         security_flag_counts = {k: v for k, v in security_flag_counts.items() if v > 0}
 
@@ -8,16 +8,19 @@ and privileges.
 from __future__ import annotations
 
 import os
+import queue
 import re
 import shlex
 import shutil
 import sqlite3
 import subprocess
 import sys
+import threading
 import time
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import IO, Callable, Optional
 
 from rich.progress import (
     Progress,
@@ -27,12 +30,15 @@ from rich.progress import (
 )
 
 from .ansi import C, err, get_console
-from .constants import PROCESS_TERMINATE_TIMEOUT
+from .constants import MSF_COMMAND_TIMEOUT, PROCESS_TERMINATE_TIMEOUT
 from .logging_setup import log_error, log_info, log_timing
 
 
 _console_global = get_console()
 
+# "Nmap version 7.92" / "version 1.2.1" / "v3.14" -> captures up to three version parts
+_VERSION_RE = re.compile(r"(?:version\s+)?(\d+\.\d+(?:\.\d+)?)", re.IGNORECASE)
+
 
 @dataclass
 class ExecutionMetadata:
@@ -253,6 +259,192 @@ def run_command_with_progress(
     )
 
 
+class MsfConsoleSession:
+    """Long-lived msfconsole process for running several commands.
+
+    msfconsole takes several seconds to start. Starting it once with stdin
+    piped and sending each ``search``/``info`` command to the same process
+    means only the first command pays that cost.
+
+    Completion is detected by following each command with an ``echo`` of a
+    unique sentinel (msfconsole runs unknown commands as system commands)
+    and reading output until the sentinel line appears. Output is read on a
+    background thread so a command that never completes is killed after
+    ``timeout`` seconds instead of blocking the caller.
+
+    Example:
+        >>> with MsfConsoleSession(proxy_config) as msf:
+        ...     msf.run("search ms17_010")
+        ...     msf.run("search CVE-2017-0144")
+    """
+
+    def __init__(
+        self,
+        proxy_config: Optional[ProxyConfig] = None,
+        executable: str = "msfconsole",
+        timeout: float = MSF_COMMAND_TIMEOUT,
+    ) -> None:
+        """Configure the session; the process is started lazily by run().
+
+        Args:
+            proxy_config: Optional proxy configuration. When enabled, msfconsole
+                is launched through proxychains4.
+            executable: msfconsole binary name or path
+            timeout: Seconds to wait for each command (including msfconsole
+                startup) before killing the process
+        """
+        self._proxy_config = proxy_config
+        self._executable = executable
+        self._timeout = timeout
+        self._proc: Optional[subprocess.Popen[str]] = None
+        self._lines: queue.Queue[Optional[str]] = queue.Queue()
+        self._sentinel = f"CERNO_MSF_DONE_{uuid.uuid4().hex}"
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the msfconsole process is alive."""
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self) -> subprocess.Popen[str]:
+        """Launch msfconsole with piped stdin/stdout."""
+        cmd = [self._executable, "-q"]
+        if self._proxy_config is not None and self._proxy_config.enabled:
+            pc4_conf = Path.home() / ".cerno" / "proxychains4.conf"
+            write_proxychains_config(self._proxy_config, pc4_conf)
+            cmd = ["proxychains4", "-f", str(pc4_conf)] + cmd
+        log_info(f"Starting persistent session: {' '.join(cmd)}")
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        # Fresh queue per process so lines from a killed one are never read
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump, args=(proc.stdout, self._lines), daemon=True
+        ).start()
+        return proc
+
+    @staticmethod
+    def _pump(stream: IO[str], lines: queue.Queue[Optional[str]]) -> None:
+        """Forward output lines to the queue; None marks end of output."""
+        try:
+            for line in iter(stream.readline, ""):
+                lines.put(line)
+        except (OSError, ValueError):
+            pass  # Stream closed by kill()
+        finally:
+            lines.put(None)
+
+    def run(self, command: str) -> ExecutionMetadata:
+        """Send one command to msfconsole and stream its output.
+
+        Args:
+            command: msfconsole command (e.g., "search ms17_010")
+
+        Returns:
+            ExecutionMetadata for the command (exit code 0 on completion)
+
+        Raises:
+            OSError: If msfconsole (or proxychains4) cannot be started
+            subprocess.CalledProcessError: If msfconsole exits before the
+                command completes
+            subprocess.TimeoutExpired: If the command does not complete
+                within the session timeout; the process is killed
+            KeyboardInterrupt: If user interrupts; the session is closed
+        """
+        start_time = time.time()
+        if not self.is_running:
+            self._proc = self._start()
+        proc = self._proc
+        assert proc is not None and proc.stdin is not None
+
+        log_info(f"Executing (msfconsole session): {command}")
+        deadline = time.monotonic() + self._timeout
+        completed = False
+        timed_out = False
+        try:
+            proc.stdin.write(f"{command}\necho {self._sentinel}\n")
+            proc.stdin.flush()
+
+            with Progress(
+                SpinnerColumn(style="cyan"),
+                TextColumn("[progress.description]{task.description}"),
+                TimeElapsedColumn(),
+                console=_console_global,
+                transient=True,
+            ) as progress:
+                progress.add_task(f"Running: {command}", start=True)
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        break
+                    # Short waits keep Ctrl+C responsive on every platform
+                    try:
+                        line = self._lines.get(timeout=min(remaining, 0.25))
+                    except queue.Empty:
+                        continue
+                    if line is None:
+                        break
+                    if self._sentinel in line:
+                        # Skip msfconsole's "[*] exec: echo <sentinel>" line too
+                        if line.strip() == self._sentinel:
+                            completed = True
+                            break
+                        continue
+                    print(line, end="")
+                    progress.refresh()
+        except KeyboardInterrupt:
+            self.close()
+            raise
+        except BrokenPipeError:
+            completed = False
+
+        if timed_out:
+            self._proc = None
+            proc.kill()
+            proc.wait()
+            log_error(f"msfconsole session timed out after {self._timeout}s: {command}")
+            raise subprocess.TimeoutExpired(command, self._timeout)
+
+        if not completed:
+            return_code = proc.wait()
+            self._proc = None
+            log_error(f"msfconsole session ended early with rc={return_code}")
+            raise subprocess.CalledProcessError(return_code or 1, command)
+
+        return ExecutionMetadata(
+            exit_code=0,
+            duration_seconds=time.time() - start_time,
+            used_sudo=False,
+        )
+
+    def close(self) -> None:
+        """Exit msfconsole, killing it if it does not stop in time."""
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            if proc.poll() is None and proc.stdin is not None:
+                proc.stdin.write("exit\n")
+                proc.stdin.flush()
+            proc.wait(timeout=PROCESS_TERMINATE_TIMEOUT)
+        except (BrokenPipeError, OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def __enter__(self) -> "MsfConsoleSession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
 @log_timing
 def root_or_sudo_available() -> bool:
     """Check if running as root or if sudo is available.
@@ -349,7 +541,7 @@ def get_tool_version(tool_name: str, candidates: Optional[list[str]] = None) ->
 
             # Parse version from output using regex patterns
             # Pattern 1: "Nmap version 7.92" or "version 1.2.1"
-            match = re.search(r"(?:version\s+)?(\d+\.\d+(?:\.\d+)?)", output, re.IGNORECASE)
+            match = _VERSION_RE.search(output)
             if match:
                 version = match.group(1)
                 log_debug(f"Detected {binary} version: {version}")
@@ -602,22 +794,55 @@ def log_artifacts_for_nmap(
     Returns:
         List of artifact IDs created
     """
-    artifact_ids = []
-
     # Check for standard nmap output formats
     output_formats = [
         (".xml", "nmap_xml"),
         (".nmap", "nmap_nmap"),
         (".gnmap", "nmap_gnmap"),
     ]
-
+    existing: list[tuple[Path, str]] = []
     for ext, artifact_type in output_formats:
         artifact_path = Path(str(oabase) + ext)
         if artifact_path.exists():
-            artifact_id = log_artifact(execution_id, artifact_path, artifact_type, metadata, conn=conn)
-            if artifact_id:
-                artifact_ids.append(artifact_id)
+            existing.append((artifact_path, artifact_type))
+    if not existing:
+        return []
+
+    if conn is not None:
+        return _log_artifact_batch(conn, execution_id, existing, metadata)
+
+    # Production path: one connection for all output formats
+    try:
+        from .database import db_transaction
+        with db_transaction() as new_conn:
+            return _log_artifact_batch(new_conn, execution_id, existing, metadata)
+    except Exception as e:
+        log_error(f"Failed to log artifacts to database: {e}")
+        return []
 
+
+def _log_artifact_batch(
+    conn: sqlite3.Connection,
+    execution_id: int,
+    artifacts: list[tuple[Path, str]],
+    metadata: Optional[dict],
+) -> list[int]:
+    """Log several artifacts on one connection.
+
+    Args:
+        conn: Database connection
+        execution_id: Tool execution ID
+        artifacts: (artifact_path, artifact_type) pairs
+        metadata: Optional metadata
+
+    Returns:
+        List of artifact IDs created
+    """
+    artifact_ids = []
+    for artifact_path, artifact_type in artifacts:
+        artifact_id = _log_artifact_impl(conn, execution_id, artifact_path, artifact_type, metadata)
+        if artifact_id:
+            artifact_ids.append(artifact_id)
     return artifact_ids
 
 
@@ -7,27 +7,59 @@ various security tools including nmap, netexec, and metasploit.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import os
+import random
 import re
+import shlex
 import shutil
 import subprocess
 import sys
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .config import CernoConfig
-    from .models import Plugin, Finding
+    from .models import Finding
 
 import pyperclip
-from rich.prompt import Prompt
+from rich.panel import Panel
+from rich.prompt import Confirm, IntPrompt, Prompt
+from rich.text import Text
 
-from .ansi import header, info, ok, warn
+from .ansi import C, err, header, info, ok, warn
+from .config import CernoConfig, load_config, save_config
 from .constants import (
     NETEXEC_PROTOCOLS,
     NSE_PROFILES,
+    MAX_SUMMARY_FILES,
+    PLUGIN_DETAILS_BASE,
+    SAMPLE_THRESHOLD,
+    WORKSPACE_SPINNER_MIN_HOSTS,
+    get_results_root,
+)
+from .database import get_connection
+from .fs import pretty_severity_label, run_output_base, work_files_match, write_work_files
+from .models import Plugin
+from .ops import (
+    ExecutionMetadata,
+    MsfConsoleSession,
+    ProxyConfig,
+    build_nmap_remote_oneliner,
+    get_interface_ip,
+    list_interfaces,
+    log_artifacts_for_nmap,
+    log_tool_execution,
+    require_cmd,
+    resolve_cmd,
+    run_command_with_progress,
+    start_ips_server,
 )
 from .tool_context import ToolContext, CommandResult
+from .tool_registry import get_available_tools, get_tool, get_tool_by_menu_index
 
 
 from .ansi import get_console
@@ -42,12 +74,84 @@ USER_AGENT = (
     "Chrome/141.0.0.0 Safari/537.36"
 )
 HTTP_HEADERS = {"User-Agent": USER_AGENT}
-PARENTHESIS_PATTERN = re.compile(r"\(([^)]+)\)")
-MSF_PATTERN = re.compile(r"Metasploit[:\-\s]*\(?([^)]+)\)?", re.IGNORECASE)
+# Plugin URLs and Metasploit search terms are ASCII-only
+PARENTHESIS_PATTERN = re.compile(r"\(([^)]+)\)", re.ASCII)
+MSF_PATTERN = re.compile(r"Metasploit[:\-\s]*\(?([^)]+)\)?", re.IGNORECASE | re.ASCII)
+_NSE_SCRIPT_RE = re.compile(r"--script[= ]([^\s]+)")
+
+# O(1) protocol-name lookup for typed NetExec protocol answers
+_NETEXEC_PROTOCOL_SET = frozenset(NETEXEC_PROTOCOLS)
+
+# Lowercased NSE profile names, parallel to NSE_PROFILES
+_NSE_NAMES_LOWER = tuple(name.lower() for name, _, _, _ in NSE_PROFILES)
+
+# Cached pyperclip copy function (None when no backend is available)
+_PYPERCLIP_BACKEND = None
+_pyperclip_probed = False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shell() -> Optional[str]:
+    """
+    Resolve the shell used for string commands, searching PATH only once.
+
+    Returns:
+        Path to bash (preferred) or sh, or None if neither is found
+    """
+    return shutil.which("bash") or shutil.which("sh")
+
+
+# Spaces and slashes in plugin names become underscores in output dir names
+_FNAME_XLAT = str.maketrans({" ": "_", "/": "_"})
+
+# Characters that need a shell: pipes, redirects, globs, expansions, quoting
+_NEEDS_SHELL_RE = re.compile(r"""[|&;<>*?`$(){}\[\]"'\\~#!\n]""")
+
+
+def _direct_argv(cmd: str) -> Optional[list[str]]:
+    """
+    Split a command string for direct execution when it needs no shell.
+
+    Commands without shell metacharacters, env-var prefixes or builtins
+    can be executed directly, saving the extra shell process.
+
+    Args:
+        cmd: Command string (e.g., a rendered custom command)
+
+    Returns:
+        Argument list to run without a shell, or None if a shell is required
+        (including when the program is not on PATH, so the shell reports it)
+    """
+    if _NEEDS_SHELL_RE.search(cmd):
+        return None
+    argv = shlex.split(cmd)
+    if not argv or "=" in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
 
 
 # ========== NSE Profile Selection ==========
 
+def _default_profile_index(config: "CernoConfig") -> Optional[int]:
+    """
+    Find the NSE_PROFILES index of the configured default profile.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Index into NSE_PROFILES, or None if no default is set or it
+        matches no profile (case-insensitive)
+    """
+    if not config.nmap_default_profile:
+        return None
+    default_lower = config.nmap_default_profile.lower()
+    for index, name_lower in enumerate(_NSE_NAMES_LOWER):
+        if name_lower == default_lower:
+            return index
+    return None
+
+
 def choose_nse_profile(config: Optional["CernoConfig"] = None) -> tuple[list[str], bool]:
     """
     Prompt user to select an NSE (Nmap Scripting Engine) profile.
@@ -62,17 +166,18 @@ def choose_nse_profile(config: Optional["CernoConfig"] = None) -> tuple[list[str
     """
     # Load config if not provided
     if config is None:
-        from .config import load_config
         config = load_config()
 
+    default_index = _default_profile_index(config)
+
     header("NSE Profiles")
+    lines: list[str] = []
     for index, (name, description, scripts, _) in enumerate(NSE_PROFILES, 1):
         # Highlight config default if it matches
-        if config.nmap_default_profile and name.lower() == config.nmap_default_profile.lower():
-            print(f"[{index}] {name} - {description} (default)")
-        else:
-            print(f"[{index}] {name} - {description}")
-        info(f"    Scripts: {', '.join(scripts)}")
+        marker = " (default)" if index - 1 == default_index else ""
+        lines.append(f"[{index}] {name} - {description}{marker}")
+        lines.append(f"    Scripts: {', '.join(scripts)}")
+    print("\n".join(lines))
     print_action_menu([("N", "None (no NSE profile)"), ("B", "Back")])
 
     # Show default hint if configured
@@ -90,16 +195,14 @@ def choose_nse_profile(config: Optional["CernoConfig"] = None) -> tuple[list[str
             return [], False
 
         # Handle default selection (Enter key) if config has default
-        if answer == "" and config.nmap_default_profile:
-            # Find matching profile by name
-            for index, (name, description, scripts, needs_udp) in enumerate(NSE_PROFILES):
-                if name.lower() == config.nmap_default_profile.lower():
-                    ok(
-                        f"Selected profile: {name} — "
-                        f"including: {', '.join(scripts)}"
-                    )
-                    return scripts[:], needs_udp
-            # If no match found, fall through to "none"
+        if answer == "" and default_index is not None:
+            name, description, scripts, needs_udp = NSE_PROFILES[default_index]
+            ok(
+                f"Selected profile: {name} — "
+                f"including: {', '.join(scripts)}"
+            )
+            return scripts[:], needs_udp
+        # If no match found, fall through to "none"
 
         if answer in ("n", "none", ""):
             return [], False
@@ -117,6 +220,83 @@ def choose_nse_profile(config: Optional["CernoConfig"] = None) -> tuple[list[str
         warn("Invalid choice.")
 
 
+def _nmap_summary_segments(
+    config: "CernoConfig",
+    selected_profile_index: Optional[int],
+    custom_scripts: list[str],
+    force_udp: bool,
+    remote_mode: bool,
+) -> list[tuple[str, str]]:
+    """
+    Build the nmap configuration summary as (text, style) segments.
+
+    The segments can be appended to a Rich ``Text`` for terminal output or
+    joined into plain text when stdout is not a terminal.
+
+    Args:
+        config: Configuration object (used for pivot interface details)
+        selected_profile_index: Index into NSE_PROFILES, or None
+        custom_scripts: User-entered NSE script names
+        force_udp: Whether UDP scanning was explicitly enabled
+        remote_mode: Whether remote scan mode is enabled
+
+    Returns:
+        List of (text, style) tuples in display order
+    """
+    segments: list[tuple[str, str]] = [("nmap Configuration\n\n", "bold cyan")]
+
+    # NSE Profile section
+    segments.append(("NSE Profile: ", "cyan"))
+    if selected_profile_index is not None:
+        profile_name, _, scripts, _ = NSE_PROFILES[selected_profile_index]
+        segments.append((f"{profile_name}\n", "yellow"))
+        segments.append((f"  Scripts: {', '.join(scripts)}\n", "dim"))
+    else:
+        segments.append(("None\n", "dim"))
+
+    # Custom scripts section
+    segments.append(("\nCustom Scripts: ", "cyan"))
+    if custom_scripts:
+        segments.append((f"{', '.join(custom_scripts)}\n", "yellow"))
+    else:
+        segments.append(("None\n", "dim"))
+
+    # UDP scan section
+    segments.append(("\nUDP Scan: ", "cyan"))
+    auto_udp = False
+    if selected_profile_index is not None:
+        _, _, _, needs_udp = NSE_PROFILES[selected_profile_index]
+        auto_udp = needs_udp
+
+    # Check if custom scripts imply UDP
+    if custom_scripts:
+        extras_imply_udp = any(
+            script.lower().startswith("snmp") or script.lower() == "ipmi-version"
+            for script in custom_scripts
+        )
+        auto_udp = auto_udp or extras_imply_udp
+
+    if force_udp or auto_udp:
+        if auto_udp and not force_udp:
+            segments.append(("Yes (auto-enabled for selected scripts)\n", "yellow"))
+        else:
+            segments.append(("Yes\n", "yellow"))
+    else:
+        segments.append(("No\n", "dim"))
+
+    # Remote mode section
+    segments.append(("\nRemote Mode: ", "cyan"))
+    if remote_mode:
+        iface = config.pivot_interface or "?"
+        ip = get_interface_ip(iface) if config.pivot_interface else None
+        addr = f"{iface} → {ip}" if ip else iface
+        segments.append((f"ON  ({addr})\n", "bold magenta"))
+    else:
+        segments.append(("OFF\n", "dim"))
+
+    return segments
+
+
 def configure_nmap_options(config: Optional["CernoConfig"] = None) -> Optional[tuple[list[str], bool, bool]]:
     """
     Consolidated nmap configuration screen.
@@ -130,86 +310,44 @@ def configure_nmap_options(config: Optional["CernoConfig"] = None) -> Optional[t
     Returns:
         Tuple of (script_list, needs_udp, remote_mode) or None if user cancels
     """
-    from rich.panel import Panel
-    from rich.text import Text
 
     # Load config if not provided
     if config is None:
-        from .config import load_config
         config = load_config()
 
     # Initialize state
-    selected_profile_index: Optional[int] = None
+    # Default profile comes from config (None if unset or unknown)
+    selected_profile_index: Optional[int] = _default_profile_index(config)
     custom_scripts: list[str] = []
     force_udp: bool = False
     remote_mode: bool = False
 
-    # Set default profile from config
-    if config.nmap_default_profile:
-        for index, (name, _, _, _) in enumerate(NSE_PROFILES):
-            if name.lower() == config.nmap_default_profile.lower():
-                selected_profile_index = index
-                break
+    # Summary is rebuilt only when the displayed state changes
+    last_state: Optional[tuple] = None
+    summary_renderable: object = None
 
     while True:
-        _console.print()
-
-        # Build configuration summary panel
-        summary = Text()
-        summary.append("nmap Configuration\n\n", style="bold cyan")
-
-        # NSE Profile section
-        summary.append("NSE Profile: ", style="cyan")
-        if selected_profile_index is not None:
-            profile_name, _, scripts, _ = NSE_PROFILES[selected_profile_index]
-            summary.append(f"{profile_name}\n", style="yellow")
-            summary.append(f"  Scripts: {', '.join(scripts)}\n", style="dim")
-        else:
-            summary.append("None\n", style="dim")
-
-        # Custom scripts section
-        summary.append("\nCustom Scripts: ", style="cyan")
-        if custom_scripts:
-            summary.append(f"{', '.join(custom_scripts)}\n", style="yellow")
-        else:
-            summary.append("None\n", style="dim")
-
-        # UDP scan section
-        summary.append("\nUDP Scan: ", style="cyan")
-        auto_udp = False
-        if selected_profile_index is not None:
-            _, _, _, needs_udp = NSE_PROFILES[selected_profile_index]
-            auto_udp = needs_udp
-
-        # Check if custom scripts imply UDP
-        if custom_scripts:
-            extras_imply_udp = any(
-                script.lower().startswith("snmp") or script.lower() == "ipmi-version"
-                for script in custom_scripts
+        state = (selected_profile_index, tuple(custom_scripts), force_udp, remote_mode)
+        if state != last_state:
+            segments = _nmap_summary_segments(
+                config, selected_profile_index, custom_scripts, force_udp, remote_mode
             )
-            auto_udp = auto_udp or extras_imply_udp
-
-        if force_udp or auto_udp:
-            if auto_udp and not force_udp:
-                summary.append("Yes (auto-enabled for selected scripts)\n", style="yellow")
+            if _console.is_terminal:
+                summary = Text()
+                for text, style in segments:
+                    summary.append(text, style=style)
+                summary_renderable = Panel(summary, border_style="cyan")
             else:
-                summary.append("Yes\n", style="yellow")
-        else:
-            summary.append("No\n", style="dim")
-
-        # Remote mode section
-        summary.append("\nRemote Mode: ", style="cyan")
-        if remote_mode:
-            from .ops import get_interface_ip
-            iface = config.pivot_interface or "?"
-            ip = get_interface_ip(iface) if config.pivot_interface else None
-            addr = f"{iface} → {ip}" if ip else iface
-            summary.append(f"ON  ({addr})\n", style="bold magenta")
-        else:
-            summary.append("OFF\n", style="dim")
+                # No terminal to draw to: skip Rich markup/Panel construction
+                summary_renderable = "".join(text for text, _ in segments)
+            last_state = state
 
-        panel = Panel(summary, border_style="cyan")
-        _console.print(panel)
+        if isinstance(summary_renderable, str):
+            print()
+            print(summary_renderable)
+        else:
+            _console.print()
+            _console.print(summary_renderable)
 
         # Show menu options with responsive layout
         render_responsive_action_menu([
@@ -261,10 +399,12 @@ def configure_nmap_options(config: Optional["CernoConfig"] = None) -> Optional[t
         elif answer in ("p", "profile"):
             # NSE Profile selection sub-menu
             header("Select NSE Profile")
+            lines: list[str] = []
             for index, (name, description, scripts, _) in enumerate(NSE_PROFILES, 1):
                 marker = " (current)" if index - 1 == selected_profile_index else ""
-                print(f"[{index}] {name} - {description}{marker}")
-                info(f"    Scripts: {', '.join(scripts)}")
+                lines.append(f"[{index}] {name} - {description}{marker}")
+                lines.append(f"    Scripts: {', '.join(scripts)}")
+            print("\n".join(lines))
             print_action_menu([("N", "None"), ("B", "Back")])
 
             try:
@@ -316,8 +456,6 @@ def configure_nmap_options(config: Optional["CernoConfig"] = None) -> Optional[t
                 remote_mode = True
             else:
                 # No interface configured — show picker
-                from .ops import list_interfaces, get_interface_ip
-                from .config import save_config
                 ifaces = list_interfaces()
                 if not ifaces:
                     warn("No network interfaces with IPv4 addresses found.")
@@ -391,32 +529,19 @@ def build_nmap_cmd(
     Returns:
         Command as list of strings ready for subprocess execution
     """
-    cmd = []
-
-    # sudo is not useful through a SOCKS proxy (raw sockets don't traverse)
-    if use_sudo and not use_proxy:
-        cmd.append("sudo")
-
-    cmd.extend(["nmap", "-A"])
-
+    # sudo is not useful through a SOCKS proxy (raw sockets don't traverse);
     # -Pn required when proxying: ICMP host discovery doesn't work through SOCKS
-    if use_proxy:
-        cmd.append("-Pn")
-
-    if nse_option:
-        cmd.append(nse_option)
-
-    cmd.extend(["-iL", str(ips_file)])
-
-    if udp:
-        cmd.append("-sU")
-
-    if ports_str:
-        cmd.extend(["-p", ports_str])
-
-    cmd.extend(["-oA", str(output_base)])
-
-    return cmd
+    parts = (
+        ("sudo",) if use_sudo and not use_proxy else (),
+        ("nmap", "-A"),
+        ("-Pn",) if use_proxy else (),
+        (nse_option,) if nse_option else (),
+        ("-iL", str(ips_file)),
+        ("-sU",) if udp else (),
+        ("-p", ports_str) if ports_str else (),
+        ("-oA", str(output_base)),
+    )
+    return [arg for part in parts for arg in part]
 
 
 def build_netexec_cmd(
@@ -438,15 +563,17 @@ def build_netexec_cmd(
         Tuple of (command, log_path, relay_path) where relay_path
         is only set for SMB protocol
     """
-    log_path = f"{str(output_base)}.nxc.{protocol}.log"
+    ips_str = str(ips_file)
+    base_str = str(output_base)
+    log_path = f"{base_str}.nxc.{protocol}.log"
     relay_path = None
     
     if protocol == "smb":
-        relay_path = f"{str(output_base)}.SMB_Signing_not_required_targets.txt"
+        relay_path = f"{base_str}.SMB_Signing_not_required_targets.txt"
         cmd = [
             exec_bin,
             "smb",
-            str(ips_file),
+            ips_str,
             "--gen-relay-list",
             relay_path,
             "--shares",
@@ -454,7 +581,7 @@ def build_netexec_cmd(
             log_path,
         ]
     else:
-        cmd = [exec_bin, protocol, str(ips_file), "--log", log_path]
+        cmd = [exec_bin, protocol, ips_str, "--log", log_path]
     
     return cmd, log_path, relay_path
 
@@ -475,11 +602,9 @@ def choose_tool(config: Optional["CernoConfig"] = None) -> Optional[str]:
         Tool id ('nmap', 'netexec', 'metasploit', 'custom') or
         None if user cancels
     """
-    from .tool_registry import get_available_tools, get_tool_by_menu_index
 
     # Load config if not provided
     if config is None:
-        from .config import load_config
         config = load_config()
 
     # Get all registered tools sorted by menu_order
@@ -493,12 +618,14 @@ def choose_tool(config: Optional["CernoConfig"] = None) -> Optional[str]:
     header("Choose a tool")
 
     # Display tools dynamically from registry
+    lines: list[str] = []
     for index, tool in enumerate(available_tools, start=1):
         # Format: [1] nmap or [2] netexec — multi-protocol
         if tool.description and tool.description != tool.name:
-            print(f"[{index}] {tool.name} — {tool.description}")
+            lines.append(f"[{index}] {tool.name} — {tool.description}")
         else:
-            print(f"[{index}] {tool.name}")
+            lines.append(f"[{index}] {tool.name}")
+    print("\n".join(lines))
 
     print_action_menu([("B", "Back")])
 
@@ -557,15 +684,15 @@ def choose_netexec_protocol(config: Optional["CernoConfig"] = None) -> Optional[
     """
     # Load config if not provided
     if config is None:
-        from .config import load_config
         config = load_config()
 
     # Use config default or fall back to 'smb'
     default_proto = config.default_netexec_protocol or "smb"
 
     header("NetExec: choose protocol")
-    for index, protocol in enumerate(NETEXEC_PROTOCOLS, 1):
-        print(f"[{index}] {protocol}")
+    print("\n".join(
+        f"[{index}] {protocol}" for index, protocol in enumerate(NETEXEC_PROTOCOLS, 1)
+    ))
     print_action_menu([("B", "Back")])
     print(f"(Press Enter for '{default_proto}')")
 
@@ -587,7 +714,7 @@ def choose_netexec_protocol(config: Optional["CernoConfig"] = None) -> Optional[
             if 1 <= protocol_index <= len(NETEXEC_PROTOCOLS):
                 return NETEXEC_PROTOCOLS[protocol_index - 1]
         
-        if answer in NETEXEC_PROTOCOLS:
+        if answer in _NETEXEC_PROTOCOL_SET:
             return answer
         
         warn("Invalid choice.")
@@ -617,9 +744,30 @@ def custom_command_help(placeholder_mapping: dict[str, str]) -> None:
     info("  cat {TCP_IPS} | xargs -I{} sh -c 'echo {}; nmap -Pn -p {PORTS} {}'")
 
 
+@functools.lru_cache(maxsize=8)
+def _placeholder_pattern(placeholders: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile one alternation matching any of the given placeholders.
+
+    Longer placeholders are tried first so that a placeholder that is a
+    prefix of another (e.g. {TCP} vs {TCP_IPS}) never shadows it.
+
+    Args:
+        placeholders: Literal placeholder strings (e.g. "{TCP_IPS}")
+
+    Returns:
+        Compiled pattern
+    """
+    ordered = sorted(placeholders, key=len, reverse=True)
+    return re.compile("|".join(re.escape(placeholder) for placeholder in ordered))
+
+
 def render_placeholders(template: str, mapping: dict[str, str]) -> str:
     """
     Replace placeholders in template string with their values.
+
+    Substitution is a single regex pass over the template, so expanded
+    values are never themselves re-expanded.
     
     Args:
         template: String containing placeholders in {PLACEHOLDER} format
@@ -628,14 +776,49 @@ def render_placeholders(template: str, mapping: dict[str, str]) -> str:
     Returns:
         Template string with placeholders replaced
     """
-    result = template
-    for placeholder, value in mapping.items():
-        result = result.replace(placeholder, str(value))
-    return result
+    if not mapping:
+        return template
+    pattern = _placeholder_pattern(tuple(mapping))
+    return pattern.sub(lambda match: str(mapping[match.group(0)]), template)
 
 
 # ========== Command Review ==========
 
+def _count_lines(path: Path) -> int:
+    """
+    Count lines in a work file with a single read and C-level byte count.
+
+    Args:
+        path: File to count (e.g., tcp_ips.list)
+
+    Returns:
+        Number of lines, counting a final line without a trailing newline
+    """
+    data = path.read_bytes()
+    count = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        count += 1
+    return count
+
+
+def _nse_scripts_from_cmd(cmd: list[str] | str) -> Optional[list[str]]:
+    """
+    Extract NSE script names from an nmap command's ``--script`` option.
+
+    List commands are searched unquoted, so script patterns containing shell
+    metacharacters (e.g. ``snmp*``) are returned as written.
+
+    Args:
+        cmd: nmap command as an argv list or a string
+
+    Returns:
+        Script names, or None if the command has no ``--script`` option
+    """
+    raw = cmd if isinstance(cmd, str) else " ".join(str(x) for x in cmd)
+    script_match = _NSE_SCRIPT_RE.search(raw)
+    return script_match.group(1).split(",") if script_match else None
+
+
 def command_review_menu(
     cmd_list_or_str: list[str] | str,
     ctx: Optional["ToolContext"] = None,
@@ -654,70 +837,73 @@ def command_review_menu(
     Returns:
         User action: 'run', 'copy', or 'cancel'
     """
-    from rich.panel import Panel
-    from rich.text import Text
-    from pathlib import Path
 
     header("Command Review")
 
-    # Show pre-flight summary if context is available
-    if ctx:
-        summary = Text()
-
-        # Tool name
-        if tool_name:
-            summary.append("Tool: ", style="cyan")
-            summary.append(f"{tool_name}\n", style="yellow")
-
-        # Proxy status
-        if ctx.use_proxy:
-            summary.append("Proxy: ", style="cyan")
-            summary.append("proxychains4 ACTIVE\n", style="bold magenta")
-
-        # Target information
-        target_count = 0
-        if ctx.tcp_ips and Path(ctx.tcp_ips).exists():
-            with open(ctx.tcp_ips) as f:
-                target_count = sum(1 for _ in f)
-
-        if target_count > 0:
-            summary.append("Targets: ", style="cyan")
-            summary.append(f"{target_count} host(s)\n", style="yellow")
-
-        # NSE scripts (if applicable)
-        if nse_scripts:
-            summary.append("Scripts: ", style="cyan")
-            script_list = ", ".join(nse_scripts[:3])  # Show first 3
-            if len(nse_scripts) > 3:
-                script_list += f" (+{len(nse_scripts)-3} more)"
-            summary.append(f"{script_list}\n", style="yellow")
-
-        # Output directory
-        if ctx.results_dir:
-            summary.append("Output directory: ", style="cyan")
-            summary.append(f"{ctx.results_dir}\n", style="yellow")
-
-        panel = Panel(
-            summary,
-            title="[bold cyan]Execution Summary[/]",
-            border_style="cyan"
-        )
-        _console.print(panel)
-        _console.print()
-
     # Show command
     if isinstance(cmd_list_or_str, str):
         cmd_str = cmd_list_or_str
     else:
         cmd_str = " ".join(cmd_list_or_str)
 
-    info("Command:")
-    print(cmd_str)
-    print()
-    render_responsive_action_menu([
-        [("1", "Run now"), ("2", "Copy to clipboard")],
-        [("B", "Back")],
-    ])
+    # Render the whole screen into one buffer and write it in a single call
+    with _console.capture() as capture:
+        # Show pre-flight summary if context is available
+        if ctx:
+            summary = Text()
+
+            # Tool name
+            if tool_name:
+                summary.append("Tool: ", style="cyan")
+                summary.append(f"{tool_name}\n", style="yellow")
+
+            # Proxy status
+            if ctx.use_proxy:
+                summary.append("Proxy: ", style="cyan")
+                summary.append("proxychains4 ACTIVE\n", style="bold magenta")
+
+            # Target information
+            target_count = 0
+            if ctx.tcp_ips and Path(ctx.tcp_ips).exists():
+                target_count = _count_lines(Path(ctx.tcp_ips))
+
+            if target_count > 0:
+                summary.append("Targets: ", style="cyan")
+                summary.append(f"{target_count} host(s)\n", style="yellow")
+
+            # NSE scripts (if applicable)
+            if nse_scripts:
+                summary.append("Scripts: ", style="cyan")
+                script_list = ", ".join(nse_scripts[:3])  # Show first 3
+                if len(nse_scripts) > 3:
+                    script_list += f" (+{len(nse_scripts)-3} more)"
+                summary.append(f"{script_list}\n", style="yellow")
+
+            # Output directory
+            if ctx.results_dir:
+                summary.append("Output directory: ", style="cyan")
+                summary.append(f"{ctx.results_dir}\n", style="yellow")
+
+            panel = Panel(
+                summary,
+                title="[bold cyan]Execution Summary[/]",
+                border_style="cyan"
+            )
+            _console.print(panel)
+            _console.print()
+
+        _console.print("Command:")
+        # Commands may contain literal brackets; never parse them as markup
+        # and never hard-wrap them, so the line stays copyable
+        _console.print(cmd_str, markup=False, highlight=False, soft_wrap=True)
+        _console.print()
+        render_responsive_action_menu([
+            [("1", "Run now"), ("2", "Copy to clipboard")],
+            [("B", "Back")],
+        ])
+
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
 
     while True:
         try:
@@ -740,6 +926,31 @@ def command_review_menu(
 
 # ========== Clipboard Operations ==========
 
+def _get_pyperclip_backend():
+    """
+    Return pyperclip's copy function, probing for a backend only once.
+
+    On headless systems pyperclip has no backend and every copy attempt
+    raises. Probing once and caching the result lets callers go straight
+    to the OS-tool fallback on subsequent copies.
+
+    Returns:
+        Callable that copies text, or None if pyperclip has no backend
+    """
+    global _PYPERCLIP_BACKEND, _pyperclip_probed
+
+    if not _pyperclip_probed:
+        try:
+            copy_fn, _paste_fn = pyperclip.determine_clipboard()
+        except Exception:
+            copy_fn = None
+        # pyperclip's "unavailable" stub is falsy
+        _PYPERCLIP_BACKEND = copy_fn if copy_fn else None
+        _pyperclip_probed = True
+
+    return _PYPERCLIP_BACKEND
+
+
 def copy_to_clipboard(text: str) -> tuple[bool, str]:
     """
     Copy text to clipboard using available methods.
@@ -754,12 +965,14 @@ def copy_to_clipboard(text: str) -> tuple[bool, str]:
         Tuple of (success, message) indicating whether copy succeeded
         and describing the method used or error encountered
     """
-    # Try pyperclip first
-    try:
-        pyperclip.copy(text)
-        return True, "Copied using pyperclip."
-    except Exception:
-        pass
+    # Try pyperclip first (skipped entirely when it has no backend)
+    backend = _get_pyperclip_backend()
+    if backend is not None:
+        try:
+            backend(text)
+            return True, "Copied using pyperclip."
+        except Exception:
+            pass
     
     # Fall back to OS-specific tools
     encoded_text = text.encode("utf-8")
@@ -785,14 +998,19 @@ def copy_to_clipboard(text: str) -> tuple[bool, str]:
     # Try each available tool
     for tool_name, tool_args in clipboard_tools:
         try:
+            # stdout is never read; only stderr is kept for error diagnostics
             subprocess.run(
                 tool_args,
                 input=encoded_text,
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
             return True, f"Copied using {tool_name}."
         except subprocess.CalledProcessError as exc:
+            stderr_text = (exc.stderr or b"").decode("utf-8", errors="replace").strip()
+            if stderr_text:
+                return False, f"Clipboard tool failed (exit {exc.returncode}): {stderr_text}"
             return False, f"Clipboard tool failed (exit {exc.returncode})."
         except Exception as exc:
             return False, f"Clipboard error: {exc}"
@@ -815,23 +1033,179 @@ def copy_to_clipboard(text: str) -> tuple[bool, str]:
 
 # ========== Metasploit Helpers ==========
 
-def _build_msfconsole_commands(term: str) -> list[str]:
+def _build_msfconsole_batch_command(terms: list[str]) -> str:
     """
-    Build msfconsole one-liner command for a search term.
+    Build one msfconsole command that runs every search in a single session.
+
+    msfconsole takes several seconds to start, so running all searches in
+    one ``-x`` script pays that startup cost once.
 
     Args:
-        term: Metasploit module search term
+        terms: Metasploit module search terms
 
     Returns:
-        List containing single msfconsole command string
+        msfconsole command string searching each term, then exiting
     """
+    script = "; ".join(f"search {term}" for term in terms)
+
     # Use appropriate quoting based on term content
-    if "'" in term:
-        cmd = f'msfconsole -q -x "search {term}; exit"'
-    else:
-        cmd = f"msfconsole -q -x 'search {term}; exit'"
+    if any("'" in term for term in terms):
+        return f'msfconsole -q -x "{script}; exit"'
+    return f"msfconsole -q -x '{script}; exit'"
+
+
+def _run_in_msf_session(session: MsfConsoleSession, command: str) -> bool:
+    """
+    Confirm and run one command in the shared msfconsole session.
+
+    Failures (msfconsole missing, exiting early, or timing out) are reported
+    as warnings so the calling menu keeps running.
+
+    Args:
+        session: Persistent msfconsole session
+        command: msfconsole command exactly as it will be sent
+
+    Returns:
+        True if the command ran to completion, False otherwise
+    """
+    info(f"\nExecuting in msfconsole: {command}\n")
+    if not Confirm.ask("Confirm?", default=False):
+        info("Execution skipped.")
+        return False
+    try:
+        session.run(command)
+    except (OSError, subprocess.SubprocessError) as exc:
+        warn(f"msfconsole command failed: {exc}")
+        return False
+    ok("\nCommand completed.")
+    return True
 
-    return [cmd]
+
+def _run_msf_batch(command: str, proxy_config: Optional[ProxyConfig]) -> bool:
+    """
+    Confirm and run the all-searches msfconsole one-liner through the shell.
+
+    Args:
+        command: msfconsole one-liner from _build_msfconsole_batch_command()
+        proxy_config: Optional proxy configuration
+
+    Returns:
+        True if the command ran to completion, False otherwise
+    """
+    info(f"\nExecuting: {command}\n")
+    if not Confirm.ask("Confirm?", default=False):
+        info("Execution skipped.")
+        return False
+    shell_exec = _get_shell()
+    if not shell_exec:
+        warn("No shell found (bash/sh).")
+        return False
+    try:
+        run_command_with_progress(
+            command, shell=True, executable=shell_exec, proxy_config=proxy_config
+        )
+    except (OSError, subprocess.SubprocessError) as exc:
+        warn(f"msfconsole command failed: {exc}")
+        return False
+    ok("\nCommand completed.")
+    return True
+
+
+def _offer_msf_module_info(session: MsfConsoleSession) -> None:
+    """
+    Offer to run or copy ``info`` for a module path found by a search.
+
+    Args:
+        session: Persistent msfconsole session used when running
+    """
+    _console.print()
+    module_path = Prompt.ask(
+        "[cyan]>>[/cyan] Get info on a module? (paste path or Enter to skip)",
+        default=""
+    ).strip()
+    if not module_path:
+        return
+
+    info_cmd = f"info {module_path}"
+    _console.print("\n[cyan]>>[/cyan] Info command:")
+    _console.print(f"  {info_cmd}")
+
+    action = Prompt.ask(
+        "\n[R]un, [C]opy to clipboard, or Enter to skip",
+        default=""
+    ).strip().lower()
+
+    if action in ("r", "run"):
+        _run_in_msf_session(session, info_cmd)
+    elif action in ("c", "copy"):
+        # Copy a standalone one-liner usable outside cerno's session
+        success, msg = copy_to_clipboard(f"msfconsole -q -x '{info_cmd}; exit'")
+        if success:
+            ok("Copied to clipboard.")
+        else:
+            warn(msg)
+
+
+def _msf_command_menu(
+    search_terms: list[str], proxy_config: Optional[ProxyConfig]
+) -> None:
+    """
+    Interactive menu for running Metasploit searches and module info.
+
+    Individual searches and module info share one msfconsole process, started
+    on first use, instead of one per command. With several terms, option 0
+    runs every search in one msfconsole one-liner.
+
+    Args:
+        search_terms: Module names and CVEs to search for
+        proxy_config: Optional proxy configuration
+    """
+    # Offer all searches in one msfconsole session (one startup);
+    # cheaper than fanning out parallel msfconsole processes, each
+    # of which loads the full module cache
+    run_all_cmd = (
+        _build_msfconsole_batch_command(search_terms)
+        if len(search_terms) > 1 else None
+    )
+    search_cmds = [f"search {term}" for term in search_terms]
+
+    with MsfConsoleSession(proxy_config=proxy_config) as msf_session:
+        while True:
+            _console.print("\n[cyan]>>[/cyan] Available msfconsole commands:")
+            if run_all_cmd:
+                _console.print(f"  0. Run all searches in one session: {run_all_cmd}")
+            for idx, cmd in enumerate(search_cmds, start=1):
+                _console.print(f"  {idx}. {cmd}")
+
+            try:
+                answer = Prompt.ask(
+                    "\nRun which command? (number, [0] all, or [N] None)"
+                    if run_all_cmd else
+                    "\nRun which command? (number or [N] None)",
+                    default="n"
+                ).strip()
+                if not answer or answer.lower() == "n":
+                    break
+
+                try:
+                    selection = int(answer)
+                except ValueError:
+                    warn("Invalid selection.")
+                    continue
+
+                if selection == 0 and run_all_cmd:
+                    completed = _run_msf_batch(run_all_cmd, proxy_config)
+                elif 1 <= selection <= len(search_cmds):
+                    completed = _run_in_msf_session(msf_session, search_cmds[selection - 1])
+                else:
+                    warn("Invalid selection.")
+                    continue
+
+                if completed:
+                    _offer_msf_module_info(msf_session)
+            except (KeyboardInterrupt, EOFError):
+                info("\nReturning to menu.")
+                break
 
 
 def show_msf_available(plugin_url: str) -> None:
@@ -866,10 +1240,6 @@ def build_nmap_workflow(ctx: "ToolContext") -> Optional["CommandResult"]:
     Returns:
         CommandResult with command details, or None if interrupted
     """
-    from .tool_context import CommandResult
-    from .ansi import info, C
-    from .ops import require_cmd
-    from .config import load_config
 
     config = load_config()
 
@@ -890,9 +1260,6 @@ def build_nmap_workflow(ctx: "ToolContext") -> Optional["CommandResult"]:
 
     # --- Remote scan mode ---
     if remote_mode:
-        from .ops import get_interface_ip, start_ips_server, build_nmap_remote_oneliner
-        from .ansi import warn
-        from datetime import datetime
 
         ip = get_interface_ip(config.pivot_interface or "")
         if not ip:
@@ -926,8 +1293,7 @@ def build_nmap_workflow(ctx: "ToolContext") -> Optional["CommandResult"]:
     # --- End remote scan mode ---
 
     if ctx.use_proxy:
-        from .ansi import warn as _proxy_warn
-        _proxy_warn("[!] Proxy mode: nmap adjustments applied")
+        warn("[!] Proxy mode: nmap adjustments applied")
         print("    \u2022 -Pn added (ICMP does not traverse SOCKS)")
         print("    \u2022 SYN scan (-sS) unavailable \u2014 proxychains4 forces TCP connect")
         print("    \u2022 UDP scanning not supported through SOCKS proxy")
@@ -951,10 +1317,6 @@ def build_netexec_workflow(ctx: "ToolContext") -> Optional["CommandResult"]:
     Returns:
         CommandResult with command details, or None if interrupted
     """
-    from .tool_context import CommandResult
-    from .ansi import warn, info
-    from .ops import resolve_cmd
-    from .config import load_config
 
     config = load_config()
     protocol = choose_netexec_protocol(config)
@@ -987,9 +1349,6 @@ def build_custom_workflow(ctx: "ToolContext") -> Optional["CommandResult"]:
     Returns:
         CommandResult with command details, or None if cancelled
     """
-    from .tool_context import CommandResult
-    from rich.prompt import Prompt
-    from .ansi import warn
 
     mapping: dict[str, str] = {
         "{TCP_IPS}": str(ctx.tcp_ips),
@@ -1022,6 +1381,171 @@ def build_custom_workflow(ctx: "ToolContext") -> Optional["CommandResult"]:
     )
 
 
+_WORKSPACE_CACHE_SIZE = 32
+"""Maximum number of host/port workspaces kept for reuse."""
+
+# (hosts, ports_str) -> (workdir, tcp_ips, udp_ips, tcp_sockets), least
+# recently used first
+_workspace_cache: OrderedDict[
+    tuple[tuple[str, ...], str], tuple[Path, Path, Path, Path]
+] = OrderedDict()
+
+
+def _remove_cached_workspaces() -> None:
+    """Delete every cached workspace directory and empty the cache."""
+    while _workspace_cache:
+        _key, (workdir, *_files) = _workspace_cache.popitem(last=False)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+atexit.register(_remove_cached_workspaces)
+
+
+def _prepare_workspace(hosts: tuple[str, ...], ports_str: str) -> tuple[Path, Path, Path, Path]:
+    """
+    Get the work files for a host set, reusing an earlier workspace.
+
+    Re-entering a finding (or a sibling with the same hosts and ports)
+    reuses the workspace instead of creating a new temp directory. Files
+    that were removed or changed by a previous command are rewritten.
+    Up to _WORKSPACE_CACHE_SIZE workspaces are kept; the least recently
+    used one is deleted on eviction and the rest when cerno exits.
+
+    Args:
+        hosts: Target hosts in file order
+        ports_str: Comma-separated ports
+
+    Returns:
+        Tuple of (workdir, tcp_ips, udp_ips, tcp_sockets)
+    """
+    key = (hosts, ports_str)
+    cached = _workspace_cache.get(key)
+    if cached is not None:
+        _workspace_cache.move_to_end(key)
+        if not work_files_match(cached[0], list(hosts), ports_str, udp=True):
+            write_work_files(cached[0], list(hosts), ports_str, udp=True)
+        return cached
+
+    workdir = Path(tempfile.mkdtemp(prefix="nph_work_"))
+    tcp_ips, udp_ips, tcp_sockets = write_work_files(
+        workdir, list(hosts), ports_str, udp=True
+    )
+    _workspace_cache[key] = (workdir, tcp_ips, udp_ips, tcp_sockets)
+    if len(_workspace_cache) > _WORKSPACE_CACHE_SIZE:
+        _key, (evicted, *_files) = _workspace_cache.popitem(last=False)
+        shutil.rmtree(evicted, ignore_errors=True)
+    return workdir, tcp_ips, udp_ips, tcp_sockets
+
+
+def _walk_files(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield regular files under root using os.scandir.
+
+    DirEntry type checks reuse the data returned by readdir, avoiding the
+    Path allocation and extra stat() per entry of Path.rglob(). Symlinked
+    directories are not descended into, and unreadable directories are
+    skipped.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        DirEntry for each file
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(Path(entry.path))
+                elif entry.is_file():
+                    yield entry
+    except PermissionError:
+        return
+
+
+def _build_execution_summary(
+    exec_metadata: Optional[ExecutionMetadata], results_dir: Optional[Path]
+) -> Optional[Text]:
+    """
+    Build the post-execution summary shown in the "Execution Complete" panel.
+
+    Args:
+        exec_metadata: Metadata of the run, if any
+        results_dir: Results directory whose files are counted
+
+    Returns:
+        Summary text, or None when there is no run metadata and no
+        generated files to report
+    """
+    # Count generated files in results directory
+    file_count = 0
+    total_size = 0
+    generated_files: list[str] = []
+    # Stop walking at the cap; counts past it are shown as "N+"
+    truncated = False
+    if results_dir and results_dir.exists():
+        for entry in _walk_files(results_dir):
+            if file_count == MAX_SUMMARY_FILES:
+                truncated = True
+                break
+            file_count += 1
+            total_size += entry.stat().st_size
+            # Show first 4 files as examples
+            if len(generated_files) < 4:
+                generated_files.append(f"  - {entry.name}")
+
+    if exec_metadata is None and file_count == 0:
+        return None
+
+    summary = Text()
+
+    if exec_metadata is not None:
+        # Duration
+        duration = exec_metadata.duration_seconds
+        minutes = int(duration // 60)
+        seconds = int(duration % 60)
+        if minutes > 0:
+            duration_str = f"{minutes}m {seconds}s"
+        else:
+            duration_str = f"{seconds}s"
+        summary.append("Duration: ", style="cyan")
+        summary.append(f"{duration_str}\n", style="yellow")
+
+        # Exit code
+        exit_code = exec_metadata.exit_code
+        summary.append("Exit code: ", style="cyan")
+        if exit_code == 0:
+            summary.append(f"{exit_code} (success)\n", style="green")
+        else:
+            summary.append(f"{exit_code} (error)\n", style="red")
+
+    if file_count > 0:
+        size_kb = total_size / 1024
+        if size_kb < 1024:
+            size_str = f"{size_kb:.1f} KB"
+        else:
+            size_str = f"{size_kb/1024:.1f} MB"
+
+        summary.append("Files generated: ", style="cyan")
+        if truncated:
+            summary.append(f"{file_count}+ (>= {size_str} total)\n", style="yellow")
+        else:
+            summary.append(f"{file_count} ({size_str} total)\n", style="yellow")
+
+        for file_line in generated_files:
+            summary.append(f"{file_line}\n", style="dim")
+
+        if file_count > len(generated_files):
+            more = file_count - len(generated_files)
+            more_str = f"{more}+" if truncated else f"{more}"
+            summary.append(f"  ... and {more_str} more\n", style="dim")
+
+    # Results directory location
+    summary.append("\nResults directory: ", style="cyan")
+    summary.append(f"{results_dir}", style="yellow")
+    return summary
+
+
 def run_tool_workflow(
     plugin: "Plugin",
     finding: "Finding",
@@ -1052,20 +1576,6 @@ def run_tool_workflow(
     Returns:
         True if any tool was executed, False otherwise
     """
-    import random
-    import tempfile
-    import subprocess
-    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-    from rich.prompt import Confirm, IntPrompt, Prompt
-    from .ansi import warn, ok, err, info, header, get_console
-    from .constants import SAMPLE_THRESHOLD, get_results_root
-    from .fs import build_results_paths, pretty_severity_label, write_work_files
-    from .ops import run_command_with_progress, log_tool_execution, log_artifacts_for_nmap
-    from .tool_registry import get_tool
-    from .tool_context import ToolContext
-
-    _console_global = get_console()
-
     sample_hosts = hosts
 
     if len(hosts) > SAMPLE_THRESHOLD:
@@ -1096,22 +1606,30 @@ def run_tool_workflow(
                 ok(f"Sampling {count} host(s).")
                 break
 
-    with Progress(
-        SpinnerColumn(style="cyan"),
-        TextColumn("[progress.description]{task.description}"),
-        TimeElapsedColumn(),
-        console=_console_global,
-        transient=True,
-    ) as progress:
-        progress.add_task("Preparing workspace...", start=True)
-        workdir = Path(tempfile.mkdtemp(prefix="nph_work_"))
-        tcp_ips, udp_ips, tcp_sockets = write_work_files(
-            workdir, sample_hosts, ports_str, udp=True
+    # Writing a few host lists takes well under a millisecond; only large
+    # host sets are worth the cost of starting a live spinner
+    if len(sample_hosts) > WORKSPACE_SPINNER_MIN_HOSTS:
+        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+        with Progress(
+            SpinnerColumn(style="cyan"),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=_console,
+            transient=True,
+        ) as progress:
+            progress.add_task("Preparing workspace...", start=True)
+            workdir, tcp_ips, udp_ips, tcp_sockets = _prepare_workspace(
+                tuple(sample_hosts), ports_str
+            )
+    else:
+        workdir, tcp_ips, udp_ips, tcp_sockets = _prepare_workspace(
+            tuple(sample_hosts), ports_str
         )
 
     # Create synthetic filename for output directory structure
     # Format: {plugin_id}_{plugin_name}
-    synthetic_filename = f"{plugin.plugin_id}_{plugin.plugin_name.replace(' ', '_').replace('/', '_')}"
+    synthetic_filename = f"{plugin.plugin_id}_{plugin.plugin_name.translate(_FNAME_XLAT)}"
 
     out_dir_static = (
         get_results_root()
@@ -1120,11 +1638,12 @@ def run_tool_workflow(
         / synthetic_filename
     )
     out_dir_static.mkdir(parents=True, exist_ok=True)
+    # Same directory build_results_paths() would return for this finding
+    results_dir = out_dir_static
 
     tool_used = False
 
     # Get plugin details directly from Plugin object
-    from .constants import PLUGIN_DETAILS_BASE
     plugin_url = f"{PLUGIN_DETAILS_BASE}{plugin.plugin_id}"
     plugin_id = str(plugin.plugin_id)
 
@@ -1133,9 +1652,7 @@ def run_tool_workflow(
 
     # Build proxy config once — proxy state is determined at session start,
     # not re-evaluated per tool dispatch.
-    from .ops import ProxyConfig
-    from .config import load_config as _load_config_for_proxy
-    _initial_config = _load_config_for_proxy()
+    _initial_config = load_config()
     _proxy_enabled = _initial_config.proxychains_enabled
     if getattr(args, 'proxy', False):
         _proxy_enabled = True
@@ -1148,8 +1665,7 @@ def run_tool_workflow(
     )
 
     while True:
-
-        from .config import load_config
+        # Re-read each pass so config saved mid-workflow applies (cached; one stat)
         config = load_config()
         tool_choice = choose_tool(config)
         if tool_choice is None:
@@ -1162,8 +1678,8 @@ def run_tool_workflow(
             warn(f"Unknown tool selection: {tool_choice}")
             continue
 
-        _tmp_dir, oabase = build_results_paths(scan_dir, sev_dir, f"{synthetic_filename}.txt")
-        results_dir = out_dir_static
+        # Only the run timestamp varies per pass; the directory is hoisted above
+        oabase = run_output_base(results_dir)
 
         # ====================================================================
         # Tool Dispatch - Unified Context Pattern
@@ -1173,8 +1689,6 @@ def run_tool_workflow(
 
         # Special handling for metasploit (read-only from database)
         if tool_choice == "metasploit":
-            from .models import Plugin
-            from .database import get_connection
 
             if not plugin_id:
                 warn("Cannot extract plugin ID from filename.")
@@ -1194,102 +1708,14 @@ def run_tool_workflow(
                 # Display available module names
                 info(f"Found {len(plugin_obj.metasploit_names)} Metasploit module(s):")
                 for idx, msf_name in enumerate(plugin_obj.metasploit_names, start=1):
-                    _console_global.print(f"  {idx}. {msf_name}")
-
-                # Build list of all commands
-                one_liners = []
-                for msf_name in plugin_obj.metasploit_names:
-                    cmd = f"msfconsole -q -x 'search {msf_name}; exit'"
-                    one_liners.append(cmd)
-
-                if plugin_obj.cves:
-                    for cve in plugin_obj.cves:
-                        cmd = f"msfconsole -q -x 'search {cve}; exit'"
-                        one_liners.append(cmd)
-
-                # Interactive command selection loop
-                while True:
-                    _console_global.print("\n[cyan]>>[/cyan] Available commands:")
-                    for idx, cmd in enumerate(one_liners, start=1):
-                        _console_global.print(f"  {idx}. {cmd}")
-
-                    try:
-                        answer = Prompt.ask(
-                            "\nRun which command? (number or [N] None)",
-                            default="n"
-                        )
-
-                        if answer and answer.strip().lower() != "n":
-                            try:
-                                selection = int(answer.strip())
-                                if 1 <= selection <= len(one_liners):
-                                    selected_cmd = one_liners[selection - 1]
-
-                                    # Execute command with confirmation
-                                    info(f"\nExecuting: {selected_cmd}\n")
-                                    if Confirm.ask("Confirm?", default=False):
-                                        shell_exec = shutil.which("bash") or shutil.which("sh")
-                                        if shell_exec:
-                                            run_command_with_progress(
-                                                selected_cmd,
-                                                shell=True,
-                                                executable=shell_exec,
-                                                proxy_config=proxy_config,
-                                            )
-                                            ok("\nCommand completed.")
-
-                                            # Offer module info after search completes
-                                            _console_global.print()
-                                            module_path = Prompt.ask(
-                                                "[cyan]>>[/cyan] Get info on a module? (paste path or Enter to skip)",
-                                                default=""
-                                            ).strip()
-
-                                            if module_path:
-                                                info_cmd = f"msfconsole -q -x 'info {module_path}; exit'"
-                                                _console_global.print(f"\n[cyan]>>[/cyan] Info command:")
-                                                _console_global.print(f"  {info_cmd}")
-
-                                                action = Prompt.ask(
-                                                    "\n[R]un, [C]opy to clipboard, or Enter to skip",
-                                                    default=""
-                                                ).strip().lower()
-
-                                                if action in ("r", "run"):
-                                                    info(f"\nExecuting: {info_cmd}\n")
-                                                    if Confirm.ask("Confirm?", default=False):
-                                                        run_command_with_progress(
-                                                            info_cmd,
-                                                            shell=True,
-                                                            executable=shell_exec,
-                                                            proxy_config=proxy_config,
-                                                        )
-                                                        ok("\nInfo command completed.")
-                                                    else:
-                                                        info("Execution skipped.")
-                                                elif action in ("c", "copy"):
-                                                    success, msg = copy_to_clipboard(info_cmd)
-                                                    if success:
-                                                        ok("Copied to clipboard.")
-                                                    else:
-                                                        warn(msg)
-                                        else:
-                                            warn("No shell found (bash/sh).")
-                                    else:
-                                        info("Execution skipped.")
-
-                                    continue  # Show menu again
-                                else:
-                                    warn("Invalid selection.")
-                                    continue
-                            except ValueError:
-                                warn("Invalid selection.")
-                                continue
-                        else:
-                            break  # Exit loop
-                    except (KeyboardInterrupt, EOFError):
-                        info("\nReturning to menu.")
-                        break
+                    _console.print(f"  {idx}. {msf_name}")
+
+                # Build list of all search terms (module names, then CVEs),
+                # dropping duplicates while keeping first-seen order
+                search_terms = list(dict.fromkeys(
+                    [*plugin_obj.metasploit_names, *(plugin_obj.cves or [])]
+                ))
+                _msf_command_menu(search_terms, proxy_config)
             except Exception as exc:
                 warn(f"Failed to retrieve Metasploit information: {exc}")
 
@@ -1325,9 +1751,8 @@ def run_tool_workflow(
 
         # ── Remote scan mode ─────────────────────────────────────
         if result.is_remote:
-            from .ansi import warn as _warn, ok as _ok
             print()
-            _warn("[!] Remote scan mode — HTTPS server running (serving target list)")
+            warn("[!] Remote scan mode — HTTPS server running (serving target list)")
             print()
             print("Command to run on pivot:")
             print("─" * 70)
@@ -1345,7 +1770,7 @@ def run_tool_workflow(
                     break
                 if remote_answer in ("c", "copy"):
                     copy_to_clipboard(str(result.display_command))
-                    _ok("Copied to clipboard.")
+                    ok("Copied to clipboard.")
                 elif remote_answer in ("", "done"):
                     break
             if result.cleanup:
@@ -1353,7 +1778,7 @@ def run_tool_workflow(
             if result.remote_output_path:
                 fname = result.remote_output_path.split("/")[-1]
                 print()
-                _ok("When complete, retrieve and import results:")
+                ok("When complete, retrieve and import results:")
                 print(f"  scp pivot:{result.remote_output_path}.xml ~/.cerno/artifacts/")
                 print(f"  cerno import nmap ~/.cerno/artifacts/{fname}.xml")
                 print()
@@ -1366,32 +1791,32 @@ def run_tool_workflow(
         artifact_note = result.artifact_note
         nxc_relay_path = result.relay_path
 
+        # String form used for review, clipboard and execution log;
+        # list commands are shell-quoted so the copied text can be pasted as-is
+        display_cmd_str = (
+            display_cmd if isinstance(display_cmd, str)
+            else shlex.join(str(x) for x in display_cmd)
+        )
+
         # Extract NSE scripts from command if it's nmap
-        nse_scripts_list = None
-        if tool_choice == "nmap" and isinstance(display_cmd, str):
-            # Try to extract script names from command
-            import re
-            script_match = re.search(r'--script[= ]([^\s]+)', display_cmd)
-            if script_match:
-                nse_scripts_list = script_match.group(1).split(',')
+        nse_scripts_list = _nse_scripts_from_cmd(display_cmd) if tool_choice == "nmap" else None
 
         action = command_review_menu(
-            display_cmd,
+            display_cmd_str,
             ctx=ctx,
             tool_name=selected_tool.name if selected_tool else tool_choice,
             nse_scripts=nse_scripts_list
         )
 
         if action == "copy":
-            cmd_str = display_cmd if isinstance(display_cmd, str) else " ".join(display_cmd)
-            if copy_to_clipboard(cmd_str)[0]:
+            if copy_to_clipboard(display_cmd_str)[0]:
                 ok("Command copied to clipboard.")
             else:
                 warn(
                     "Could not copy to clipboard automatically. "
                     "Here it is to copy manually:"
                 )
-                _console_global.print(cmd_str)
+                _console.print(display_cmd_str, markup=False, highlight=False, soft_wrap=True)
 
         elif action == "run":
 
@@ -1401,25 +1826,24 @@ def run_tool_workflow(
                 # Execute command and capture metadata
                 if isinstance(cmd, list):
                     exec_metadata = run_command_with_progress(cmd, shell=False, proxy_config=proxy_config)
+                elif (argv := _direct_argv(cmd)) is not None:
+                    # Plain command: skip the intermediate shell process
+                    exec_metadata = run_command_with_progress(argv, shell=False, proxy_config=proxy_config)
                 else:
-                    shell_exec = shutil.which("bash") or shutil.which("sh")
+                    shell_exec = _get_shell()
                     exec_metadata = run_command_with_progress(cmd, shell=True, executable=shell_exec, proxy_config=proxy_config)
 
-                # Log execution to database
-                cmd_str = display_cmd if isinstance(display_cmd, str) else " ".join(str(x) for x in display_cmd)
-
                 # Count hosts for metadata
                 host_count = None
                 try:
                     if tcp_ips.exists():
-                        with open(tcp_ips) as f:
-                            host_count = sum(1 for _ in f)
+                        host_count = _count_lines(tcp_ips)
                 except Exception:
                     pass
 
                 execution_id = log_tool_execution(
                     tool_name=selected_tool.name,
-                    command_text=cmd_str,
+                    command_text=display_cmd_str,
                     execution_metadata=exec_metadata,
                     tool_protocol=getattr(selected_tool, 'protocol', None),
                     host_count=host_count,
@@ -1446,74 +1870,17 @@ def run_tool_workflow(
 
         # Show post-execution summary if command was run
         if action == "run" and 'exec_metadata' in locals():
-
-            from rich.panel import Panel
-            from rich.text import Text
-
-            summary = Text()
-
-            # Duration
-            if exec_metadata and hasattr(exec_metadata, 'duration_seconds'):
-                duration = exec_metadata.duration_seconds
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                if minutes > 0:
-                    duration_str = f"{minutes}m {seconds}s"
-                else:
-                    duration_str = f"{seconds}s"
-                summary.append("Duration: ", style="cyan")
-                summary.append(f"{duration_str}\n", style="yellow")
-
-            # Exit code
-            if exec_metadata and hasattr(exec_metadata, 'exit_code'):
-                exit_code = exec_metadata.exit_code
-                summary.append("Exit code: ", style="cyan")
-                if exit_code == 0:
-                    summary.append(f"{exit_code} (success)\n", style="green")
-                else:
-                    summary.append(f"{exit_code} (error)\n", style="red")
-
-            # Count generated files in results directory
-            file_count = 0
-            total_size = 0
-            generated_files: list[str] = []
-            if results_dir and results_dir.exists():
-                for file in results_dir.rglob('*'):
-                    if file.is_file():
-                        file_count += 1
-                        total_size += file.stat().st_size
-                        # Show first 4 files as examples
-                        if len(generated_files) < 4:
-                            generated_files.append(f"  - {file.name}")
-
-            if file_count > 0:
-                size_kb = total_size / 1024
-                if size_kb < 1024:
-                    size_str = f"{size_kb:.1f} KB"
-                else:
-                    size_str = f"{size_kb/1024:.1f} MB"
-
-                summary.append("Files generated: ", style="cyan")
-                summary.append(f"{file_count} ({size_str} total)\n", style="yellow")
-
-                for file_line in generated_files:
-                    summary.append(f"{file_line}\n", style="dim")
-
-                if file_count > len(generated_files):
-                    summary.append(f"  ... and {file_count - len(generated_files)} more\n", style="dim")
-
-            # Results directory location
-            summary.append("\nResults directory: ", style="cyan")
-            summary.append(f"{results_dir}", style="yellow")
-
-            panel = Panel(
-                summary,
-                title="[bold green]Execution Complete[/]",
-                border_style="green"
-            )
-            _console.print()
-            _console.print(panel)
-            _console.print()
+            summary = _build_execution_summary(exec_metadata, results_dir)
+            # Nothing to report: skip the empty panel
+            if summary is not None:
+                panel = Panel(
+                    summary,
+                    title="[bold green]Execution Complete[/]",
+                    border_style="green"
+                )
+                _console.print()
+                _console.print(panel)
+                _console.print()
 
         # Legacy artifacts section (kept for workspace info)
         header("Workspace Files")
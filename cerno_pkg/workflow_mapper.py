@@ -8,6 +8,9 @@ import yaml
 from .ansi import warn
 from .logging_setup import log_error
 
+# LibYAML-backed safe loader when PyYAML was built with it; same safe tag set
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class WorkflowStep:
@@ -98,7 +101,7 @@ class WorkflowMapper:
             self._last_mtime = self.yaml_path.stat().st_mtime
 
             with open(self.yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlSafeLoader)
 
             if not data or "workflows" not in data:
                 return
@@ -210,7 +213,8 @@ class WorkflowMapper:
         Returns:
             Number of distinct workflows
         """
-        return len(self.get_all_workflows())
+        # Same dedup key as get_all_workflows(), without building and sorting the list
+        return len({workflow.workflow_name for workflow in self.workflows.values()})
 
     def load_additional_workflows(self, yaml_path: Path) -> int:
         """
@@ -231,7 +235,7 @@ class WorkflowMapper:
 
         try:
             with open(yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlSafeLoader)
 
             if not data or "workflows" not in data:
                 return 0
@@ -208,7 +208,10 @@ CREATE TABLE IF NOT EXISTS finding_affected_hosts (
 );
 
 CREATE INDEX IF NOT EXISTS idx_fah_file ON finding_affected_hosts(finding_id);
-CREATE INDEX IF NOT EXISTS idx_fah_host ON finding_affected_hosts(host_id);
+-- Covering index for host -> findings lookups (cross-scan host history);
+-- its host_id prefix also serves host_id-only lookups, replacing idx_fah_host
+CREATE INDEX IF NOT EXISTS idx_fah_host_finding ON finding_affected_hosts(host_id, finding_id);
+DROP INDEX IF EXISTS idx_fah_host;
 CREATE INDEX IF NOT EXISTS idx_fah_port ON finding_affected_hosts(port_number);
 
 -- ============================================================================
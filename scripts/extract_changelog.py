@@ -17,6 +17,23 @@ import re
 import sys
 from pathlib import Path
 
+# Any version header at the start of a line: ## [X.Y.Z]
+NEXT_VERSION_RE = re.compile(r"## \[\d+\.\d+\.\d+\]")
+VERSION_LIST_RE = re.compile(r"## \[(\d+\.\d+\.\d+)\]")
+
+
+def version_header_re(version: str) -> re.Pattern[str]:
+    """
+    Compile the header pattern for one version: ## [version] - YYYY-MM-DD
+
+    Args:
+        version: Version string (e.g., "1.0.1")
+
+    Returns:
+        Compiled pattern matching that version's section header
+    """
+    return re.compile(rf"## \[{re.escape(version)}\] - \d{{4}}-\d{{2}}-\d{{2}}")
+
 
 def extract_changelog_section(changelog_path: Path, version: str) -> str:
     """
@@ -36,46 +53,54 @@ def extract_changelog_section(changelog_path: Path, version: str) -> str:
     if not changelog_path.exists():
         raise FileNotFoundError(f"CHANGELOG.md not found at {changelog_path}")
 
-    content = changelog_path.read_text(encoding="utf-8")
-
-    # Pattern matches: ## [version] - YYYY-MM-DD
-    # Example: ## [1.0.1] - 2026-01-09
-    version_pattern = rf"## \[{re.escape(version)}\] - \d{{4}}-\d{{2}}-\d{{2}}"
-
-    # Find the start of this version's section
-    version_match = re.search(version_pattern, content)
-    if not version_match:
+    header_re = version_header_re(version)
+    section_lines: list[str] = []
+    found = False
+
+    # Single pass over lines: only the requested section is kept in memory
+    with changelog_path.open(encoding="utf-8") as f:
+        for line in f:
+            if not found:
+                # Find the start of this version's section
+                # Example: ## [1.0.1] - 2026-01-09
+                header_match = header_re.match(line)
+                if header_match:
+                    found = True
+                    section_lines.append(line[header_match.end():].rstrip("\n"))
+                continue
+
+            # Stop at the next version header (or end of file)
+            if NEXT_VERSION_RE.match(line):
+                break
+            section_lines.append(line.rstrip("\n"))
+
+    if not found:
         raise ValueError(
             f"Version [{version}] not found in CHANGELOG.md. "
             f"Expected format: ## [{version}] - YYYY-MM-DD"
         )
 
-    start_pos = version_match.end()
+    # Remove leading/trailing blank lines and surrounding whitespace
+    return "\n".join(section_lines).strip()
 
-    # Find the next version header (or end of file)
-    # Pattern matches any version header: ## [X.Y.Z]
-    next_version_pattern = r"\n## \[\d+\.\d+\.\d+\]"
-    next_match = re.search(next_version_pattern, content[start_pos:])
 
-    if next_match:
-        # Extract content between this version and next version
-        end_pos = start_pos + next_match.start()
-        section_content = content[start_pos:end_pos]
-    else:
-        # This is the last version, extract to end of file
-        section_content = content[start_pos:]
-
-    # Clean up the extracted content
-    section_content = section_content.strip()
+def list_versions(changelog_path: Path) -> list[str]:
+    """
+    List all released versions in CHANGELOG.md, in file order.
 
-    # Remove leading/trailing blank lines
-    lines = section_content.split("\n")
-    while lines and not lines[0].strip():
-        lines.pop(0)
-    while lines and not lines[-1].strip():
-        lines.pop()
+    Args:
+        changelog_path: Path to CHANGELOG.md file
 
-    return "\n".join(lines)
+    Returns:
+        Version strings (e.g., ["1.0.1", "1.0.0"])
+    """
+    versions: list[str] = []
+    with changelog_path.open(encoding="utf-8") as f:
+        for line in f:
+            match = VERSION_LIST_RE.match(line)
+            if match:
+                versions.append(match.group(1))
+    return versions
 
 
 def main():
@@ -111,9 +136,7 @@ def main():
 
         # Show available versions to help user
         if changelog_path.exists():
-            content = changelog_path.read_text(encoding="utf-8")
-            versions = re.findall(r"## \[(\d+\.\d+\.\d+)\]", content)
-            for v in versions:
+            for v in list_versions(changelog_path):
                 print(f"  - {v}", file=sys.stderr)
 
         sys.exit(1)
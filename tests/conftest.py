@@ -1,34 +1,29 @@
 """Pytest configuration and shared fixtures for cerno tests."""
 
 import sqlite3
-import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 
 import pytest
 
 
-@pytest.fixture
-def temp_db() -> Generator[sqlite3.Connection, None, None]:
-    """Create an in-memory SQLite database for testing.
+@pytest.fixture(scope="session")
+def _schema_template() -> bytes:
+    """Build the cerno schema once per session and freeze it as a page image.
 
-    Yields:
-        sqlite3.Connection: In-memory database connection with schema initialized
+    ``temp_db`` loads this with ``Connection.deserialize()`` so each test gets
+    a fresh copy without re-running the DDL.
+
+    Returns:
+        bytes: Serialized in-memory database with schema and seed rows
     """
     from cerno_pkg.database import SCHEMA_SQL_TABLES, SCHEMA_SQL_VIEWS
 
-    # Use in-memory database
     conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-
-    # Initialize schema using production schema (single source of truth)
-    conn.execute("PRAGMA foreign_keys=ON")
-    conn.execute("PRAGMA journal_mode=WAL")
 
     # Execute base schema - disable foreign keys temporarily for executescript
     conn.execute("PRAGMA foreign_keys=OFF")
     conn.executescript(SCHEMA_SQL_TABLES)
-    conn.execute("PRAGMA foreign_keys=ON")
 
     # Populate foundation tables
     conn.executemany(
@@ -56,6 +51,50 @@ def temp_db() -> Generator[sqlite3.Connection, None, None]:
     conn.executescript(SCHEMA_SQL_VIEWS)
 
     conn.commit()
+    image = conn.serialize()
+    conn.close()
+    return image
+
+
+def _load_db_image(image: bytes) -> sqlite3.Connection:
+    """Open an in-memory connection loaded from a serialized database image.
+
+    Args:
+        image: Page image from sqlite3.Connection.serialize()
+
+    Returns:
+        sqlite3.Connection with Row factory and per-connection PRAGMAs set
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(image)
+    conn.row_factory = sqlite3.Row
+
+    # PRAGMAs are per-connection and are not part of the serialized image.
+    # Journal and sync settings are moot in memory; keep sort/temp b-trees off disk.
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+@pytest.fixture(scope="session")
+def db_image_loader() -> Callable[[bytes], sqlite3.Connection]:
+    """Open in-memory connections from serialized database images.
+
+    Returns:
+        _load_db_image, for fixtures that build their own database images
+    """
+    return _load_db_image
+
+
+@pytest.fixture
+def temp_db(_schema_template: bytes) -> Generator[sqlite3.Connection, None, None]:
+    """Create an in-memory SQLite database for testing.
+
+    Yields:
+        sqlite3.Connection: In-memory database connection with schema initialized
+    """
+    # Use in-memory database, loaded from the session template's page image
+    conn = _load_db_image(_schema_template)
 
     yield conn
 
@@ -63,14 +102,16 @@ def temp_db() -> Generator[sqlite3.Connection, None, None]:
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for test files.
 
-    Yields:
+    Alias for pytest's numbered ``tmp_path`` so cleanup is deferred to
+    pytest's retention policy instead of an rmtree per test.
+
+    Returns:
         Path: Temporary directory path
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -0,0 +1,42 @@
+"""Tests for cerno_pkg.config module."""
+
+import pytest
+
+
+class TestLoadConfigCache:
+    """Tests for load_config parse caching."""
+
+    @pytest.mark.unit
+    def test_repeated_loads_parse_once(self, tmp_path, monkeypatch):
+        """Verify repeated loads parse the config file once."""
+        from cerno_pkg import config as config_module
+        monkeypatch.setattr("cerno_pkg.config.get_config_path", lambda: tmp_path / "config.yaml")
+        config_module.save_config(config_module.CernoConfig(default_tool="nmap"))
+
+        parses = []
+        real_parse = config_module._parse_config_file
+
+        def _counting_parse(path):
+            parses.append(path)
+            return real_parse(path)
+
+        monkeypatch.setattr(config_module, "_parse_config_file", _counting_parse)
+
+        first = config_module.load_config()
+        second = config_module.load_config()
+
+        assert len(parses) == 1
+        assert first.default_tool == second.default_tool == "nmap"
+        # Callers get independent copies
+        first.default_tool = "custom"
+        assert config_module.load_config().default_tool == "nmap"
+
+    @pytest.mark.unit
+    def test_save_invalidates_cache(self, tmp_path, monkeypatch):
+        """Verify saving the config refreshes the cached copy."""
+        from cerno_pkg.config import CernoConfig, save_config, load_config
+        monkeypatch.setattr("cerno_pkg.config.get_config_path", lambda: tmp_path / "config.yaml")
+        save_config(CernoConfig(default_tool="nmap"))
+        assert load_config().default_tool == "nmap"
+        save_config(CernoConfig(default_tool="custom"))
+        assert load_config().default_tool == "custom"
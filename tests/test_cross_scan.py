@@ -10,7 +10,29 @@ from cerno_pkg.cross_scan import (
     HostVulnerabilityHistory,
     ScanSnapshot,
 )
-from cerno_pkg.models import Scan, Plugin, Finding, Host
+from cerno_pkg.models import Scan
+
+
+# Fixture SQL as constants: sqlite3's statement cache is keyed on the exact
+# SQL string, so each statement is prepared once per connection
+_SQL_INSERT_PLUGIN = (
+    "INSERT OR REPLACE INTO plugins (plugin_id, plugin_name, severity_int) VALUES (?, ?, ?)"
+)
+_SQL_INSERT_FINDING = "INSERT INTO findings (scan_id, plugin_id) VALUES (?, ?)"
+_SQL_UPSERT_HOST = """
+    INSERT INTO hosts (ip_address, scan_target, scan_target_type)
+    VALUES (?, ?, 'ipv4')
+    ON CONFLICT (ip_address, scan_target) DO UPDATE SET last_seen = CURRENT_TIMESTAMP
+"""
+# Link hosts to findings, resolving both ids in SQL
+_SQL_INSERT_FAH = """
+    INSERT OR IGNORE INTO finding_affected_hosts
+    (finding_id, host_id, port_number, plugin_output)
+    SELECT f.finding_id, h.host_id, NULL, 'Test output'
+    FROM findings f, hosts h
+    WHERE f.scan_id = ? AND f.plugin_id = ?
+      AND h.ip_address = ? AND h.scan_target = ?
+"""
 
 
 def _create_test_scan(conn, scan_name: str, plugins_data: list[dict]) -> int:
@@ -29,44 +51,62 @@ def _create_test_scan(conn, scan_name: str, plugins_data: list[dict]) -> int:
     scan_id = scan.save(conn)
     assert scan_id is not None
 
-    for pd in plugins_data:
-        # Create or get plugin
-        plugin = Plugin(
-            plugin_id=pd["plugin_id"],
-            plugin_name=pd["plugin_name"],
-            severity_int=pd["severity_int"],
-        )
-        plugin.save(conn)
-
-        # Create finding
-        finding = Finding(scan_id=scan_id, plugin_id=pd["plugin_id"])
-        finding_id = finding.save(conn)
-        assert finding_id is not None
-
-        # Create hosts and link to finding
-        for host_ip in pd.get("hosts", []):
-            # Get or create host
-            host_id = Host.get_or_create(
-                ip_address=host_ip,
-                scan_target=host_ip,
-                scan_target_type="ipv4",
-                conn=conn,
-            )
-
-            # Link host to finding
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO finding_affected_hosts
-                (finding_id, host_id, port_number, plugin_output)
-                VALUES (?, ?, NULL, 'Test output')
-                """,
-                (finding_id, host_id),
-            )
+    # Batch the rows the Plugin/Finding/Host models would write one at a time
+    conn.executemany(
+        _SQL_INSERT_PLUGIN,
+        [(pd["plugin_id"], pd["plugin_name"], pd["severity_int"]) for pd in plugins_data],
+    )
+    conn.executemany(_SQL_INSERT_FINDING, [(scan_id, pd["plugin_id"]) for pd in plugins_data])
+
+    links = [(pd["plugin_id"], host_ip) for pd in plugins_data for host_ip in pd.get("hosts", [])]
+    conn.executemany(
+        _SQL_UPSERT_HOST,
+        [(host_ip, host_ip) for host_ip in dict.fromkeys(ip for _, ip in links)],
+    )
+    conn.executemany(
+        _SQL_INSERT_FAH,
+        [(scan_id, plugin_id, host_ip, host_ip) for plugin_id, host_ip in links],
+    )
 
     conn.commit()
     return scan_id
 
 
+@pytest.fixture(scope="session")
+def _compare_scan_template(_schema_template, db_image_loader):
+    """Build the plugin 100/101/102 comparison scans once per session.
+
+    Returns:
+        Tuple of (serialized database, {scan_name: scan_id})
+    """
+    conn = db_image_loader(_schema_template)
+
+    two = [
+        {"plugin_id": 100, "plugin_name": "Low Plugin", "severity_int": 1, "hosts": ["192.168.1.1"]},
+        {"plugin_id": 101, "plugin_name": "Medium Plugin", "severity_int": 2, "hosts": ["192.168.1.1"]},
+    ]
+    three = two + [
+        {"plugin_id": 102, "plugin_name": "High Plugin", "severity_int": 3, "hosts": ["192.168.1.1"]},
+    ]
+    scan_ids = {
+        "two_plugins": _create_test_scan(conn, "two_plugins", two),
+        "three_plugins": _create_test_scan(conn, "three_plugins", three),
+        "three_plugins_rescan": _create_test_scan(conn, "three_plugins_rescan", three),
+    }
+    image = conn.serialize()
+    conn.close()
+    return image, scan_ids
+
+
+@pytest.fixture
+def compare_db(_compare_scan_template, db_image_loader):
+    """Per-test copy of the comparison scans database."""
+    image, scan_ids = _compare_scan_template
+    conn = db_image_loader(image)
+    yield conn, scan_ids
+    conn.close()
+
+
 class TestCompareScan:
     """Tests for compare_scans function."""
 
@@ -88,107 +128,42 @@ class TestCompareScan:
         assert result.total_resolved == 0
         assert result.total_persistent == 2
 
-    def test_compare_finds_new_findings(self, temp_db):
-        """New findings in scan2 detected correctly."""
-        # Scan 1: plugins 100, 101
-        scan1_id = _create_test_scan(
-            temp_db,
-            "scan1",
-            [
-                {"plugin_id": 100, "plugin_name": "Plugin A", "severity_int": 3, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 101, "plugin_name": "Plugin B", "severity_int": 2, "hosts": ["192.168.1.1"]},
-            ],
+    @pytest.mark.parametrize(
+        "baseline, current, min_severity, expected_new, expected_resolved, expected_persistent",
+        [
+            # Plugin 102 appears in the current scan
+            ("two_plugins", "three_plugins", 0, {102}, set(), {100, 101}),
+            # Plugin 102 is gone from the current scan
+            ("three_plugins", "two_plugins", 0, set(), {102}, {100, 101}),
+            # Filter to High and above (severity >= 3)
+            ("three_plugins", "three_plugins_rescan", 3, set(), set(), {102}),
+        ],
+        ids=["new_findings", "resolved_findings", "severity_filter"],
+    )
+    def test_compare_plugin_changes(
+        self,
+        compare_db,
+        baseline,
+        current,
+        min_severity,
+        expected_new,
+        expected_resolved,
+        expected_persistent,
+    ):
+        """New, resolved, and persistent findings split correctly by plugin presence."""
+        conn, scan_ids = compare_db
+
+        result = compare_scans(
+            scan_ids[baseline], scan_ids[current], min_severity=min_severity, conn=conn
         )
 
-        # Scan 2: plugins 100, 101, 102 (102 is new)
-        scan2_id = _create_test_scan(
-            temp_db,
-            "scan2",
-            [
-                {"plugin_id": 100, "plugin_name": "Plugin A", "severity_int": 3, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 101, "plugin_name": "Plugin B", "severity_int": 2, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 102, "plugin_name": "Plugin C", "severity_int": 4, "hosts": ["192.168.1.1"]},
-            ],
-        )
-
-        result = compare_scans(scan1_id, scan2_id, conn=temp_db)
-
-        assert result is not None
-        assert result.total_new == 1
-        assert result.total_resolved == 0
-        assert result.total_persistent == 2
-
-        # Check the new finding
-        new_plugin_ids = [f["plugin_id"] for f in result.new_findings]
-        assert 102 in new_plugin_ids
-
-    def test_compare_finds_resolved_findings(self, temp_db):
-        """Resolved findings (in scan1 only) detected correctly."""
-        # Scan 1: plugins 100, 101, 102
-        scan1_id = _create_test_scan(
-            temp_db,
-            "scan1",
-            [
-                {"plugin_id": 100, "plugin_name": "Plugin A", "severity_int": 3, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 101, "plugin_name": "Plugin B", "severity_int": 2, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 102, "plugin_name": "Plugin C", "severity_int": 4, "hosts": ["192.168.1.1"]},
-            ],
-        )
-
-        # Scan 2: plugins 100, 101 (102 is resolved)
-        scan2_id = _create_test_scan(
-            temp_db,
-            "scan2",
-            [
-                {"plugin_id": 100, "plugin_name": "Plugin A", "severity_int": 3, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 101, "plugin_name": "Plugin B", "severity_int": 2, "hosts": ["192.168.1.1"]},
-            ],
-        )
-
-        result = compare_scans(scan1_id, scan2_id, conn=temp_db)
-
-        assert result is not None
-        assert result.total_new == 0
-        assert result.total_resolved == 1
-        assert result.total_persistent == 2
-
-        # Check the resolved finding
-        resolved_plugin_ids = [f["plugin_id"] for f in result.resolved_findings]
-        assert 102 in resolved_plugin_ids
-
-    def test_compare_severity_filter(self, temp_db):
-        """Minimum severity filter works correctly."""
-        # Scan 1: plugins at various severities
-        scan1_id = _create_test_scan(
-            temp_db,
-            "scan1",
-            [
-                {"plugin_id": 100, "plugin_name": "Low Plugin", "severity_int": 1, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 101, "plugin_name": "Medium Plugin", "severity_int": 2, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 102, "plugin_name": "High Plugin", "severity_int": 3, "hosts": ["192.168.1.1"]},
-            ],
-        )
-
-        # Scan 2: same plugins
-        scan2_id = _create_test_scan(
-            temp_db,
-            "scan2",
-            [
-                {"plugin_id": 100, "plugin_name": "Low Plugin", "severity_int": 1, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 101, "plugin_name": "Medium Plugin", "severity_int": 2, "hosts": ["192.168.1.1"]},
-                {"plugin_id": 102, "plugin_name": "High Plugin", "severity_int": 3, "hosts": ["192.168.1.1"]},
-            ],
-        )
-
-        # Filter to High and above (severity >= 3)
-        result = compare_scans(scan1_id, scan2_id, min_severity=3, conn=temp_db)
-
         assert result is not None
-        assert result.total_persistent == 1  # Only the High plugin
-        persistent_plugin_ids = [f["plugin_id"] for f in result.persistent_findings]
-        assert 102 in persistent_plugin_ids
-        assert 100 not in persistent_plugin_ids
-        assert 101 not in persistent_plugin_ids
+        assert {f["plugin_id"] for f in result.new_findings} == expected_new
+        assert {f["plugin_id"] for f in result.resolved_findings} == expected_resolved
+        assert {f["plugin_id"] for f in result.persistent_findings} == expected_persistent
+        assert result.total_new == len(expected_new)
+        assert result.total_resolved == len(expected_resolved)
+        assert result.total_persistent == len(expected_persistent)
 
     def test_compare_host_changes(self, temp_db):
         """Host changes detected correctly."""
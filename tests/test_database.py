@@ -161,6 +161,44 @@ class TestSchemaInitialization:
 
         conn.close()
 
+    def test_host_history_join_uses_covering_index(self, temp_db):
+        """Test that host -> findings lookups don't read finding_affected_hosts rows."""
+        plan = temp_db.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT DISTINCT f.scan_id, f.plugin_id
+            FROM findings f
+            JOIN finding_affected_hosts fah ON f.finding_id = fah.finding_id
+            JOIN hosts h ON fah.host_id = h.host_id
+            WHERE h.ip_address = ?
+            """,
+            ("192.168.1.1",),
+        ).fetchall()
+        details = [row["detail"] for row in plan]
+
+        assert any("COVERING INDEX idx_fah_host_finding" in d for d in details)
+
+    def test_redundant_host_index_dropped(self, temp_dir):
+        """Test that re-initializing an existing database drops idx_fah_host."""
+        db_path = temp_dir / "test.db"
+        initialize_database(db_path)
+        conn = get_connection(db_path)
+        conn.execute("CREATE INDEX idx_fah_host ON finding_affected_hosts(host_id)")
+        conn.commit()
+        conn.close()
+
+        initialize_database(db_path)
+
+        conn = get_connection(db_path)
+        names = {
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='finding_affected_hosts'"
+            )
+        }
+        conn.close()
+        assert "idx_fah_host" not in names
+        assert "idx_fah_host_finding" in names
+
 
 class TestForeignKeyConstraints:
     """Tests for foreign key constraint enforcement."""
@@ -247,6 +285,16 @@ class TestComputeFileHash:
         expected = "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
         assert hash_value == expected
 
+    def test_large_file_matches_in_memory_hash(self, temp_dir):
+        """Test that a file spanning many read buffers hashes like its bytes."""
+        import hashlib
+
+        data = bytes(range(256)) * 4099  # ~1 MB, not a multiple of the buffer size
+        test_file = temp_dir / "large.bin"
+        test_file.write_bytes(data)
+
+        assert compute_file_hash(test_file) == hashlib.sha256(data).hexdigest()
+
     def test_nonexistent_file(self, temp_dir):
         """Test handling of nonexistent file."""
         nonexistent = temp_dir / "nonexistent.txt"
@@ -8,6 +8,7 @@ from cerno_pkg.fs import (
     build_results_paths,
     pretty_severity_label,
     default_page_size,
+    run_output_base,
     write_work_files,
 )
 
@@ -99,6 +100,19 @@ class TestBuildResultsPaths:
         assert output_dir.is_dir()
 
 
+class TestRunOutputBase:
+    """Tests for run_output_base function."""
+
+    def test_run_output_base_is_timestamped_child(self, temp_dir):
+        """Test that the run base sits in the results directory without creating it."""
+        output_base = run_output_base(temp_dir / "results")
+
+        assert output_base.parent == temp_dir / "results"
+        assert output_base.name.startswith("run-")
+        assert len(output_base.name.split("-")) == 3  # run-YYYYMMDD-HHMMSS
+        assert not output_base.parent.exists()
+
+
 class TestPrettySeverityLabel:
     """Tests for pretty_severity_label function."""
 
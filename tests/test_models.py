@@ -9,6 +9,7 @@ from cerno_pkg.models import (
     Scan,
     Plugin,
     Finding,
+    Host,
     ToolExecution,
     Artifact,
     now_iso,
@@ -855,6 +856,27 @@ class TestArtifactModel:
         assert metadata == {"scan_type": "SYN", "hosts_up": 5}
 
 
+class TestHostModel:
+    """Tests for Host model."""
+
+    @pytest.mark.parametrize("upsert", [True, False], ids=["upsert", "select_insert"])
+    def test_get_or_create_reuses_and_refreshes(self, temp_db, monkeypatch, upsert):
+        """Test existing hosts keep their id and gain new metadata."""
+        import cerno_pkg.models as models
+        monkeypatch.setattr(models, "_HAS_UPSERT_RETURNING", upsert)
+
+        host_id = Host.get_or_create("10.0.0.5", "10.0.0.5", "ipv4", fqdn="a.example", conn=temp_db)
+        again = Host.get_or_create("10.0.0.5", "10.0.0.5", "ipv4", netbios_name="HOST5", conn=temp_db)
+        other = Host.get_or_create("10.0.0.6", "10.0.0.6", "ipv4", conn=temp_db)
+
+        assert again == host_id
+        assert other != host_id
+        row = temp_db.execute(
+            "SELECT netbios_name, fqdn FROM hosts WHERE host_id = ?", (host_id,)
+        ).fetchone()
+        assert (row["netbios_name"], row["fqdn"]) == ("HOST5", "a.example")
+
+
 class TestTimestampFunctions:
     """Tests for timestamp helper functions."""
 
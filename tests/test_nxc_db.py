@@ -6,6 +6,7 @@ NetExec protocol databases to enrich Cerno finding displays.
 
 from __future__ import annotations
 
+import shutil
 import sqlite3
 from pathlib import Path
 from typing import Generator
@@ -29,7 +30,15 @@ from cerno_pkg.nxc_db import (
 # =============================================================================
 
 
-@pytest.fixture
+# Fixture databases are throwaway: skip the journal file and fsyncs while building
+_THROWAWAY_DB_PRAGMAS = """
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+"""
+
+
+@pytest.fixture(scope="session")
 def nxc_fixtures_path() -> Path:
     """Path to the NetExec test fixtures directory."""
     return Path(__file__).parent / "fixtures" / "nxc"
@@ -43,11 +52,12 @@ def temp_nxc_workspace(tmp_path: Path) -> Path:
     return workspace
 
 
-@pytest.fixture
-def populated_smb_db(temp_nxc_workspace: Path) -> Path:
-    """Create an SMB database with test data."""
-    db_path = temp_nxc_workspace / "smb.db"
+@pytest.fixture(scope="session")
+def _smb_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the SMB test database once per session."""
+    db_path = tmp_path_factory.mktemp("nxc_templates") / "smb.db"
     conn = sqlite3.connect(db_path)
+    conn.executescript(_THROWAWAY_DB_PRAGMAS)
 
     # Create tables matching NetExec SMB schema
     conn.executescript("""
@@ -101,28 +111,25 @@ def populated_smb_db(temp_nxc_workspace: Path) -> Path:
         );
     """)
 
-    # Insert test data
-    # Host 1: DC01 - has vulnerabilities
-    conn.execute("""
-        INSERT INTO hosts (id, ip, hostname, domain, os, smbv1, signing, zerologon, petitpotam)
-        VALUES (1, '192.168.1.10', 'DC01', 'CORP.LOCAL', 'Windows Server 2019', 0, 0, 1, 1)
-    """)
-
-    # Host 2: WEB01 - no vulnerabilities
-    conn.execute("""
-        INSERT INTO hosts (id, ip, hostname, domain, os, smbv1, signing, zerologon, petitpotam)
-        VALUES (2, '192.168.1.20', 'WEB01', 'CORP.LOCAL', 'Windows Server 2016', 0, 1, 0, 0)
-    """)
+    # Insert test data, one executemany per table
+    # Host 1: DC01 - has vulnerabilities; Host 2: WEB01 - no vulnerabilities
+    conn.executemany(
+        "INSERT INTO hosts (id, ip, hostname, domain, os, smbv1, signing, zerologon, petitpotam)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (1, "192.168.1.10", "DC01", "CORP.LOCAL", "Windows Server 2019", 0, 0, 1, 1),
+            (2, "192.168.1.20", "WEB01", "CORP.LOCAL", "Windows Server 2016", 0, 1, 0, 0),
+        ],
+    )
 
     # Users
-    conn.execute("""
-        INSERT INTO users (id, domain, username, password, credtype)
-        VALUES (1, 'CORP', 'admin', 'e3b0c44298fc1c149afbf4c8996fb924', 'hash')
-    """)
-    conn.execute("""
-        INSERT INTO users (id, domain, username, password, credtype)
-        VALUES (2, 'CORP', 'svc_backup', 'password123', 'plaintext')
-    """)
+    conn.executemany(
+        "INSERT INTO users (id, domain, username, password, credtype) VALUES (?, ?, ?, ?, ?)",
+        [
+            (1, "CORP", "admin", "e3b0c44298fc1c149afbf4c8996fb924", "hash"),
+            (2, "CORP", "svc_backup", "password123", "plaintext"),
+        ],
+    )
 
     # Admin relations - admin has admin on DC01
     conn.execute("INSERT INTO admin_relations (id, userid, hostid) VALUES (1, 1, 1)")
@@ -131,18 +138,14 @@ def populated_smb_db(temp_nxc_workspace: Path) -> Path:
     conn.execute("INSERT INTO loggedin_relations (id, userid, hostid) VALUES (1, 2, 2)")
 
     # Shares
-    conn.execute("""
-        INSERT INTO shares (id, hostid, name, read, write)
-        VALUES (1, 1, 'C$', 1, 1)
-    """)
-    conn.execute("""
-        INSERT INTO shares (id, hostid, name, read, write)
-        VALUES (2, 1, 'ADMIN$', 1, 0)
-    """)
-    conn.execute("""
-        INSERT INTO shares (id, hostid, name, read, write)
-        VALUES (3, 1, 'SYSVOL', 1, 0)
-    """)
+    conn.executemany(
+        "INSERT INTO shares (id, hostid, name, read, write) VALUES (?, ?, ?, ?, ?)",
+        [
+            (1, 1, "C$", 1, 1),
+            (2, 1, "ADMIN$", 1, 0),
+            (3, 1, "SYSVOL", 1, 0),
+        ],
+    )
 
     conn.commit()
     conn.close()
@@ -150,10 +153,19 @@ def populated_smb_db(temp_nxc_workspace: Path) -> Path:
 
 
 @pytest.fixture
-def populated_ssh_db(temp_nxc_workspace: Path) -> Path:
-    """Create an SSH database with test data."""
-    db_path = temp_nxc_workspace / "ssh.db"
+def populated_smb_db(temp_nxc_workspace: Path, _smb_template: Path) -> Path:
+    """Create an SMB database with test data."""
+    db_path = temp_nxc_workspace / "smb.db"
+    shutil.copyfile(_smb_template, db_path)
+    return db_path
+
+
+@pytest.fixture(scope="session")
+def _ssh_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the SSH test database once per session."""
+    db_path = tmp_path_factory.mktemp("nxc_templates") / "ssh.db"
     conn = sqlite3.connect(db_path)
+    conn.executescript(_THROWAWAY_DB_PRAGMAS)
 
     # Create tables matching NetExec SSH schema
     conn.executescript("""
@@ -209,6 +221,21 @@ def populated_ssh_db(temp_nxc_workspace: Path) -> Path:
     return db_path
 
 
+@pytest.fixture
+def populated_ssh_db(temp_nxc_workspace: Path, _ssh_template: Path) -> Path:
+    """Create an SSH database with test data."""
+    db_path = temp_nxc_workspace / "ssh.db"
+    shutil.copyfile(_ssh_template, db_path)
+    return db_path
+
+
+@pytest.fixture
+def smb_mgr(populated_smb_db: Path) -> Generator[NxcDatabaseManager, None, None]:
+    """NxcDatabaseManager over a workspace containing the populated SMB database."""
+    with NxcDatabaseManager(populated_smb_db.parent) as mgr:
+        yield mgr
+
+
 @pytest.fixture(autouse=True)
 def reset_singleton() -> Generator[None, None, None]:
     """Reset the NXC manager singleton before and after each test."""
@@ -234,6 +261,13 @@ class TestNxcDataclasses:
         assert cred.credential_type == "plaintext"
         assert cred.has_admin is False
 
+    def test_nxc_dataclasses_use_slots(self) -> None:
+        """Test enrichment records are slotted (no per-instance __dict__)."""
+        host = NxcHostData(host_address="10.0.0.1")
+        assert not hasattr(host, "__dict__")
+        with pytest.raises(AttributeError):
+            host.unknown_field = 1  # type: ignore[attr-defined]
+
     def test_nxc_credential_full(self) -> None:
         """Test NxcCredential with all arguments."""
         cred = NxcCredential(
@@ -348,6 +382,17 @@ class TestNxcDatabaseManager:
         assert "smb" in protocols
         assert "ssh" in protocols
 
+    def test_connection_reused_and_closed(self, populated_smb_db: Path) -> None:
+        """Test connections are cached per protocol and released on exit."""
+        with NxcDatabaseManager(populated_smb_db.parent) as mgr:
+            conn = mgr._get_connection("smb")
+            assert conn is not None
+            assert mgr._get_connection("smb") is conn
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert mgr._connection_cache == {}
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
 
 # =============================================================================
 # Integration Tests: SMB Database Queries
@@ -357,33 +402,24 @@ class TestNxcDatabaseManager:
 class TestSmbDatabaseQueries:
     """Test SMB database query functionality."""
 
-    def test_query_existing_host(self, populated_smb_db: Path) -> None:
+    def test_query_existing_host(self, smb_mgr: NxcDatabaseManager) -> None:
         """Test querying an existing host returns data."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        result = mgr.get_host_enrichment("192.168.1.10")
+        result = smb_mgr.get_host_enrichment("192.168.1.10")
 
         assert result is not None
         assert result.host_address == "192.168.1.10"
         assert result.hostname == "DC01"
         assert "smb" in result.protocols_seen
 
-    def test_query_nonexistent_host(self, populated_smb_db: Path) -> None:
+    def test_query_nonexistent_host(self, smb_mgr: NxcDatabaseManager) -> None:
         """Test querying a nonexistent host returns None."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        result = mgr.get_host_enrichment("10.0.0.99")
+        result = smb_mgr.get_host_enrichment("10.0.0.99")
 
         assert result is None
 
-    def test_query_host_credentials(self, populated_smb_db: Path) -> None:
+    def test_query_host_credentials(self, smb_mgr: NxcDatabaseManager) -> None:
         """Test that credentials are retrieved for a host."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        result = mgr.get_host_enrichment("192.168.1.10")
+        result = smb_mgr.get_host_enrichment("192.168.1.10")
 
         assert result is not None
         assert len(result.credentials) == 1
@@ -393,12 +429,9 @@ class TestSmbDatabaseQueries:
         assert cred.credential_type == "hash"
         assert cred.has_admin is True
 
-    def test_query_host_shares(self, populated_smb_db: Path) -> None:
+    def test_query_host_shares(self, smb_mgr: NxcDatabaseManager) -> None:
         """Test that shares are retrieved for a host."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        result = mgr.get_host_enrichment("192.168.1.10")
+        result = smb_mgr.get_host_enrichment("192.168.1.10")
 
         assert result is not None
         assert len(result.shares) == 3
@@ -415,12 +448,9 @@ class TestSmbDatabaseQueries:
         assert admin_share.read_access is True
         assert admin_share.write_access is False
 
-    def test_query_host_security_flags(self, populated_smb_db: Path) -> None:
+    def test_query_host_security_flags(self, smb_mgr: NxcDatabaseManager) -> None:
         """Test that security flags are retrieved for a host."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        result = mgr.get_host_enrichment("192.168.1.10")
+        result = smb_mgr.get_host_enrichment("192.168.1.10")
 
         assert result is not None
         assert result.security_flags is not None
@@ -430,6 +460,24 @@ class TestSmbDatabaseQueries:
         assert flags.zerologon_vulnerable is True
         assert flags.petitpotam_vulnerable is True
 
+    def test_query_host_deduplicates_joined_rows(self, populated_smb_db: Path) -> None:
+        """Test that repeated relations and shares don't duplicate results."""
+        conn = sqlite3.connect(populated_smb_db)
+        # admin also logged in twice on DC01; svc_backup logged in on DC01
+        conn.executemany(
+            "INSERT INTO loggedin_relations (userid, hostid) VALUES (?, ?)",
+            [(1, 1), (1, 1), (2, 1)],
+        )
+        conn.commit()
+        conn.close()
+
+        result = NxcDatabaseManager(populated_smb_db.parent).get_host_enrichment("192.168.1.10")
+
+        assert result is not None
+        assert [c.username for c in result.credentials] == ["admin", "svc_backup"]
+        assert [c.has_admin for c in result.credentials] == [True, False]
+        assert [s.name for s in result.shares] == ["C$", "ADMIN$", "SYSVOL"]
+
 
 # =============================================================================
 # Integration Tests: SSH Database Queries
@@ -502,45 +550,41 @@ class TestMultiProtocolQueries:
 class TestBatchEnrichment:
     """Test batch enrichment for multiple hosts."""
 
-    def test_get_hosts_enrichment_all_found(self, populated_smb_db: Path) -> None:
+    def test_get_hosts_enrichment_all_found(self, smb_mgr: NxcDatabaseManager) -> None:
         """Test batch enrichment when all hosts exist."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        summary = mgr.get_hosts_enrichment(["192.168.1.10", "192.168.1.20"])
+        summary = smb_mgr.get_hosts_enrichment(["192.168.1.10", "192.168.1.20"])
 
         assert summary.total_hosts_queried == 2
         assert summary.hosts_with_data == 2
         assert "smb" in summary.protocols_seen
 
-    def test_get_hosts_enrichment_partial(self, populated_smb_db: Path) -> None:
+    def test_get_hosts_enrichment_partial(self, smb_mgr: NxcDatabaseManager) -> None:
         """Test batch enrichment when some hosts don't exist."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        summary = mgr.get_hosts_enrichment(["192.168.1.10", "10.0.0.99", "10.0.0.100"])
+        summary = smb_mgr.get_hosts_enrichment(["192.168.1.10", "10.0.0.99", "10.0.0.100"])
 
         assert summary.total_hosts_queried == 3
         assert summary.hosts_with_data == 1
 
-    def test_get_hosts_enrichment_none_found(self, populated_smb_db: Path) -> None:
-        """Test batch enrichment when no hosts exist."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
+    def test_get_hosts_enrichment_empty_list(self, smb_mgr: NxcDatabaseManager) -> None:
+        """Test an empty host list returns an empty summary without opening databases."""
+        summary = smb_mgr.get_hosts_enrichment([])
 
-        summary = mgr.get_hosts_enrichment(["10.0.0.99", "10.0.0.100"])
+        assert summary.total_hosts_queried == 0
+        assert summary.hosts_with_data == 0
+        assert smb_mgr._connection_cache == {}
+
+    def test_get_hosts_enrichment_none_found(self, smb_mgr: NxcDatabaseManager) -> None:
+        """Test batch enrichment when no hosts exist."""
+        summary = smb_mgr.get_hosts_enrichment(["10.0.0.99", "10.0.0.100"])
 
         assert summary.total_hosts_queried == 2
         assert summary.hosts_with_data == 0
 
     def test_get_hosts_enrichment_security_flag_counts(
-        self, populated_smb_db: Path
+        self, smb_mgr: NxcDatabaseManager
     ) -> None:
         """Test that security flags are counted correctly."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        summary = mgr.get_hosts_enrichment(["192.168.1.10", "192.168.1.20"])
+        summary = smb_mgr.get_hosts_enrichment(["192.168.1.10", "192.168.1.20"])
 
         # DC01 has signing disabled, zerologon, petitpotam
         # WEB01 has signing enabled, no vulnerabilities
@@ -550,23 +594,26 @@ class TestBatchEnrichment:
         assert summary.security_flag_counts.get("petitpotam", 0) == 1
 
     def test_get_hosts_enrichment_unique_credentials(
-        self, populated_smb_db: Path
+        self, smb_mgr: NxcDatabaseManager
     ) -> None:
         """Test that credentials are deduplicated with counts."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
-
-        summary = mgr.get_hosts_enrichment(["192.168.1.10", "192.168.1.20"])
+        summary = smb_mgr.get_hosts_enrichment(["192.168.1.10", "192.168.1.20"])
 
         # Should have 2 unique credentials: admin (on 1 host), svc_backup (on 1 host)
         assert len(summary.unique_credentials) == 2
 
-    def test_get_hosts_enrichment_shares_summary(self, populated_smb_db: Path) -> None:
-        """Test that shares are summarized correctly."""
-        workspace = populated_smb_db.parent
-        mgr = NxcDatabaseManager(workspace)
+    def test_get_hosts_enrichment_unique_credentials_admin_flag(
+        self, smb_mgr: NxcDatabaseManager
+    ) -> None:
+        """Test that admin status is carried onto the deduplicated credential."""
+        summary = smb_mgr.get_hosts_enrichment(["192.168.1.10", "192.168.1.20"])
 
-        summary = mgr.get_hosts_enrichment(["192.168.1.10"])
+        admin_by_user = {cred.username: cred.has_admin for cred, _ in summary.unique_credentials}
+        assert admin_by_user == {"admin": True, "svc_backup": False}
+
+    def test_get_hosts_enrichment_shares_summary(self, smb_mgr: NxcDatabaseManager) -> None:
+        """Test that shares are summarized correctly."""
+        summary = smb_mgr.get_hosts_enrichment(["192.168.1.10"])
 
         # DC01 has C$ (RW), ADMIN$ (R), SYSVOL (R)
         assert "C$" in summary.shares_summary
@@ -575,6 +622,128 @@ class TestBatchEnrichment:
         assert summary.shares_summary["ADMIN$"] == (1, 0)
 
 
+class TestGetHostsData:
+    """Test batched per-host lookups."""
+
+    def test_returns_only_hosts_with_data(
+        self, populated_smb_db: Path, populated_ssh_db: Path
+    ) -> None:
+        """Test that found hosts are keyed by IP and merged across protocols."""
+        mgr = NxcDatabaseManager(populated_smb_db.parent)
+
+        data = mgr.get_hosts_data(["192.168.1.10", "192.168.1.20", "10.0.0.99"])
+
+        assert set(data) == {"192.168.1.10", "192.168.1.20"}
+        assert data["192.168.1.10"].hostname == "DC01"
+        assert sorted(data["192.168.1.20"].protocols_seen) == ["smb", "ssh"]
+
+    def test_chunks_match_single_query(
+        self, smb_mgr: NxcDatabaseManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that splitting the IN clause across queries gives the same result."""
+        import cerno_pkg.nxc_db as nxc_db
+
+        ips = ["192.168.1.10", "10.0.0.99", "192.168.1.20"]
+        expected = smb_mgr.get_hosts_data(ips)
+
+        monkeypatch.setattr(nxc_db, "IN_CLAUSE_CHUNK_SIZE", 1)
+        assert smb_mgr.get_hosts_data(ips) == expected
+
+    @pytest.mark.parametrize(
+        "size, limit, padded",
+        [(1, 900, 1), (3, 900, 4), (8, 900, 8), (600, 900, 900), (5, 4, 5)],
+    )
+    def test_pad_in_list(self, size: int, limit: int, padded: int) -> None:
+        """Test IN lists are padded to a power of two by repeating the last item."""
+        from cerno_pkg.nxc_db import _pad_in_list
+
+        items = [f"10.0.0.{i}" for i in range(size)]
+        result = _pad_in_list(items, limit)
+
+        assert len(result) == padded
+        assert result[:size] == items
+        assert set(result[size:]) <= {items[-1]}
+
+    def test_generic_protocol_hosts(
+        self, temp_nxc_workspace: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test batched host lookup for generic protocols matches on ip or host."""
+        import cerno_pkg.nxc_db as nxc_db
+
+        conn = sqlite3.connect(temp_nxc_workspace / "winrm.db")
+        conn.executescript(_THROWAWAY_DB_PRAGMAS)
+        conn.executescript("""
+            BEGIN;
+            CREATE TABLE hosts (id INTEGER PRIMARY KEY, ip TEXT, host TEXT, hostname TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, domain TEXT, username TEXT, credtype TEXT);
+            CREATE TABLE admin_relations (id INTEGER PRIMARY KEY, userid INTEGER, hostid INTEGER);
+            CREATE TABLE loggedin_relations (id INTEGER PRIMARY KEY, userid INTEGER, hostid INTEGER);
+            INSERT INTO hosts VALUES (1, '10.0.0.1', NULL, 'APP01'), (2, NULL, '10.0.0.2', 'APP02'),
+                                     (3, '10.0.0.3', NULL, 'NOCREDS');
+            INSERT INTO users VALUES (1, 'CORP', 'ops', 'plaintext');
+            INSERT INTO admin_relations (userid, hostid) VALUES (1, 1);
+            INSERT INTO loggedin_relations (userid, hostid) VALUES (1, 2);
+            COMMIT;
+        """)
+        conn.close()
+        monkeypatch.setattr(nxc_db, "IN_CLAUSE_CHUNK_SIZE", 2)
+
+        data = NxcDatabaseManager(temp_nxc_workspace).get_hosts_data(
+            ["10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"]
+        )
+
+        assert set(data) == {"10.0.0.1", "10.0.0.2"}
+        assert data["10.0.0.1"].hostname == "APP01"
+        assert data["10.0.0.1"].credentials[0].has_admin is True
+        assert data["10.0.0.2"].credentials[0].has_admin is False
+
+    def test_generic_protocol_credentials_once_per_user(self, temp_nxc_workspace: Path) -> None:
+        """Test repeated relations for one user yield a single credential."""
+        conn = sqlite3.connect(temp_nxc_workspace / "mssql.db")
+        conn.executescript(_THROWAWAY_DB_PRAGMAS)
+        conn.executescript("""
+            BEGIN;
+            CREATE TABLE hosts (id INTEGER PRIMARY KEY, ip TEXT, host TEXT, hostname TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, domain TEXT, username TEXT, credtype TEXT);
+            CREATE TABLE admin_relations (id INTEGER PRIMARY KEY, userid INTEGER, hostid INTEGER);
+            CREATE TABLE loggedin_relations (id INTEGER PRIMARY KEY, userid INTEGER, hostid INTEGER);
+            INSERT INTO hosts VALUES (1, '10.0.0.1', NULL, 'SQL01');
+            INSERT INTO users VALUES (1, 'CORP', 'sa', 'plaintext'), (2, 'CORP', 'reader', 'plaintext');
+            INSERT INTO admin_relations (userid, hostid) VALUES (1, 1), (1, 1);
+            INSERT INTO loggedin_relations (userid, hostid) VALUES (1, 1), (2, 1), (2, 1);
+            COMMIT;
+        """)
+        conn.close()
+
+        data = NxcDatabaseManager(temp_nxc_workspace).get_hosts_data(["10.0.0.1"])
+
+        creds = [(c.username, c.has_admin) for c in data["10.0.0.1"].credentials]
+        assert creds == [("sa", True), ("reader", False)]
+
+    def test_generic_protocol_missing_credtype_is_plaintext(self, temp_nxc_workspace: Path) -> None:
+        """Test NULL and empty credtypes default to plaintext, as for SMB."""
+        conn = sqlite3.connect(temp_nxc_workspace / "ldap.db")
+        conn.executescript(_THROWAWAY_DB_PRAGMAS)
+        conn.executescript("""
+            BEGIN;
+            CREATE TABLE hosts (id INTEGER PRIMARY KEY, ip TEXT, host TEXT, hostname TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, domain TEXT, username TEXT, credtype TEXT);
+            CREATE TABLE admin_relations (id INTEGER PRIMARY KEY, userid INTEGER, hostid INTEGER);
+            CREATE TABLE loggedin_relations (id INTEGER PRIMARY KEY, userid INTEGER, hostid INTEGER);
+            INSERT INTO hosts VALUES (1, '10.0.0.1', NULL, 'DC01');
+            INSERT INTO users VALUES (1, 'CORP', 'empty', ''), (2, 'CORP', 'null', NULL),
+                                     (3, 'CORP', 'hashed', 'hash');
+            INSERT INTO loggedin_relations (userid, hostid) VALUES (1, 1), (2, 1), (3, 1);
+            COMMIT;
+        """)
+        conn.close()
+
+        data = NxcDatabaseManager(temp_nxc_workspace).get_hosts_data(["10.0.0.1"])
+
+        creds = [(c.username, c.credential_type) for c in data["10.0.0.1"].credentials]
+        assert creds == [("empty", "plaintext"), ("null", "plaintext"), ("hashed", "hash")]
+
+
 # =============================================================================
 # Integration Tests: Using Fixture DBs
 # =============================================================================
@@ -661,3 +830,25 @@ class TestModuleFunctions:
         result = get_nxc_manager()
         assert result is not None
         assert result.is_available() is True
+
+    def test_get_nxc_manager_reuses_singleton(
+        self, monkeypatch: pytest.MonkeyPatch, populated_smb_db: Path
+    ) -> None:
+        """Test repeated calls return the cached manager without reloading config."""
+        from cerno_pkg import config
+
+        fake_config = config.CernoConfig(
+            nxc_workspace_path=str(populated_smb_db.parent),
+            nxc_enrichment_enabled=True,
+        )
+        calls = []
+
+        def counting_load_config() -> config.CernoConfig:
+            calls.append(1)
+            return fake_config
+
+        monkeypatch.setattr(config, "load_config", counting_load_config)
+
+        first = get_nxc_manager()
+        assert get_nxc_manager() is first
+        assert len(calls) == 1
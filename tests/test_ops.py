@@ -1,7 +1,8 @@
 """Tests for cerno_pkg.ops module."""
 
-import tempfile
-from pathlib import Path
+import json
+import sys
+from types import SimpleNamespace
 
 import pytest
 
@@ -13,6 +14,7 @@ from cerno_pkg.ops import (
     log_artifact,
     log_artifacts_for_nmap,
 )
+from cerno_pkg.models import Finding, Plugin, Scan, ToolExecution, now_iso
 from cerno_pkg.tools import build_nmap_cmd
 
 
@@ -189,10 +191,8 @@ class TestLogToolExecution:
         assert row["tool_protocol"] == "smb"
 
     @pytest.mark.integration
-    def test_log_execution_with_session_link(self, temp_db):
+    def test_log_execution_with_session_link(self, temp_db, temp_dir):
         """Test logging execution linked to a session."""
-        from cerno_pkg.models import Scan
-
         # Create scan and session
         scan = Scan(scan_name="test_scan", export_root="/tmp/test")
         scan_id = scan.save(temp_db)
@@ -206,34 +206,31 @@ class TestLogToolExecution:
         temp_db.commit()
 
         # Create scan directory for linking
-        with tempfile.TemporaryDirectory() as tmpdir:
-            scan_dir = Path(tmpdir) / "test_scan"
-            scan_dir.mkdir()
-
-            metadata = ExecutionMetadata(
-                exit_code=0,
-                duration_seconds=5.0,
-                used_sudo=False
-            )
-
-            # Note: This won't actually link since scan_dir.name != scan_name in DB
-            # but tests the code path
-            execution_id = log_tool_execution(
-                tool_name="nmap",
-                command_text="nmap 192.168.1.1",
-                execution_metadata=metadata,
-                scan_dir=scan_dir,
-                conn=temp_db
-            )
-
-            assert execution_id is not None
+        scan_dir = temp_dir / "test_scan"
+        scan_dir.mkdir()
+
+        metadata = ExecutionMetadata(
+            exit_code=0,
+            duration_seconds=5.0,
+            used_sudo=False
+        )
+
+        # Note: This won't actually link since scan_dir.name != scan_name in DB
+        # but tests the code path
+        execution_id = log_tool_execution(
+            tool_name="nmap",
+            command_text="nmap 192.168.1.1",
+            execution_metadata=metadata,
+            scan_dir=scan_dir,
+            conn=temp_db
+        )
+
+        assert execution_id is not None
 
     @pytest.mark.integration
     @pytest.mark.skip(reason="file_path column not present, cannot link executions by path")
     def test_log_execution_with_file_link(self, temp_db, temp_dir):
         """Test logging execution linked to a plugin file."""
-        from cerno_pkg.models import Scan, Plugin, Finding
-
         # Create dependencies
         scan = Scan(scan_name="test_scan", export_root="/tmp/test")
         scan_id = scan.save(temp_db)
@@ -277,31 +274,33 @@ class TestLogToolExecution:
         assert row["finding_id"] is not None
 
 
+@pytest.fixture
+def nmap_execution_id(temp_db):
+    """Saved nmap ToolExecution to attach artifacts to."""
+    execution = ToolExecution(
+        tool_name="nmap",
+        command_text="nmap -oA scan 192.168.1.1",
+        executed_at=now_iso(),
+        exit_code=0,
+        duration_seconds=10.0
+    )
+    execution_id = execution.save(temp_db)
+    assert execution_id is not None
+    return execution_id
+
+
 class TestLogArtifact:
     """Tests for log_artifact function."""
 
-    def test_log_artifact_basic(self, temp_db, temp_dir):
+    def test_log_artifact_basic(self, temp_db, nmap_execution_id, temp_dir):
         """Test logging a basic artifact."""
-        from cerno_pkg.models import ToolExecution, now_iso
-
-        # Create tool execution first
-        execution = ToolExecution(
-            tool_name="nmap",
-            command_text="nmap -oA scan 192.168.1.1",
-            executed_at=now_iso(),
-            exit_code=0,
-            duration_seconds=10.0
-        )
-        exec_id = execution.save(temp_db)
-        assert exec_id is not None
-
         # Create artifact file
         artifact_file = temp_dir / "scan.xml"
         artifact_file.write_text("<nmaprun>test</nmaprun>")
 
         # Log artifact
         artifact_id = log_artifact(
-            execution_id=exec_id,
+            execution_id=nmap_execution_id,
             artifact_path=artifact_file,
             artifact_type="nmap_xml",
             conn=temp_db
@@ -317,34 +316,21 @@ class TestLogArtifact:
         )
         row = cursor.fetchone()
 
-        assert row["execution_id"] == exec_id
+        assert row["execution_id"] == nmap_execution_id
         assert row["artifact_type"] == "nmap_xml"
         assert row["file_size_bytes"] == len("<nmaprun>test</nmaprun>")
         assert row["file_hash"] is not None
         assert len(row["file_hash"]) == 64  # SHA256
 
-    def test_log_artifact_with_metadata(self, temp_db, temp_dir):
+    def test_log_artifact_with_metadata(self, temp_db, nmap_execution_id, temp_dir):
         """Test logging artifact with metadata."""
-        from cerno_pkg.models import ToolExecution, now_iso
-        import json
-
-        execution = ToolExecution(
-            tool_name="nmap",
-            command_text="nmap 192.168.1.1",
-            executed_at=now_iso(),
-            exit_code=0,
-            duration_seconds=10.0
-        )
-        exec_id = execution.save(temp_db)
-        assert exec_id is not None
-
         artifact_file = temp_dir / "scan.xml"
         artifact_file.write_text("test")
 
         metadata_dict = {"scan_type": "SYN", "hosts_up": 5}
 
         artifact_id = log_artifact(
-            execution_id=exec_id,
+            execution_id=nmap_execution_id,
             artifact_path=artifact_file,
             artifact_type="nmap_xml",
             metadata=metadata_dict,
@@ -362,25 +348,13 @@ class TestLogArtifact:
         stored_metadata = json.loads(row["metadata"]) if row["metadata"] else None
         assert stored_metadata == metadata_dict
 
-    def test_log_artifact_nonexistent_file(self, temp_db, temp_dir):
+    def test_log_artifact_nonexistent_file(self, temp_db, nmap_execution_id, temp_dir):
         """Test logging artifact for nonexistent file."""
-        from cerno_pkg.models import ToolExecution, now_iso
-
-        execution = ToolExecution(
-            tool_name="nmap",
-            command_text="nmap 192.168.1.1",
-            executed_at=now_iso(),
-            exit_code=0,
-            duration_seconds=10.0
-        )
-        exec_id = execution.save(temp_db)
-        assert exec_id is not None
-
         nonexistent = temp_dir / "nonexistent.xml"
 
         # Should still log but with None for size/hash
         artifact_id = log_artifact(
-            execution_id=exec_id,
+            execution_id=nmap_execution_id,
             artifact_path=nonexistent,
             artifact_type="nmap_xml",
             conn=temp_db
@@ -400,112 +374,96 @@ class TestLogArtifact:
 class TestLogArtifactsForNmap:
     """Tests for log_artifacts_for_nmap function."""
 
-    def test_log_nmap_artifacts_all_formats(self, temp_db, temp_dir):
+    def test_log_nmap_artifacts_all_formats(self, temp_db, nmap_execution_id, temp_dir):
         """Test logging all nmap output formats."""
-        from cerno_pkg.models import ToolExecution, now_iso
-
-        execution = ToolExecution(
-            tool_name="nmap",
-            command_text="nmap -oA scan 192.168.1.1",
-            executed_at=now_iso(),
-            exit_code=0,
-            duration_seconds=10.0
-        )
-        exec_id = execution.save(temp_db)
-        assert exec_id is not None
-
         # Create all three nmap output files
         oabase = temp_dir / "scan"
         (temp_dir / "scan.xml").write_text("<nmaprun/>")
         (temp_dir / "scan.nmap").write_text("Nmap scan")
         (temp_dir / "scan.gnmap").write_text("# Nmap scan")
 
-        artifact_ids = log_artifacts_for_nmap(exec_id, oabase, conn=temp_db)
+        artifact_ids = log_artifacts_for_nmap(nmap_execution_id, oabase, conn=temp_db)
 
         assert len(artifact_ids) == 3
 
         # Verify all artifacts in database using v_artifacts_with_types view
         cursor = temp_db.execute(
             "SELECT artifact_type FROM v_artifacts_with_types WHERE execution_id = ? ORDER BY artifact_type",
-            (exec_id,)
+            (nmap_execution_id,)
         )
         types = [row["artifact_type"] for row in cursor.fetchall()]
         assert types == ["nmap_gnmap", "nmap_nmap", "nmap_xml"]
 
-    def test_log_nmap_artifacts_partial(self, temp_db, temp_dir):
-        """Test logging when only some nmap files exist."""
-        from cerno_pkg.models import ToolExecution, now_iso
+    def test_log_nmap_artifacts_shares_one_connection(
+        self, temp_db, nmap_execution_id, temp_dir, monkeypatch
+    ):
+        """Test the default path opens one database connection for all formats."""
+        import cerno_pkg.database
 
-        execution = ToolExecution(
-            tool_name="nmap",
-            command_text="nmap -oX scan.xml 192.168.1.1",
-            executed_at=now_iso(),
-            exit_code=0,
-            duration_seconds=10.0
-        )
-        exec_id = execution.save(temp_db)
-        assert exec_id is not None
+        class UnclosableConnection:
+            """Delegate to temp_db but keep it open past db_transaction()."""
+            def __init__(self, conn):
+                self._conn = conn
+
+            def __getattr__(self, name):
+                if name == 'close':
+                    return lambda: None
+                return getattr(self._conn, name)
+
+        opened = []
+
+        def mock_get_connection(database_path=None):
+            opened.append(database_path)
+            return UnclosableConnection(temp_db)
 
+        monkeypatch.setattr(cerno_pkg.database, "get_connection", mock_get_connection)
+
+        oabase = temp_dir / "scan"
+        for ext in (".xml", ".nmap", ".gnmap"):
+            (temp_dir / f"scan{ext}").write_text("nmap output")
+
+        artifact_ids = log_artifacts_for_nmap(nmap_execution_id, oabase)
+
+        assert len(artifact_ids) == 3
+        assert len(opened) == 1
+
+    def test_log_nmap_artifacts_partial(self, temp_db, nmap_execution_id, temp_dir):
+        """Test logging when only some nmap files exist."""
         # Create only XML file
         oabase = temp_dir / "scan"
         (temp_dir / "scan.xml").write_text("<nmaprun/>")
 
-        artifact_ids = log_artifacts_for_nmap(exec_id, oabase, conn=temp_db)
+        artifact_ids = log_artifacts_for_nmap(nmap_execution_id, oabase, conn=temp_db)
 
         assert len(artifact_ids) == 1
 
         cursor = temp_db.execute(
             "SELECT artifact_type FROM v_artifacts_with_types WHERE execution_id = ?",
-            (exec_id,)
+            (nmap_execution_id,)
         )
         row = cursor.fetchone()
         assert row["artifact_type"] == "nmap_xml"
 
-    def test_log_nmap_artifacts_none_exist(self, temp_db, temp_dir):
+    def test_log_nmap_artifacts_none_exist(self, temp_db, nmap_execution_id, temp_dir):
         """Test logging when no nmap files exist."""
-        from cerno_pkg.models import ToolExecution, now_iso
-
-        execution = ToolExecution(
-            tool_name="nmap",
-            command_text="nmap 192.168.1.1",
-            executed_at=now_iso(),
-            exit_code=0,
-            duration_seconds=10.0
-        )
-        exec_id = execution.save(temp_db)
-        assert exec_id is not None
-
         oabase = temp_dir / "scan"
 
-        artifact_ids = log_artifacts_for_nmap(exec_id, oabase, conn=temp_db)
+        artifact_ids = log_artifacts_for_nmap(nmap_execution_id, oabase, conn=temp_db)
 
         assert len(artifact_ids) == 0
 
-    def test_log_nmap_artifacts_with_metadata(self, temp_db, temp_dir):
+    def test_log_nmap_artifacts_with_metadata(self, temp_db, nmap_execution_id, temp_dir):
         """Test logging nmap artifacts with metadata."""
-        from cerno_pkg.models import ToolExecution, now_iso
-
-        execution = ToolExecution(
-            tool_name="nmap",
-            command_text="nmap -oA scan 192.168.1.1",
-            executed_at=now_iso(),
-            exit_code=0,
-            duration_seconds=10.0
-        )
-        exec_id = execution.save(temp_db)
-        assert exec_id is not None
-
         oabase = temp_dir / "scan"
         (temp_dir / "scan.xml").write_text("<nmaprun/>")
 
         metadata_dict = {"scan_type": "version_detection"}
 
-        artifact_ids = log_artifacts_for_nmap(exec_id, oabase, metadata=metadata_dict, conn=temp_db)
+        artifact_ids = log_artifacts_for_nmap(nmap_execution_id, oabase, metadata=metadata_dict, conn=temp_db)
 
         assert len(artifact_ids) == 1
 
         # Verify metadata was stored
-        import json
         cursor = temp_db.execute(
             "SELECT metadata FROM artifacts WHERE artifact_id = ?",
             (artifact_ids[0],)
@@ -515,6 +473,40 @@ class TestLogArtifactsForNmap:
         assert stored_metadata == metadata_dict
 
 
+@pytest.fixture
+def fake_version_run(monkeypatch):
+    """Stub shutil.which and subprocess.run for get_tool_version().
+
+    Tests adjust the returned holder: ``result`` is what subprocess.run
+    returns (or raises, if it is an exception), ``on_path`` limits which
+    binaries shutil.which finds (None means all), and ``calls`` records
+    each argv passed to subprocess.run.
+    """
+    import shutil
+    import subprocess
+
+    holder = SimpleNamespace(
+        result=SimpleNamespace(returncode=0, stdout="", stderr=""),
+        on_path=None,
+        calls=[],
+    )
+
+    def fake_which(name):
+        if holder.on_path is None or name in holder.on_path:
+            return f"/usr/bin/{name}"
+        return None
+
+    def fake_run(argv, **kwargs):
+        holder.calls.append(argv)
+        if isinstance(holder.result, BaseException):
+            raise holder.result
+        return holder.result
+
+    monkeypatch.setattr(shutil, "which", fake_which)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return holder
+
+
 class TestCommandAvailability:
     """Tests for command availability checking functions."""
 
@@ -578,106 +570,82 @@ class TestCommandAvailability:
         if shutil.which("sudo"):
             assert result is True
 
-    def test_get_tool_version_available(self):
+    def test_get_tool_version_available(self, fake_version_run):
         """Test getting version from an available tool."""
         from cerno_pkg.ops import get_tool_version
-        from unittest.mock import Mock, patch
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "nmap version 7.92\n"
-        mock_result.stderr = ""
+        fake_version_run.result.stdout = "nmap version 7.92\n"
 
-        with patch('subprocess.run', return_value=mock_result) as mock_run:
-            with patch('shutil.which', return_value='/usr/bin/nmap'):
-                version = get_tool_version("nmap")
+        version = get_tool_version("nmap")
 
         assert version == "7.92"
-        mock_run.assert_called_once()
+        assert len(fake_version_run.calls) == 1
 
-    def test_get_tool_version_missing(self):
+    def test_get_tool_version_missing(self, fake_version_run):
         """Test getting version from a missing tool."""
         from cerno_pkg.ops import get_tool_version
-        from unittest.mock import patch
 
-        with patch('shutil.which', return_value=None):
-            version = get_tool_version("nonexistent_tool")
+        fake_version_run.on_path = set()
+
+        version = get_tool_version("nonexistent_tool")
 
         assert version is None
+        assert fake_version_run.calls == []
 
-    def test_get_tool_version_timeout(self):
+    def test_get_tool_version_timeout(self, fake_version_run):
         """Test handling timeout when getting version."""
         from cerno_pkg.ops import get_tool_version
-        from unittest.mock import patch
         import subprocess
 
-        with patch('shutil.which', return_value='/usr/bin/slow_tool'):
-            with patch('subprocess.run', side_effect=subprocess.TimeoutExpired('cmd', 5)):
-                version = get_tool_version("slow_tool")
+        fake_version_run.result = subprocess.TimeoutExpired('cmd', 5)
 
-        assert version is None
+        version = get_tool_version("slow_tool")
 
-    def test_get_tool_version_parsing_variations(self):
-        """Test version parsing with various output formats."""
-        from cerno_pkg.ops import get_tool_version
-        from unittest.mock import Mock, patch
+        assert version is None
 
-        test_cases = [
+    @pytest.mark.parametrize(
+        "output, expected_version",
+        [
             ("Nmap version 7.92", "7.92"),
             ("version 1.2.1", "1.2.1"),
             ("tool 2.3.4.5", "2.3.4"),  # Only captures first 3 parts
             ("Version: 10.11", "10.11"),
             ("v3.14", "3.14"),
-        ]
+        ],
+    )
+    def test_get_tool_version_parsing_variations(self, fake_version_run, output, expected_version):
+        """Test version parsing with various output formats."""
+        from cerno_pkg.ops import get_tool_version
 
-        for output, expected_version in test_cases:
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stdout = output
-            mock_result.stderr = ""
+        fake_version_run.result.stdout = output
 
-            with patch('subprocess.run', return_value=mock_result):
-                with patch('shutil.which', return_value='/usr/bin/tool'):
-                    version = get_tool_version("tool")
+        version = get_tool_version("tool")
 
-            assert version == expected_version, f"Failed to parse '{output}' as '{expected_version}'"
+        assert version == expected_version
 
-    def test_get_tool_version_candidates(self):
+    def test_get_tool_version_candidates(self, fake_version_run):
         """Test version detection with multiple binary name candidates."""
         from cerno_pkg.ops import get_tool_version
-        from unittest.mock import Mock, patch
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "netexec version 1.2.1\n"
-        mock_result.stderr = ""
+        # nxc is available, netexec is not
+        fake_version_run.on_path = {"nxc"}
+        fake_version_run.result.stdout = "netexec version 1.2.1\n"
 
-        def mock_which(cmd):
-            # nxc is available, netexec is not
-            return '/usr/bin/nxc' if cmd == 'nxc' else None
-
-        with patch('subprocess.run', return_value=mock_result) as mock_run:
-            with patch('shutil.which', side_effect=mock_which):
-                version = get_tool_version("netexec", ["nxc", "netexec"])
+        version = get_tool_version("netexec", ["nxc", "netexec"])
 
         assert version == "1.2.1"
         # Should have called subprocess with the first available candidate
-        mock_run.assert_called_once()
-        assert mock_run.call_args[0][0][0] == "nxc"
+        assert len(fake_version_run.calls) == 1
+        assert fake_version_run.calls[0][0] == "nxc"
 
-    def test_get_tool_version_stderr_output(self):
+    def test_get_tool_version_stderr_output(self, fake_version_run):
         """Test version parsing when version info is in stderr."""
         from cerno_pkg.ops import get_tool_version
-        from unittest.mock import Mock, patch
 
-        mock_result = Mock()
-        mock_result.returncode = 1  # Non-zero exit
-        mock_result.stdout = ""
-        mock_result.stderr = "tool version 4.5.6\n"
+        fake_version_run.result.returncode = 1  # Non-zero exit
+        fake_version_run.result.stderr = "tool version 4.5.6\n"
 
-        with patch('subprocess.run', return_value=mock_result):
-            with patch('shutil.which', return_value='/usr/bin/tool'):
-                version = get_tool_version("tool")
+        version = get_tool_version("tool")
 
         assert version == "4.5.6"
 
@@ -880,6 +848,71 @@ class TestBuildNmapCmd:
         assert "-p" not in cmd
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="stand-in msfconsole is a POSIX shell script")
+class TestMsfConsoleSession:
+    """Tests for the persistent msfconsole session."""
+
+    @staticmethod
+    def _fake_msfconsole(tmp_path):
+        """Write a stand-in msfconsole that echoes commands and counts starts."""
+        script = tmp_path / "msfconsole"
+        script.write_text(
+            "#!/bin/sh\n"
+            f"echo start >> {tmp_path / 'starts.log'}\n"
+            "while read -r line; do\n"
+            "  case \"$line\" in\n"
+            "    exit) exit 0 ;;\n"
+            "    echo\\ *) echo \"[*] exec: $line\"; echo \"${line#echo }\" ;;\n"
+            "    hang) sleep 30 ;;\n"
+            "    *) echo \"ran: $line\" ;;\n"
+            "  esac\n"
+            "done\n"
+        )
+        script.chmod(0o755)
+        return script
+
+    @pytest.mark.unit
+    def test_commands_share_one_process(self, tmp_path, capsys):
+        """Verify consecutive commands reuse one msfconsole process."""
+        from cerno_pkg.ops import MsfConsoleSession
+        script = self._fake_msfconsole(tmp_path)
+
+        with MsfConsoleSession(executable=str(script)) as msf:
+            msf.run("search ms17_010")
+            msf.run("info exploit/windows/smb/ms17_010_eternalblue")
+            assert msf.is_running
+
+        out = capsys.readouterr().out
+        assert "ran: search ms17_010" in out
+        assert "ran: info exploit/windows/smb/ms17_010_eternalblue" in out
+        assert "CERNO_MSF_DONE" not in out
+        assert (tmp_path / "starts.log").read_text().count("start") == 1
+
+    @pytest.mark.unit
+    def test_early_exit_raises(self, tmp_path):
+        """Verify msfconsole exiting mid-command raises CalledProcessError."""
+        import subprocess
+        from cerno_pkg.ops import MsfConsoleSession
+        script = self._fake_msfconsole(tmp_path)
+
+        msf = MsfConsoleSession(executable=str(script))
+        with pytest.raises(subprocess.CalledProcessError):
+            msf.run("exit")
+        assert not msf.is_running
+
+    @pytest.mark.unit
+    def test_stalled_command_times_out(self, tmp_path):
+        """Verify a stalled command is killed after the session timeout."""
+        import subprocess
+        from cerno_pkg.ops import MsfConsoleSession
+        script = self._fake_msfconsole(tmp_path)
+
+        msf = MsfConsoleSession(executable=str(script), timeout=0.5)
+        with pytest.raises(subprocess.TimeoutExpired):
+            msf.run("hang")
+        assert not msf.is_running
+
+
 class TestRunCommandWithProgressProxy:
     """Tests for proxy wrapping in run_command_with_progress."""
 
@@ -0,0 +1,377 @@
+"""Tests for cerno_pkg.tools module."""
+
+import pytest
+
+
+class TestCopyToClipboard:
+    """Tests for copy_to_clipboard OS-tool fallback."""
+
+    @pytest.mark.unit
+    def test_fallback_tool_failure_reports_stderr(self, monkeypatch):
+        """Verify the fallback tool's stderr is surfaced and stdout is not piped."""
+        import subprocess
+        from cerno_pkg import tools
+
+        calls = []
+
+        def _fake_run(args, **kwargs):
+            calls.append(kwargs)
+            raise subprocess.CalledProcessError(1, args, stderr=b"Can't open display\n")
+
+        monkeypatch.setattr(tools, "_pyperclip_probed", True)
+        monkeypatch.setattr(tools, "_PYPERCLIP_BACKEND", None)
+        monkeypatch.setattr(tools.shutil, "which", lambda name: f"/usr/bin/{name}" if name == "xclip" else None)
+        monkeypatch.setattr(tools.subprocess, "run", _fake_run)
+
+        success, msg = tools.copy_to_clipboard("nmap -A")
+
+        assert success is False
+        assert "exit 1" in msg
+        assert "Can't open display" in msg
+        assert calls[0]["stdout"] is subprocess.DEVNULL
+        assert calls[0]["stderr"] is subprocess.PIPE
+
+    @pytest.mark.unit
+    def test_pyperclip_backend_probed_once(self, monkeypatch):
+        """Verify an unavailable pyperclip backend is detected once and then skipped."""
+        from cerno_pkg import tools
+
+        probes = []
+
+        class _Unavailable:
+            def __call__(self, *args, **kwargs):
+                raise AssertionError("unavailable backend must not be called")
+
+            def __bool__(self):
+                return False
+
+        def _determine():
+            probes.append(1)
+            return _Unavailable(), _Unavailable()
+
+        monkeypatch.setattr(tools, "_pyperclip_probed", False)
+        monkeypatch.setattr(tools, "_PYPERCLIP_BACKEND", None)
+        monkeypatch.setattr(tools.pyperclip, "determine_clipboard", _determine)
+        monkeypatch.setattr(tools.shutil, "which", lambda name: None)
+
+        assert tools.copy_to_clipboard("a")[0] is False
+        assert tools.copy_to_clipboard("b")[0] is False
+        assert len(probes) == 1
+
+    @pytest.mark.unit
+    def test_pyperclip_backend_used_when_available(self, monkeypatch):
+        """Verify an available pyperclip backend is used directly."""
+        from cerno_pkg import tools
+
+        copied = []
+        monkeypatch.setattr(tools, "_pyperclip_probed", True)
+        monkeypatch.setattr(tools, "_PYPERCLIP_BACKEND", copied.append)
+
+        assert tools.copy_to_clipboard("nmap -A") == (True, "Copied using pyperclip.")
+        assert copied == ["nmap -A"]
+
+
+class TestConfigureNmapOptions:
+    """Tests for the consolidated nmap configuration screen."""
+
+    @pytest.mark.unit
+    def test_plain_summary_when_not_a_terminal(self, monkeypatch, capsys):
+        """Verify a plain-text summary (no Panel borders) is printed without a TTY."""
+        from cerno_pkg import tools
+        from cerno_pkg.config import CernoConfig
+        from cerno_pkg.constants import NSE_PROFILES
+
+        profile_name = NSE_PROFILES[0][0]
+        monkeypatch.setattr(type(tools._console), "is_terminal", property(lambda self: False))
+        monkeypatch.setattr(tools.Prompt, "ask", lambda *a, **kw: "b")
+
+        result = tools.configure_nmap_options(CernoConfig(nmap_default_profile=profile_name))
+
+        out = capsys.readouterr().out
+        assert result is None
+        assert f"NSE Profile: {profile_name}" in out
+        assert "╭" not in out
+
+
+class TestCountLines:
+    """Tests for the work-file line counter."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("content,expected", [
+        (b"", 0),
+        (b"10.0.0.1\n", 1),
+        (b"10.0.0.1\n10.0.0.2\n", 2),
+        (b"10.0.0.1\n10.0.0.2", 2),
+    ])
+    def test_matches_line_iteration(self, tmp_path, content, expected):
+        """Verify the byte-count line total matches text line iteration."""
+        from cerno_pkg.tools import _count_lines
+        path = tmp_path / "tcp_ips.list"
+        path.write_bytes(content)
+        with open(path) as f:
+            assert sum(1 for _ in f) == expected
+        assert _count_lines(path) == expected
+
+
+class TestWalkFiles:
+    """Tests for the results-directory file walker."""
+
+    @pytest.mark.unit
+    def test_yields_nested_files_only(self, tmp_path):
+        """Verify nested files are yielded and directories are not."""
+        from cerno_pkg.tools import _walk_files
+        (tmp_path / "a.xml").write_text("x")
+        nested = tmp_path / "sub" / "deeper"
+        nested.mkdir(parents=True)
+        (nested / "b.nmap").write_text("yy")
+
+        names = sorted(entry.name for entry in _walk_files(tmp_path))
+
+        assert names == ["a.xml", "b.nmap"]
+        assert sum(entry.stat().st_size for entry in _walk_files(tmp_path)) == 3
+
+
+class TestMsfconsoleCommands:
+    """Tests for msfconsole search command builders."""
+
+    @pytest.mark.unit
+    def test_batch_command_runs_all_searches_once(self):
+        """Verify every search runs in one msfconsole script."""
+        from cerno_pkg.tools import _build_msfconsole_batch_command
+        cmd = _build_msfconsole_batch_command(["ms17_010", "CVE-2017-0144"])
+        assert cmd == "msfconsole -q -x 'search ms17_010; search CVE-2017-0144; exit'"
+
+    @pytest.mark.unit
+    def test_batch_command_switches_quotes_for_apostrophes(self):
+        """Verify terms containing apostrophes switch to double quotes."""
+        from cerno_pkg.tools import _build_msfconsole_batch_command
+        cmd = _build_msfconsole_batch_command(["o'reilly", "CVE-2020-1"])
+        assert cmd == 'msfconsole -q -x "search o\'reilly; search CVE-2020-1; exit"'
+
+
+class TestRunInMsfSession:
+    """Tests for running menu commands in the shared msfconsole session."""
+
+    @pytest.mark.unit
+    def test_missing_executable_reported_not_raised(self, tmp_path, monkeypatch):
+        """Verify a missing msfconsole is reported instead of raised."""
+        from cerno_pkg import tools
+        from cerno_pkg.ops import MsfConsoleSession
+        monkeypatch.setattr(tools.Confirm, "ask", lambda *a, **k: True)
+
+        msf = MsfConsoleSession(executable=str(tmp_path / "no-msfconsole"))
+        assert tools._run_in_msf_session(msf, "search ms17_010") is False
+
+
+class TestDirectArgv:
+    """Tests for shell-free execution of plain command strings."""
+
+    @pytest.mark.unit
+    def test_plain_command_split_for_direct_exec(self, monkeypatch):
+        """Verify plain commands are split for shell-free execution."""
+        from cerno_pkg import tools
+        monkeypatch.setattr(tools.shutil, "which", lambda name: f"/usr/bin/{name}")
+        assert tools._direct_argv("httpx -l /tmp/ips.list -silent") == [
+            "httpx", "-l", "/tmp/ips.list", "-silent"
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cmd", [
+        "cat ips | httpx",
+        "nuclei -l x > out.txt",
+        "echo $HOME",
+        "ls *.xml",
+        "sh -c 'echo hi'",
+        "cd ~/scans",
+        "FOO=bar nuclei -l x",
+        "",
+    ])
+    def test_shell_features_require_shell(self, monkeypatch, cmd):
+        """Verify commands using shell syntax are left to the shell."""
+        from cerno_pkg import tools
+        monkeypatch.setattr(tools.shutil, "which", lambda name: f"/usr/bin/{name}")
+        assert tools._direct_argv(cmd) is None
+
+    @pytest.mark.unit
+    def test_unknown_program_left_to_shell(self, monkeypatch):
+        """Verify programs not on PATH are left to the shell."""
+        from cerno_pkg import tools
+        monkeypatch.setattr(tools.shutil, "which", lambda name: None)
+        assert tools._direct_argv("notatool -x") is None
+
+
+@pytest.fixture
+def workspace_cache():
+    """Start and finish each test with no cached workspaces on disk."""
+    from cerno_pkg import tools
+    tools._remove_cached_workspaces()
+    yield tools
+    tools._remove_cached_workspaces()
+
+
+class TestPrepareWorkspace:
+    """Tests for workspace reuse across tool workflow entries."""
+
+    @pytest.mark.unit
+    def test_same_hosts_reuse_workspace(self, workspace_cache):
+        """Verify identical hosts and ports reuse one workspace."""
+        tools = workspace_cache
+
+        first = tools._prepare_workspace(("10.0.0.1", "10.0.0.2"), "80,443")
+        second = tools._prepare_workspace(("10.0.0.1", "10.0.0.2"), "80,443")
+        other = tools._prepare_workspace(("10.0.0.3",), "")
+
+        assert first == second
+        assert other[0] != first[0]
+        assert first[1].read_text() == "10.0.0.1\n10.0.0.2\n"
+
+    @pytest.mark.unit
+    def test_removed_files_are_rewritten(self, workspace_cache):
+        """Verify a reused workspace rewrites files removed from disk."""
+        import shutil
+        tools = workspace_cache
+
+        workdir, tcp_ips, _udp_ips, tcp_sockets = tools._prepare_workspace(("10.0.0.9",), "22")
+        shutil.rmtree(workdir)
+        again = tools._prepare_workspace(("10.0.0.9",), "22")
+
+        assert again[0] == workdir
+        assert tcp_ips.read_text() == "10.0.0.9\n"
+        assert tcp_sockets.read_text() == "10.0.0.9:22\n"
+
+    @pytest.mark.unit
+    def test_modified_files_are_rewritten(self, workspace_cache):
+        """Verify a reused workspace restores files whose contents changed."""
+        tools = workspace_cache
+
+        _workdir, tcp_ips, udp_ips, _tcp_sockets = tools._prepare_workspace(("10.0.0.9",), "")
+        udp_ips.write_text("10.9.9.9\n")
+        tools._prepare_workspace(("10.0.0.9",), "")
+
+        assert tcp_ips.read_text() == udp_ips.read_text() == "10.0.0.9\n"
+
+    @pytest.mark.unit
+    def test_evicted_workspace_is_deleted(self, workspace_cache, monkeypatch):
+        """Verify the least recently used workspace is removed on eviction."""
+        tools = workspace_cache
+        monkeypatch.setattr(tools, "_WORKSPACE_CACHE_SIZE", 1)
+
+        first = tools._prepare_workspace(("10.0.0.1",), "")
+        second = tools._prepare_workspace(("10.0.0.2",), "")
+
+        assert not first[0].exists()
+        assert second[0].exists()
+
+    @pytest.mark.unit
+    def test_cleanup_removes_all_workspaces(self, workspace_cache):
+        """Verify the exit cleanup deletes every cached workspace."""
+        tools = workspace_cache
+
+        workdirs = [tools._prepare_workspace((host,), "")[0] for host in ("10.0.0.1", "10.0.0.2")]
+        tools._remove_cached_workspaces()
+
+        assert not any(workdir.exists() for workdir in workdirs)
+        assert not tools._workspace_cache
+
+
+class TestRenderPlaceholders:
+    """Tests for custom command placeholder substitution."""
+
+    @pytest.mark.unit
+    def test_replaces_all_placeholders(self):
+        """Verify every placeholder occurrence is substituted."""
+        from cerno_pkg.tools import render_placeholders
+        mapping = {"{TCP_IPS}": "/w/tcp_ips.list", "{PORTS}": "80,443", "{OABASE}": "/r/run"}
+        rendered = render_placeholders(
+            "nmap -iL {TCP_IPS} -p {PORTS} -oA {OABASE} && cat {TCP_IPS}", mapping
+        )
+        assert rendered == "nmap -iL /w/tcp_ips.list -p 80,443 -oA /r/run && cat /w/tcp_ips.list"
+
+    @pytest.mark.unit
+    def test_values_are_not_re_expanded(self):
+        """Verify substituted values are not scanned for placeholders again."""
+        from cerno_pkg.tools import render_placeholders
+        mapping = {"{WORKDIR}": "/tmp/{PORTS}", "{PORTS}": "22"}
+        assert render_placeholders("{WORKDIR} {PORTS}", mapping) == "/tmp/{PORTS} 22"
+
+    @pytest.mark.unit
+    def test_unknown_braces_left_untouched(self):
+        """Verify braces that are not placeholders are kept."""
+        from cerno_pkg.tools import render_placeholders
+        assert render_placeholders("xargs -I{} echo {}", {"{PORTS}": "22"}) == "xargs -I{} echo {}"
+
+
+class TestCommandReviewMenu:
+    """Tests for the command review screen."""
+
+    @pytest.mark.unit
+    def test_command_with_brackets_printed_verbatim(self, monkeypatch, capsys):
+        """Verify bracketed command text is not consumed as Rich markup."""
+        from cerno_pkg import tools
+
+        monkeypatch.setattr(tools.Prompt, "ask", lambda *a, **kw: "b")
+
+        action = tools.command_review_menu("echo [bold]x[/bold] {TCP_IPS}")
+
+        out = capsys.readouterr().out
+        assert action == "cancel"
+        assert "echo [bold]x[/bold] {TCP_IPS}" in out
+
+
+class TestNseScriptsFromCmd:
+    """Tests for NSE script extraction shown on the review screen."""
+
+    @pytest.mark.unit
+    def test_wildcard_profile_scripts_unquoted(self, tmp_path):
+        """Verify scripts with shell metacharacters are not shell-quoted."""
+        from cerno_pkg.constants import NSE_PROFILES
+        from cerno_pkg.tools import _nse_scripts_from_cmd, build_nmap_cmd
+
+        snmp_scripts = next(scripts for name, _, scripts, _ in NSE_PROFILES if name == "SNMP")
+        scripts = [*snmp_scripts, "ssl-cert"]
+        cmd = build_nmap_cmd(
+            True, f"--script={','.join(scripts)}", tmp_path / "ips", "161", False, tmp_path / "out"
+        )
+
+        assert _nse_scripts_from_cmd(cmd) == ["snmp*", "ssl-cert"]
+
+    @pytest.mark.unit
+    def test_no_script_option(self):
+        """Verify commands without --script yield None."""
+        from cerno_pkg.tools import _nse_scripts_from_cmd
+        assert _nse_scripts_from_cmd(["nmap", "-A", "-p", "80"]) is None
+
+
+class TestBuildExecutionSummary:
+    """Tests for the post-execution summary panel content."""
+
+    @pytest.mark.unit
+    def test_nothing_to_report_skips_panel(self, tmp_path):
+        """Verify no summary is built without run metadata or generated files."""
+        from cerno_pkg.tools import _build_execution_summary
+        assert _build_execution_summary(None, tmp_path) is None
+
+    @pytest.mark.unit
+    def test_generated_files_without_metadata(self, tmp_path):
+        """Verify generated files alone produce a summary."""
+        from cerno_pkg.tools import _build_execution_summary
+        (tmp_path / "run.xml").write_text("x")
+
+        summary = _build_execution_summary(None, tmp_path)
+
+        assert summary is not None
+        assert "Files generated: 1" in summary.plain
+        assert "Exit code" not in summary.plain
+
+    @pytest.mark.unit
+    def test_metadata_reported(self, tmp_path):
+        """Verify duration and exit code come from the run metadata."""
+        from cerno_pkg.ops import ExecutionMetadata
+        from cerno_pkg.tools import _build_execution_summary
+
+        summary = _build_execution_summary(
+            ExecutionMetadata(exit_code=2, duration_seconds=75.0, used_sudo=False), tmp_path
+        )
+
+        assert "Duration: 1m 15s" in summary.plain
+        assert "Exit code: 2 (error)" in summary.plain
@@ -6,8 +6,8 @@ from pathlib import Path
 from cerno_pkg.workflow_mapper import WorkflowMapper
 
 
-@pytest.fixture
-def sample_workflow_yaml(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def sample_workflow_yaml(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a sample workflow YAML with comma-separated plugin IDs."""
     yaml_content = """version: "1.0"
 
@@ -45,34 +45,36 @@ workflows:
     references:
       - "https://example.com/3"
 """
-    yaml_file = tmp_path / "test_workflows.yaml"
+    yaml_file = tmp_path_factory.mktemp("workflows") / "test_workflows.yaml"
     yaml_file.write_text(yaml_content)
     return yaml_file
 
 
+@pytest.fixture(scope="session")
+def sample_mapper(sample_workflow_yaml: Path) -> WorkflowMapper:
+    """Parse the sample workflow YAML once; tests only read from the sample_mapper."""
+    return WorkflowMapper(sample_workflow_yaml)
+
+
 class TestWorkflowMapper:
     """Tests for WorkflowMapper class."""
 
-    def test_count_with_comma_separated_plugin_ids(self, sample_workflow_yaml: Path):
+    def test_count_with_comma_separated_plugin_ids(self, sample_mapper: WorkflowMapper):
         """Test that count() returns distinct workflows, not plugin ID entries."""
-        mapper = WorkflowMapper(sample_workflow_yaml)
-
         # Should count 3 distinct workflows, not 6 plugin ID entries
         # Workflow 1: plugin_id "12345" (1 entry)
         # Workflow 2: plugin_id "67890,11111,22222" (3 entries)
         # Workflow 3: plugin_id "33333" (1 entry)
         # Total distinct workflows: 3
         # Total dictionary entries: 5
-        assert mapper.count() == 3, "count() should return 3 distinct workflows"
+        assert sample_mapper.count() == 3, "count() should return 3 distinct workflows"
 
-    def test_plugin_id_lookup_with_comma_separated(self, sample_workflow_yaml: Path):
+    def test_plugin_id_lookup_with_comma_separated(self, sample_mapper: WorkflowMapper):
         """Test that each plugin ID in comma-separated list can be looked up."""
-        mapper = WorkflowMapper(sample_workflow_yaml)
-
         # All three IDs from comma-separated list should map to same workflow
-        workflow_67890 = mapper.get_workflow("67890")
-        workflow_11111 = mapper.get_workflow("11111")
-        workflow_22222 = mapper.get_workflow("22222")
+        workflow_67890 = sample_mapper.get_workflow("67890")
+        workflow_11111 = sample_mapper.get_workflow("11111")
+        workflow_22222 = sample_mapper.get_workflow("22222")
 
         assert workflow_67890 is not None
         assert workflow_11111 is not None
@@ -83,11 +85,9 @@ class TestWorkflowMapper:
         assert workflow_11111.workflow_name == "Test Workflow 2"
         assert workflow_22222.workflow_name == "Test Workflow 2"
 
-    def test_get_all_workflows_deduplication(self, sample_workflow_yaml: Path):
+    def test_get_all_workflows_deduplication(self, sample_mapper: WorkflowMapper):
         """Test that get_all_workflows() returns deduplicated list."""
-        mapper = WorkflowMapper(sample_workflow_yaml)
-
-        all_workflows = mapper.get_all_workflows()
+        all_workflows = sample_mapper.get_all_workflows()
 
         # Should return 3 distinct workflows
         assert len(all_workflows) == 3
@@ -100,8 +100,6 @@ class TestWorkflowMapper:
             "Test Workflow 3"
         }
 
-    def test_count_matches_get_all_workflows_length(self, sample_workflow_yaml: Path):
+    def test_count_matches_get_all_workflows_length(self, sample_mapper: WorkflowMapper):
         """Test that count() matches len(get_all_workflows())."""
-        mapper = WorkflowMapper(sample_workflow_yaml)
-
-        assert mapper.count() == len(mapper.get_all_workflows())
+        assert sample_mapper.count() == len(sample_mapper.get_all_workflows())